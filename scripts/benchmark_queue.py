@@ -0,0 +1,75 @@
+# Benchmark of the IndexedQueue against the plain list queue, for queue operations used by the bot.
+# This script should be ran from project root (python scripts/benchmark_queue.py)
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from assets.music.indexedqueue import IndexedQueue
+
+QUEUE_SIZE = 10000
+OPERATIONS = 2000
+
+class FakeTrack:
+    """Minimal track, with the attributes used by the queue."""
+    __slots__ = ('duration', 'is_stream')
+
+    def __init__(self):
+        self.duration = random.randint(60000, 600000)
+        self.is_stream = random.random() < 0.01
+
+def list_jump(queue, index):
+    queue[:] = queue[index:] + queue[:index]
+
+def list_total(queue):
+    return sum(t.duration for t in queue if not t.is_stream)
+
+def list_starts_in(queue, index):
+    return sum(t.duration for t in queue[:index] if not t.is_stream)
+
+def list_move(queue, source, destination):
+    queue.insert(destination, queue.pop(source))
+
+def benchmark(operation, queue):
+    random.seed(0)
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        operation(queue)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e6 / OPERATIONS
+
+def main():
+    tracks = [FakeTrack() for _ in range(QUEUE_SIZE)]
+    size = QUEUE_SIZE
+
+    cases = [
+        ('jump (loop queue)',
+            lambda q: list_jump(q, random.randrange(size)),
+            lambda q: q.rotate(random.randrange(size))),
+        ('remove + append',
+            lambda q: q.append(q.pop(random.randrange(size))),
+            lambda q: q.append(q.pop(random.randrange(size)))),
+        ('move',
+            lambda q: list_move(q, random.randrange(size), random.randrange(size)),
+            lambda q: q.move(random.randrange(size), random.randrange(size))),
+        ('total queue time',
+            lambda q: list_total(q),
+            lambda q: q.total_duration),
+        ('starts in (ETA)',
+            lambda q: list_starts_in(q, random.randrange(size)),
+            lambda q: q.starts_in(random.randrange(size))),
+        ('page of 10 tracks',
+            lambda q: q[(start := random.randrange(size)):start + 10],
+            lambda q: q[(start := random.randrange(size)):start + 10]),
+    ]
+
+    print(f'Queue of {QUEUE_SIZE} tracks, {OPERATIONS} operations each (microseconds per operation)\n')
+    print(f'{"operation":<20}{"list":>12}{"IndexedQueue":>16}{"speedup":>10}')
+    for name, list_operation, indexed_operation in cases:
+        list_time = benchmark(list_operation, list(tracks))
+        indexed_time = benchmark(indexed_operation, IndexedQueue(tracks))
+        print(f'{name:<20}{list_time:>12.2f}{indexed_time:>16.2f}{list_time / indexed_time:>9.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Benchmark of re-rendering the music message queue list and a queue embed page after a single queue change,
+# with the previous per-call rendering and with the cached render layer (assets/music/render.py).
+# This script should be ran from project root (python scripts/benchmark_render.py)
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import lavalink
+from assets.music.vibeplayer import TrackQueue
+from assets.music.render import music_queue_list, queue_page
+
+QUEUE_SIZE = 5000
+RENDERS = 1000
+
+def build_queue():
+    tracks = []
+    for i in range(QUEUE_SIZE):
+        info = {
+            'identifier': f'{i:011d}', 'isSeekable': True, 'author': f'Artist {i % 500}', 'length': random.randint(60000, 4000000),
+            'isStream': False, 'position': 0, 'title': f'Song title number {i}', 'uri': f'https://youtu.be/{i:011d}',
+            'sourceName': 'youtube', 'artworkUrl': None, 'isrc': None,
+        }
+        _, encoded = lavalink.encode_track(info)
+        tracks.append(lavalink.AudioTrack({'encoded': encoded, 'info': info}, 123456789012345678))
+    return TrackQueue(tracks)
+
+def duration_str(ms):
+    return (
+        f'{str(ms // 3600000).zfill(2)}:{(ms % 3600000) // 60000:02d}:{(ms % 60000) // 1000:02d}'
+        if ms >= 3600000 else
+        f'{str(ms // 60000).zfill(2)}:{ms % 60000 // 1000:02d}'
+    )
+
+def render_previous(queue):
+    """Previous rendering: walks the whole queue to sum its time and formats every shown line on each call."""
+    # Music message
+    queue_size = len(queue)
+    queue_time = 0
+    queue_list = '__**Queue list:**__\n'
+    if queue_size > 15:
+        queue_list += f'\nAnd **{queue_size-15}** more...'
+    for i, item in enumerate(list(queue)[::-1]):
+        position = queue_size-i
+        if not item.is_stream:
+            queue_time += item.duration
+        if position > 15:
+            continue
+        track_duration_str = 'LIVE' if item.is_stream else duration_str(item.duration)
+        queue_list += f'\n**{position}.** {item.author} - {item.title} - `{track_duration_str}`'
+
+    # First queue embed page
+    page_time = sum(t.duration for t in queue if not t.is_stream)
+    description = ''
+    for i, track in enumerate(queue[:10]):
+        track_duration_str = 'LIVE' if track.is_stream else duration_str(track.duration)
+        description += f'**[{i+1}]** `-` [{track.author} - {track.title}]({track.uri}) - `{track_duration_str}`\n'
+    return queue_list, duration_str(queue_time), description, duration_str(page_time)
+
+def render_cached(queue):
+    """Cached rendering: cached track lines, and queue time from the queue aggregate."""
+    queue_time = duration_str(queue.total_duration)
+    return music_queue_list(queue), queue_time, queue_page(queue[:10], 1), queue_time
+
+def benchmark(render, queue):
+    random.seed(0)
+    render(queue)
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        # Single queue change (move a track into the shown tracks), then re-render
+        queue.move(random.randrange(QUEUE_SIZE), random.randrange(15))
+        render(queue)
+    return (time.perf_counter() - start) * 1e6 / RENDERS
+
+def main():
+    queue = build_queue()
+    assert render_previous(queue)[0] == render_cached(queue)[0]
+    previous = benchmark(render_previous, queue)
+    cached = benchmark(render_cached, queue)
+    print(f'Queue of {QUEUE_SIZE} tracks, {RENDERS} single changes each followed by a re-render\n')
+    print(f'previous rendering: {previous:>10.1f} us per re-render')
+    print(f'cached rendering:   {cached:>10.1f} us per re-render ({previous / cached:.0f}x faster)')
+
+if __name__ == '__main__':
+    main()
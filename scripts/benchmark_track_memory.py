@@ -0,0 +1,75 @@
+# Measures the memory per queued track, for full AudioTracks (lists) and compact QueuedTracks (TrackQueue).
+# This script should be ran from project root (python scripts/benchmark_track_memory.py)
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import lavalink
+from assets.music.vibeplayer import TrackQueue
+
+TRACKS = 5000
+GUILDS = 10
+
+def lavalink_response(start: int, amount: int):
+    """JSON response of Lavalink for a playlist, like the one returned by /loadtracks."""
+    tracks = []
+    for i in range(start, start + amount):
+        info = {
+            'identifier': f'{i:022d}',
+            'isSeekable': True,
+            'author': f'Artist {i % 500}',
+            'length': 180000 + i,
+            'isStream': False,
+            'position': 0,
+            'title': f'Song title number {i}',
+            'uri': f'https://open.spotify.com/track/{i:022d}',
+            'sourceName': 'spotify',
+            'artworkUrl': f'https://i.scdn.co/image/ab67616d0000b273{i:024d}',
+            'isrc': f'USRC1{i:07d}',
+        }
+        _, encoded = lavalink.encode_track(info)
+        tracks.append({'encoded': encoded, 'info': info, 'pluginInfo': {}, 'userData': {}})
+    return json.dumps({'loadType': 'playlist', 'data': {'tracks': tracks}})
+
+def measure(build, responses):
+    """Returns the memory (bytes) retained by the queues built from the responses."""
+    gc.collect()
+    tracemalloc.start()
+    queues = [build(json.loads(response)['data']['tracks']) for response in responses]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del queues
+    return size
+
+# Stands for the discord.Member kept as requester by full AudioTracks
+MEMBER = object()
+
+def build_list(raw_tracks):
+    tracks = []
+    for raw in raw_tracks:
+        track = lavalink.AudioTrack(raw, 0)
+        track.extra['requester'] = MEMBER
+        tracks.append(track)
+    return tracks
+
+def build_compact(raw_tracks):
+    return TrackQueue(lavalink.AudioTrack(raw, 123456789012345678) for raw in raw_tracks)
+
+def main():
+    # Same playlist queued in every guild, and distinct tracks in every guild
+    shared = [lavalink_response(0, TRACKS)] * GUILDS
+    distinct = [lavalink_response(i * TRACKS, TRACKS) for i in range(GUILDS)]
+
+    print(f'{GUILDS} guilds with {TRACKS} queued tracks each (bytes per queued track)\n')
+    print(f'{"scenario":<20}{"AudioTrack list":>18}{"TrackQueue":>14}{"saved":>10}')
+    for name, responses in (('same playlist', shared), ('distinct tracks', distinct)):
+        before = measure(build_list, responses) / (TRACKS * GUILDS)
+        after = measure(build_compact, responses) / (TRACKS * GUILDS)
+        print(f'{name:<20}{before:>18.0f}{after:>14.0f}{1 - after / before:>9.0%}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+import time
+import discord
+from typing import Dict, List, Optional
+
+# Failure classes of guild music text channels
+CHANNEL_MISSING = 'channel_missing'         # Music text channel was deleted
+WEBHOOK_MISSING = 'webhook_missing'         # Music text channel webhook was deleted
+MESSAGE_MISSING = 'message_missing'         # Music message was deleted
+MISSING_PERMISSIONS = 'missing_permissions' # Missing permissions (eg. `manage_webhooks`) in music text channel
+
+class GuildHealthEntry:
+    """Health state of a broken guild."""
+    __slots__ = ('failure', 'failures', 'since', 'retry_at', 'repairing', 'repair_attempted')
+
+    def __init__(self, failure: str):
+        # Last failure class and number of consecutive failures
+        self.failure = failure
+        self.failures = 0
+
+        # When the guild broke (wall clock), and when the next background attempt is allowed (monotonic)
+        self.since = time.time()
+        self.retry_at = 0.0
+
+        # Whether a repair is running, and whether a repair was already attempted in the current backoff window
+        self.repairing = False
+        self.repair_attempted = False
+
+class GuildHealth:
+    """
+    Negative cache of guilds whose music text channel is broken (deleted channel, webhook or music message, or
+    missing permissions), so that failing requests are not repeated on every player event.
+
+    - A broken guild records its failure class, and background edits are skipped until an exponential backoff expires
+      (`base` seconds after the first failure, doubling up to `max_backoff`). Each failed attempt extends the backoff.
+    - A single repair is allowed on the next user interaction, and then once per backoff window.
+    - Any successful attempt marks the guild as healthy again.
+
+    NOTE: Only permanent failures are recorded (see `classify()`). Transient failures (eg. Discord server errors) are not.
+    """
+    def __init__(self, base: float = 60, max_backoff: float = 6 * 3600):
+        self.base = base
+        self.max_backoff = max_backoff
+
+        # Broken guilds: {guild_id: GuildHealthEntry}
+        self.entries: Dict[int, GuildHealthEntry] = {}
+
+    @staticmethod
+    def classify(error: Exception) -> Optional[str]:
+        """Returns the failure class of an error from a music text channel request, or None if it is transient."""
+        if isinstance(error, discord.Forbidden):
+            return MISSING_PERMISSIONS
+        if isinstance(error, discord.NotFound):
+            # Unknown Webhook (10015), Unknown Message (10008), otherwise Unknown Channel (10003)
+            if error.code == 10015:
+                return WEBHOOK_MISSING
+            if error.code == 10008:
+                return MESSAGE_MISSING
+            return CHANNEL_MISSING
+        return None
+
+    def is_broken(self, guild_id: int):
+        """Returns True if the guild is broken."""
+        return guild_id in self.entries
+
+    def should_attempt(self, guild_id: int):
+        """Returns True if a background request can be made for the guild (healthy, being repaired, or backoff expired)."""
+        entry = self.entries.get(guild_id)
+        return entry is None or entry.repairing or time.monotonic() >= entry.retry_at
+
+    def record_failure(self, guild_id: int, failure: str):
+        """Records a failure of the guild and extends its backoff. Returns True if the guild was healthy before."""
+        entry = self.entries.get(guild_id)
+        was_healthy = entry is None
+        if was_healthy:
+            entry = self.entries[guild_id] = GuildHealthEntry(failure)
+
+        # Update failure, and back off exponentially
+        entry.failure = failure
+        entry.failures += 1
+        entry.retry_at = time.monotonic() + min(self.base * 2 ** (entry.failures - 1), self.max_backoff)
+        return was_healthy
+
+    def record_success(self, guild_id: int):
+        """Marks the guild as healthy. Returns True if it was broken before."""
+        return self.entries.pop(guild_id, None) is not None
+
+    def begin_repair(self, guild_id: int):
+        """
+        Marks a repair of the guild as running, if one is allowed: the guild is broken, no repair is running, and no repair
+        was attempted in the current backoff window. Returns True if the repair should run.
+        """
+        entry = self.entries.get(guild_id)
+        if entry is None or entry.repairing:
+            return False
+        if entry.repair_attempted and time.monotonic() < entry.retry_at:
+            return False
+        entry.repairing = True
+        entry.repair_attempted = True
+        return True
+
+    def end_repair(self, guild_id: int):
+        """Marks the repair of the guild as finished."""
+        entry = self.entries.get(guild_id)
+        if entry is not None:
+            entry.repairing = False
+
+    def remove(self, guild_id: int):
+        """Removes the guild (eg. when the bot leaves it)."""
+        self.entries.pop(guild_id, None)
+
+    def broken_guilds(self) -> List[tuple]:
+        """Returns the broken guilds, longest broken first: [(guild_id, failure class, consecutive failures, since), ...]."""
+        return sorted(
+            ((guild_id, entry.failure, entry.failures, entry.since) for guild_id, entry in self.entries.items()),
+            key=lambda item: item[3]
+        )
@@ -0,0 +1,180 @@
+import asyncio
+import functools
+import time
+import discord
+from collections import deque
+from typing import Any, Callable, Optional
+from assets.logger.logger import debug_logger
+from assets.utils.taskregistry import TaskRegistry
+
+class GuildMailbox:
+    """
+    Serialized mailbox of a guild (`GuildMusicContext.mailbox`): runs player mutations and Lavalink event handler bodies
+    of the guild one at a time, in the order they were posted, on its own task.
+
+    - `post()` queues a job and returns at once (eg. Lavalink event dispatch). Its errors are logged.
+    - `run()` queues a job and waits for its result (eg. button callbacks and slash commands). Its errors are raised.
+    - The task only runs while there are queued jobs, so idle guilds cost no task. It is spawned in the bot TaskRegistry,
+      owned by the guild.
+    - Depth and latency (time jobs waited in the mailbox) are recorded, to spot slow or congested guilds.
+
+    NOTE: Jobs running in the mailbox that `run()` another job of the same mailbox run it inline, instead of waiting
+    for themselves.
+    """
+    __slots__ = ('guild_id', 'task_registry', 'jobs', '_task', 'max_depth', 'processed', 'total_wait', 'max_wait')
+
+    def __init__(self, guild_id: int, task_registry: TaskRegistry):
+        self.guild_id = guild_id
+        self.task_registry = task_registry
+
+        # Queued jobs: (callable, args, kwargs, when queued (monotonic), future or None)
+        self.jobs: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics: highest depth, jobs processed, and total/highest time (s) jobs waited before running
+        self.max_depth = 0
+        self.processed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def __len__(self):
+        """Number of queued jobs (depth)."""
+        return len(self.jobs)
+
+    ######################################
+    ############### JOBS #################
+    ######################################
+
+    def post(self, func: Callable, *args: Any, **kwargs: Any):
+        """Queues `func(*args, **kwargs)` (a coroutine function) and returns at once. Errors are logged."""
+        self._queue(func, args, kwargs, None)
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any):
+        """Queues `func(*args, **kwargs)` (a coroutine function) and waits for its result. Errors are raised."""
+        # Run inline, if already running in this mailbox
+        if self.is_current():
+            return await func(*args, **kwargs)
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue(func, args, kwargs, future)
+        return await future
+
+    @property
+    def is_busy(self):
+        """Whether a job is running or queued (a new job would have to wait)."""
+        return bool(self.jobs) or (self._task is not None and not self._task.done())
+
+    def is_current(self):
+        """Returns True if called from a job running in this mailbox."""
+        return self._task is not None and asyncio.current_task() is self._task
+
+    def _queue(self, func: Callable, args: tuple, kwargs: dict, future: Optional[asyncio.Future]):
+        """Queues a job, and starts the mailbox task if it isn't running."""
+        self.jobs.append((func, args, kwargs, time.monotonic(), future))
+        self.max_depth = max(self.max_depth, len(self.jobs))
+        if not self._task or self._task.done():
+            self._task = self.task_registry.spawn(self._process(), owner=self.guild_id, category='mailbox')
+
+    async def _process(self):
+        """Runs queued jobs in order, until there are none left."""
+        while self.jobs:
+            func, args, kwargs, queued_at, future = self.jobs.popleft()
+
+            # Skip jobs whose caller stopped waiting
+            if future is not None and future.done():
+                continue
+
+            # Record latency
+            wait = time.monotonic() - queued_at
+            self.processed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+            # Run job
+            try:
+                result = await func(*args, **kwargs)
+            except asyncio.CancelledError as e:
+                # Mailbox task cancelled (eg. `close()` or shutdown): cancel the job caller, and stop
+                if asyncio.current_task().cancelling():
+                    if future is not None and not future.done():
+                        future.cancel()
+                    raise
+
+                # Job cancelled from within (eg. a cancelled inner task): fail its caller, and keep processing
+                if future is None:
+                    debug_logger.warning(f'Mailbox job `{getattr(func, "__name__", func)}` of guild {self.guild_id} was cancelled.')
+                elif not future.done():
+                    future.set_exception(e)
+            except Exception as e:
+                if future is None:
+                    debug_logger.error(f'Mailbox job `{getattr(func, "__name__", func)}` of guild {self.guild_id} failed: {e}')
+                elif not future.done():
+                    future.set_exception(e)
+            else:
+                if future is not None and not future.done():
+                    future.set_result(result)
+
+    async def wait_idle(self, timeout: Optional[float] = None):
+        """Waits up to `timeout` seconds for the queued jobs to run. Returns True if the mailbox is idle."""
+        if self._task and not self._task.done() and not self.is_current():
+            await asyncio.wait([self._task], timeout=timeout)
+        return not self.jobs and (not self._task or self._task.done())
+
+    def close(self):
+        """Cancels the queued jobs and the mailbox task."""
+        for *_, future in self.jobs:
+            if future is not None and not future.done():
+                future.cancel()
+        self.jobs.clear()
+        if self._task:
+            self._task.cancel()
+
+    ######################################
+    ############## METRICS ###############
+    ######################################
+
+    @property
+    def avg_wait(self):
+        """Average time (s) jobs waited in the mailbox before running."""
+        return self.total_wait / self.processed if self.processed else 0.0
+
+    def reset_metrics(self):
+        """Resets highest depth and latency metrics (eg. after they were reported)."""
+        self.max_depth = len(self.jobs)
+        self.processed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+def serialized(func: Callable):
+    """
+    Decorator for MusicCog interaction handlers (slash commands), with the interaction as first argument:
+    runs them in the mailbox of the interaction guild (see `GuildMailbox`), serialized with the other player
+    mutations and Lavalink event handlers of the guild.
+
+    If the mailbox is busy, the interaction is deferred before queuing, so that it doesn't miss the interaction response
+    deadline while waiting. Hence handlers must respond with `respond()`, which keeps the visibility they choose.
+
+    NOTE: Must be the innermost decorator (right above the function), so that app command decorators see the
+    wrapped function signature.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction, *args, **kwargs):
+        mailbox = self.get_context(interaction.guild.id).mailbox
+        if mailbox.is_busy and not mailbox.is_current():
+            await interaction.response.defer(thinking=True)
+            interaction.extras['serialized_deferral'] = True
+        return await mailbox.run(func, self, interaction, *args, **kwargs)
+    return wrapper
+
+async def respond(interaction: discord.Interaction, **kwargs: Any):
+    """
+    Sends the response of an interaction, or a followup if it was already deferred (see `serialized()`).
+
+    NOTE: The first followup replaces the (public) "thinking" message of the deferral, taking its visibility. Hence, for an
+    ephemeral response, the "thinking" message is deleted first, so that the followup is sent as a new ephemeral message.
+    """
+    if not interaction.response.is_done():
+        return await interaction.response.send_message(**kwargs)
+    if interaction.extras.pop('serialized_deferral', False) and kwargs.get('ephemeral'):
+        await interaction.delete_original_response()
+    return await interaction.followup.send(**kwargs)
@@ -0,0 +1,84 @@
+import discord
+from typing import Any, Optional
+from assets.music.guildmailbox import GuildMailbox
+from assets.utils.taskregistry import TaskRegistry
+
+# Default settings of guild music data
+DEFAULT_VOLUME = 50         # Player volume on connect
+IDLE_TIMER = 300            # Idle time (s) before auto-disconnect
+AUTO_PAUSE_GRACE = 60       # Grace period (s) after which an auto-paused player is released
+HIBERNATE_AFTER = 1800      # Pause duration (s) after which a paused player is hibernated
+
+class GuildMusicSettings:
+    """Music settings of a guild, parsed from its music data with their defaults."""
+    __slots__ = ('default_volume', 'default_autoplay', 'default_loop', 'auto_disconnect', 'idle_timer',
+                 'auto_pause', 'auto_pause_grace', 'hibernate', 'hibernate_after')
+
+    def __init__(self, guild_music_data: dict):
+        # Player defaults on connect
+        self.default_volume: int = guild_music_data.get('default_volume', DEFAULT_VOLUME)
+        self.default_autoplay: bool = guild_music_data.get('default_autoplay', False)
+        self.default_loop: bool = guild_music_data.get('default_loop', False)
+
+        # Auto-disconnect, auto-pause and hibernation
+        self.auto_disconnect: bool = guild_music_data.get('auto_disconnect', True)
+        self.idle_timer: int = guild_music_data.get('idle_timer', IDLE_TIMER)
+        self.auto_pause: bool = guild_music_data.get('auto_pause', True)
+        self.auto_pause_grace: int = guild_music_data.get('auto_pause_grace', AUTO_PAUSE_GRACE)
+        self.hibernate: bool = guild_music_data.get('hibernate', True)
+        self.hibernate_after: int = guild_music_data.get('hibernate_after', HIBERNATE_AFTER)
+
+class GuildMusicContext:
+    """
+    Music state of a guild, kept in a single object (`MusicCog.contexts`, see `MusicCog.get_context()`), so that hot
+    paths (Lavalink events, music message updates, messages in music text channels) do a single dict lookup.
+
+    - `player` and `voice_client` are set when the bot connects to voice and cleared when it disconnects.
+    - `webhook` caches the music text channel webhook, and is dropped when it is found missing or replaced.
+    - Music text channel IDs and `settings` are parsed from the guild music data, and reloaded (`load()`) whenever
+      the cog changes it (see `MusicCog.add_music_data()`).
+    - `view_state`, `embed_default` and `playlist_version` describe what is shown in the music message.
+    - `mailbox` serializes the player mutations and Lavalink event handlers of the guild (see `GuildMailbox`).
+
+    NOTE: Views are not kept (see `MusicPlayerView`), only the state of the one shown in the music message.
+    """
+    __slots__ = ('guild_id', 'player', 'voice_client', 'webhook', 'view_state', 'embed_default', 'playlist_version',
+                 'music_text_channel_id', 'music_message_id', 'webhook_id', 'settings', 'mailbox')
+
+    def __init__(self, guild_id: int, guild_music_data: dict, task_registry: TaskRegistry):
+        self.guild_id = guild_id
+
+        # Player and voice client, while connected
+        self.player: Optional[Any] = None
+        self.voice_client: Optional[discord.VoiceProtocol] = None
+
+        # Cached music text channel webhook
+        self.webhook: Optional[discord.Webhook] = None
+
+        # State of the MusicPlayerView shown in the music message (None if unknown), whether its embed is the
+        # default one, and version of the guild playlists
+        self.view_state: Optional[tuple] = None
+        self.embed_default = False
+        self.playlist_version = 0
+
+        # Serialized mailbox of player mutations and Lavalink event handlers
+        self.mailbox = GuildMailbox(guild_id, task_registry)
+
+        # Music text channel IDs and settings
+        self.load(guild_music_data)
+
+    def load(self, guild_music_data: dict):
+        """(Re)parses the music text channel IDs and settings from the guild music data."""
+        self.music_text_channel_id: Optional[int] = guild_music_data.get('music_text_channel_id')
+        self.music_message_id: Optional[int] = guild_music_data.get('music_message_id')
+        self.webhook_id: Optional[int] = (guild_music_data.get('music_text_channel_webhook') or {}).get('id')
+        self.settings = GuildMusicSettings(guild_music_data)
+
+        # Drop cached webhook if it was replaced
+        if self.webhook and self.webhook.id != self.webhook_id:
+            self.webhook = None
+
+    @property
+    def is_set_up(self):
+        """Whether the guild has a music text channel set up."""
+        return bool(self.music_text_channel_id)
@@ -0,0 +1,326 @@
+import random
+from typing import Any, Iterable, Iterator, List, Optional
+
+class _Node:
+    """Node of the IndexedQueue implicit treap."""
+    __slots__ = ('item', 'priority', 'size', 'total', 'left', 'right')
+
+    def __init__(self, item: Any, priority: float):
+        self.item = item
+        self.priority = priority
+        self.size = 1
+        self.total = _duration(item)
+        self.left: Optional['_Node'] = None
+        self.right: Optional['_Node'] = None
+
+def _duration(item: Any):
+    """Duration (ms) of a track counted in queue time. Streams don't count."""
+    return 0 if getattr(item, 'is_stream', False) else getattr(item, 'duration', 0)
+
+def _update(node: _Node):
+    """Recompute node size and total duration from its children."""
+    node.size = 1
+    node.total = _duration(node.item)
+    if node.left:
+        node.size += node.left.size
+        node.total += node.left.total
+    if node.right:
+        node.size += node.right.size
+        node.total += node.right.total
+
+def _size(node: Optional[_Node]):
+    return node.size if node else 0
+
+def _split(node: Optional[_Node], index: int):
+    """Split tree in (first `index` items, remaining items)."""
+    if node is None:
+        return None, None
+    if _size(node.left) >= index:
+        left, node.left = _split(node.left, index)
+        _update(node)
+        return left, node
+    node.right, right = _split(node.right, index - _size(node.left) - 1)
+    _update(node)
+    return node, right
+
+def _merge(left: Optional[_Node], right: Optional[_Node]):
+    """Merge two trees, with all items of left before all items of right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+def _build(items: Iterable[Any]):
+    """Build a tree from items in O(n), using the rightmost path of the tree as a stack (Cartesian tree)."""
+    stack: List[_Node] = []
+    for item in items:
+        node = _Node(item, random.random())
+        last = None
+        while stack and stack[-1].priority < node.priority:
+            last = stack.pop()
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    if not stack:
+        return None
+
+    # Recompute sizes and totals bottom-up (post-order)
+    root = stack[0]
+    order = []
+    pending = [root]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        if node.left:
+            pending.append(node.left)
+        if node.right:
+            pending.append(node.right)
+    for node in reversed(order):
+        _update(node)
+    return root
+
+class IndexedQueue:
+    """
+    Player queue backed by an implicit treap (order statistic tree) that keeps, for each subtree, its size and the sum of
+    its track durations.
+
+    It behaves like the list used by lavalink's DefaultPlayer (append, insert, pop, len, indexing, slicing, iteration),
+    with the following complexities for a queue of n tracks:
+        - insert / pop / move / jump (rotate or drop front): O(log n)
+        - total queue time: O(1)
+        - time until the track at a given position starts (prefix sum): O(log n)
+        - page of k tracks: O(log n + k)
+
+    `version` is incremented on every change, so that views can tell if the queue changed since they were rendered.
+    """
+    def __init__(self, items: Optional[Iterable[Any]] = None):
+        self._root = _build(map(self._wrap, items)) if items else None
+        self.version = 0
+
+    def _wrap(self, item: Any):
+        """Converts items as they are added to the queue. Can be overridden by subclasses, returns the item by default."""
+        return item
+
+    ######################################
+    ############ LIST INTERFACE ##########
+    ######################################
+
+    def __len__(self):
+        return _size(self._root)
+
+    def __bool__(self):
+        return self._root is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __repr__(self):
+        return f'<IndexedQueue size={len(self)} total={self.total_duration}>'
+
+    def _index(self, index: int):
+        """Normalize index, raising IndexError if it is out of range."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('queue index out of range')
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return self.page(start, stop)
+
+        index = self._index(index)
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.item
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __setitem__(self, index: int, item: Any):
+        index = self._index(index)
+        left, right = _split(self._root, index)
+        _, right = _split(right, 1)
+        self._root = _merge(_merge(left, _Node(self._wrap(item), random.random())), right)
+        self.version += 1
+
+    def append(self, item: Any):
+        self._root = _merge(self._root, _Node(self._wrap(item), random.random()))
+        self.version += 1
+
+    def extend(self, items: Iterable[Any]):
+        self._root = _merge(self._root, _build(map(self._wrap, items)))
+        self.version += 1
+
+    def insert(self, index: int, item: Any):
+        size = len(self)
+        if index < 0:
+            index = max(0, index + size)
+        index = min(index, size)
+        new = _Node(self._wrap(item), random.random())
+
+        # Descend while nodes have higher priority than the new node, updating their size and total on the way
+        parent, is_left = None, False
+        node = self._root
+        while node and node.priority > new.priority:
+            node.size += 1
+            node.total += new.total
+            parent = node
+            left_size = _size(node.left)
+            if index <= left_size:
+                node, is_left = node.left, True
+            else:
+                index -= left_size + 1
+                node, is_left = node.right, False
+
+        # The new node takes the place of the remaining subtree, split around it
+        new.left, new.right = _split(node, index)
+        _update(new)
+        self._attach(parent, is_left, new)
+        self.version += 1
+
+    def pop(self, index: int = -1):
+        index = self._index(index)
+
+        # Descend to the node, updating size and total on the way
+        removed = self[index]
+        duration = _duration(removed)
+        parent, is_left = None, False
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index == left_size:
+                break
+            node.size -= 1
+            node.total -= duration
+            parent = node
+            if index < left_size:
+                node, is_left = node.left, True
+            else:
+                index -= left_size + 1
+                node, is_left = node.right, False
+
+        # Replace the node by the merge of its children
+        self._attach(parent, is_left, _merge(node.left, node.right))
+        self.version += 1
+        return node.item
+
+    def _attach(self, parent: Optional[_Node], is_left: bool, node: Optional[_Node]):
+        """Set node as the left/right child of parent, or as root if parent is None."""
+        if parent is None:
+            self._root = node
+        elif is_left:
+            parent.left = node
+        else:
+            parent.right = node
+
+    def clear(self):
+        self._root = None
+        self.version += 1
+
+    ######################################
+    ########## QUEUE OPERATIONS ##########
+    ######################################
+
+    def page(self, start: int, stop: int) -> List[Any]:
+        """Returns the tracks from start to stop (exclusive), in O(log n + k)."""
+        start = max(0, start)
+        stop = min(stop, len(self))
+        items = []
+        if start >= stop:
+            return items
+
+        # Descend to start, keeping the path of nodes still to visit, then walk in order
+        stack = []
+        node = self._root
+        index = start
+        while node:
+            left_size = _size(node.left)
+            if index < left_size:
+                stack.append(node)
+                node = node.left
+            elif index == left_size:
+                stack.append(node)
+                break
+            else:
+                index -= left_size + 1
+                node = node.right
+        while stack and len(items) < stop - start:
+            node = stack.pop()
+            items.append(node.item)
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+        return items
+
+    def move(self, source: int, destination: int):
+        """Move the track at index source to index destination. Returns the moved track."""
+        item = self.pop(source)
+        self.insert(destination, item)
+        return item
+
+    def rotate(self, index: int):
+        """Rotate the queue so that the track at index becomes the first, moving the previous tracks to the end."""
+        left, right = _split(self._root, index)
+        self._root = _merge(right, left)
+        self.version += 1
+
+    def drop_front(self, index: int):
+        """Remove the first `index` tracks of the queue."""
+        _, self._root = _split(self._root, index)
+        self.version += 1
+
+    def shuffle(self):
+        """Shuffle the queue in O(n)."""
+        items = list(self)
+        random.shuffle(items)
+        self._root = _build(items)
+        self.version += 1
+
+    @property
+    def total_duration(self):
+        """Sum of the durations (ms) of all tracks in queue, excluding streams. O(1)."""
+        return self._root.total if self._root else 0
+
+    def starts_in(self, index: int):
+        """Sum of the durations (ms) of the tracks before index, excluding streams. O(log n)."""
+        index = min(max(0, index), len(self))
+        total = 0
+        node = self._root
+        while node:
+            left_size = _size(node.left)
+            if index <= left_size:
+                node = node.left
+            else:
+                total += (node.left.total if node.left else 0) + _duration(node.item)
+                index -= left_size + 1
+                node = node.right
+        return total
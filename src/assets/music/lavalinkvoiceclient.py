@@ -1,7 +1,8 @@
 import discord
 import lavalink
 from lavalink.errors import ClientError
-import asyncio
+import time
+from assets.music.vibeplayer import VibePlayer
 from assets.logger.logger import debug_logger
 from assets.utils.reply_embed import error_embed, success_embed, warning_embed
 
@@ -25,30 +26,31 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
             # Instantiate a client if one doesn't exist.
             # We store it in `self.client` so that it may persist across cog reloads,
             # however this is not mandatory.
-            self.client.lavalink = lavalink.Client(client.user.id)
+            self.client.lavalink = lavalink.Client(client.user.id, player=VibePlayer)
             self.client.lavalink.add_node(host='localhost', port=2333, password='youshallnotpass',
                                           region='eu', name='music-node')
 
         # Create a shortcut to the Lavalink client here.
         self.lavalink = self.client.lavalink
 
-        # Task to track auto-disconnect due to idle task
-        self.idle_task = None
-    
     async def start_idle_timer(self):
-        """Starts a idle timer to disconnect if idle."""
-        # Stop task if it exists
+        """Starts a idle timer to disconnect if idle (in the bot timer wheel, replacing any pending idle timer of this guild). The check runs in the guild mailbox."""
+        # Stop timer if it exists
         self.stop_idle_timer()
 
-        # Start new task, if auto-disconnect is enabled
-        if self.cog.get_guild_music_data(self.guild_id).get('auto_disconnect', True):
-            self.idle_task = asyncio.create_task(self._check_idle_disconnect())
+        # Start new timer, if auto-disconnect is enabled
+        context = self.cog.get_context(self.guild_id)
+        if context.settings.auto_disconnect:
+            self.client.timers.schedule(
+                context.settings.idle_timer,
+                context.mailbox.post,
+                self._check_idle_disconnect,
+                category='idle_disconnect',
+                key=self.guild_id
+            )
 
     async def _check_idle_disconnect(self):
-        """Background task to check for idle time of continuous inactivity."""
-        # Wait idle timer
-        await asyncio.sleep(self.cog.get_guild_music_data(self.guild_id).get('idle_timer', 300))
-
+        """Called when the idle timer expires, to disconnect after idle time of continuous inactivity."""
         # Get player for this guild
         player = self.lavalink.player_manager.get(self.guild_id)
 
@@ -57,18 +59,17 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
             await self.disconnect(force=True)
 
             # Send Warning to music text channel that bot has been disconnected for being idle
-            guild_music_data = self.cog.get_guild_music_data(self.guild_id)
-            music_text_channel = self.guild.get_channel(guild_music_data['music_text_channel_id'])
+            music_text_channel = self.guild.get_channel(self.cog.get_context(self.guild_id).music_text_channel_id or 0)
             if music_text_channel:
-                await music_text_channel.send(embed=warning_embed(f"I left the voice channel due to inactivity.\nUse `/auto-disconnect` to disable the auto-disconnect or change the idle timer."), 
-                                                delete_after=15)
+                self.client.timers.expire_message(
+                    await music_text_channel.send(embed=warning_embed(f"I left the voice channel due to inactivity.\nUse `/auto-disconnect` to disable the auto-disconnect or change the idle timer.")),
+                    15
+                )
             
     def stop_idle_timer(self):
-        """Stops idle task timer."""
-        # Cancel task if it exists
-        if self.idle_task:
-            self.idle_task.cancel()
-        self.idle_task = None
+        """Stops idle timer."""
+        # Cancel timer if it exists
+        self.client.timers.cancel('idle_disconnect', self.guild_id)
 
     async def on_voice_server_update(self, data):
         # the data needs to be transformed before being handed down to
@@ -111,18 +112,22 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
         # ensure there is a player_manager when creating a new voice_client
         player = self.lavalink.player_manager.create(guild_id=self.guild_id)
 
+        # Set player and voice client in guild context
+        context = self.cog.get_context(self.guild_id)
+        context.player, context.voice_client = player, self
+
         ##########################################
         ####### SET PLAYER DEFAULT SETTINGS ######
         ##########################################
 
         # Set default volume
-        await player.set_volume(self.cog.get_guild_music_data(self.guild_id).get('default_volume', 50))
+        await player.set_volume(context.settings.default_volume)
 
         # Set default autoplay
-        player.store(key="autoplay", value=self.cog.get_guild_music_data(self.guild_id).get('default_autoplay', False))
+        player.store(key="autoplay", value=context.settings.default_autoplay)
 
         # Set default loop
-        if self.cog.get_guild_music_data(self.guild_id).get('default_loop', False):
+        if context.settings.default_loop:
             player.set_loop(player.LOOP_QUEUE)
 
         # Connect
@@ -135,6 +140,14 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
         # start idle task timer
         await self.start_idle_timer()
 
+        # Wake hibernated player, or drop player released while its voice channel was empty (it is no longer resumed).
+        # Posted to the guild mailbox, as waking is slow (tracks are decoded) and must not delay the connect
+        context.mailbox.post(self.cog.restore_held_player, self.guild_id)
+
+        # Record guild activity, used to restore most active guilds first on startup (kept in memory, saved with the next flush)
+        if context.is_set_up:
+            self.cog.add_music_data(guild_id=self.guild_id, keys='last_active', values=int(time.time()), save=False)
+
         # Update MusicPlayerView in music message
         await self.cog.update_musicplayerview(self.guild_id)
 
@@ -175,15 +188,19 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
         except ClientError:
             pass
 
+        # Clear player and voice client from guild context
+        context = self.cog.get_context(self.guild_id)
+        if context.voice_client is self:
+            context.player = context.voice_client = None
+
         ##########################################
         ####### HANDLE DISCONNECT ACTIONS ########
         ##########################################
 
-        # Update MusicPlayerView in music message
-        await self.cog.update_musicplayerview(self.guild_id)
-
-        # Update music message embed
-        await self.cog.update_music_embed(self.guild)
+        # Update MusicPlayerView and embed in music message (on shutdown, music messages are reset in bulk instead)
+        if not self.cog.state.draining:
+            await self.cog.update_musicplayerview(self.guild_id)
+            await self.cog.update_music_embed(self.guild)
         
-        # Cancel idle task (If I uncomment, the message warning bot disconnected isnt deleted)
-        #self.stop_idle_timer()
\ No newline at end of file
+        # Cancel idle timer (the warning message of an idle disconnect expires independently, in the timer wheel)
+        self.stop_idle_timer()
\ No newline at end of file
@@ -0,0 +1,54 @@
+from discord.ext import commands
+import os
+from typing import Dict
+from assets.music.guildhealth import GuildHealth
+from assets.music.guildmusiccontext import GuildMusicContext
+from assets.music.playersnapshot import PlayerSnapshot
+from assets.music.playersnapshotstore import PlayerSnapshotStore
+from assets.music.playlistsnapshots import PlaylistSnapshots
+from assets.music.searchcache import SearchCache
+
+class MusicState:
+    """
+    Live state of the music cog, kept in the bot (`bot.music_state`) so that it survives a hot reload of the cog
+    (see `MusicCog.reload_music()`).
+
+    The Lavalink client (`bot.lavalink`), its players and queues, and the voice clients already live in the bot.
+    This container keeps the rest: guild contexts (with their mailboxes and cached webhooks), released and hibernated
+    players, guild health, durable player snapshots, caches and counters. A new cog instance takes the existing state instead of creating it,
+    and re-attaches to it in `cog_load()`.
+
+    NOTE: Only the cog module is reloaded. Live objects (players, voice clients, contexts, snapshots) keep their classes.
+    """
+    def __init__(self, bot: commands.Bot, data_dir: str):
+        # Set while the cog is being hot reloaded, so that unloading keeps the live state
+        self.reloading = False
+
+        # Set once the bot is shutting down, so that no new music work is accepted (see `MusicCog.stop_accepting_work()`)
+        self.draining = False
+
+        # Guilds whose music text channel was not restored yet (on startup)
+        self.unrestored_guilds: set = set()
+
+        # Music state of each guild: player, voice client, webhook, music message state, music text channel IDs and settings
+        self.contexts: Dict[int, GuildMusicContext] = {}
+
+        # Health state of guild music text channels (negative cache of broken guilds)
+        self.guild_health = GuildHealth()
+
+        # Players released while their voice channel was empty: {guild_id: (PlayerSnapshot, auto-pause info)}
+        self.released_players: Dict[int, tuple] = {}
+
+        # Hibernated players (paused for long): {guild_id: compacted PlayerSnapshot}
+        self.hibernated_players: Dict[int, PlayerSnapshot] = {}
+
+        # Auto-pause counters, with estimated Lavalink streaming and node CPU time saved, and number of orphaned players reaped
+        self.auto_pause_stats = {'paused': 0, 'released': 0, 'resumed': 0, 'stream_seconds_saved': 0.0, 'cpu_seconds_saved': 0.0}
+        self.reaped_players = 0
+
+        # Search cache for /play autocomplete, and saved playlists snapshots
+        self.search_cache = SearchCache(bot.task_registry)
+        self.playlist_snapshots = PlaylistSnapshots(bot, os.path.join(data_dir, 'playlist_snapshots.json'))
+
+        # Durable snapshots of active players, to recover them after a crash or a Lavalink node restart
+        self.player_snapshots = PlayerSnapshotStore(os.path.join(data_dir, 'player_snapshots.json'))
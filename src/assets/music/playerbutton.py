@@ -0,0 +1,310 @@
+import discord
+from discord.ext import commands
+from discord.ui import Button, DynamicItem
+from lavalink.events import QueueEndEvent
+from assets.utils.reply_embed import error_embed, success_embed
+
+# Player button actions, used in custom_id `vibebot_<action>_<guild_id>`
+PLAYER_ACTIONS = (
+    'volume_down', 'previous_track', 'resume_pause', 'next_track', 'volume_up',
+    'loop', 'shuffle', 'autoplay', 'stop', 'connect'
+)
+
+class PlayerButton(DynamicItem[Button], template=r'vibebot_(?P<action>' + '|'.join(PLAYER_ACTIONS) + r')_(?P<guild_id>[0-9]+)'):
+    """
+    Music message player button, as a dynamic item.
+
+    Player buttons are not bound to any view instance: a single handler, registered once with `bot.add_dynamic_items()`,
+    matches the custom_id `vibebot_<action>_<guild_id>` of any clicked button and creates the item to handle it.
+    Hence player buttons cost no memory per guild and don't need to be restored on startup.
+    """
+    def __init__(self, action: str, guild_id: int, **kwargs):
+        super().__init__(Button(custom_id=f'vibebot_{action}_{guild_id}', **kwargs))
+        self.action = action
+        self.guild_id = guild_id
+
+        # Set on interaction, in `from_custom_id()`
+        self.cog: commands.Cog = None
+        self.guild: discord.Guild = None
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        """Creates the item for a clicked button, from its custom_id."""
+        button = cls(match['action'], int(match['guild_id']))
+        button.cog = interaction.client.get_cog("MusicCog")
+        button.guild = interaction.guild
+        return button
+
+    ######################################
+    ############### EVENTS ###############
+    ######################################
+    
+    async def interaction_check(self, interaction: discord.Interaction):
+        """
+        A callback that is called when an interaction happens with the button, that checks whether the button callback
+        should be called. If the callback should be called returns True, otherwise returns False.
+        """
+        # Ignore buttons of other guilds, or if music cog is not loaded
+        if not self.cog or not self.guild or self.guild.id != self.guild_id:
+            return False
+
+        # If the button is connect or playlist, than the bot should join the voice channel if possible
+        should_connect = self.action in ["connect", "playlist"]
+
+        # If the button is previous, resume, skip, shuffle or stop, than the bot should be playing
+        should_bePlaying = self.action in ["previous_track", "resume_pause", "next_track", "shuffle", "stop"]
+
+        # If the button is resume and the player is hibernated, than the bot should join the voice channel (which wakes the player)
+        if self.action == "resume_pause" and self.cog.is_hibernated(self.guild.id):
+            should_connect, should_bePlaying = True, False
+
+        # Check if bot is connected
+        is_connected = self.guild.voice_client is not None
+
+        # Check if the interation should run using cog.check_and_join
+        check = await self.cog.check_and_join(interaction.user, interaction.guild, should_connect, should_bePlaying)
+        if check:
+            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            return False
+
+        # After passsing check_and_join, if bot was not connected before, then it was connected in this check
+        # Save this information for connect_callback_function
+        interaction.extras["wasConectedDuringCheck"] = not is_connected
+        return True
+
+    async def callback(self, interaction: discord.Interaction):
+        """
+        Dispatch the interaction to the callback of the button action, in the guild mailbox (serialized with other player mutations).
+
+        NOTE: The interaction is deferred before queuing, as a click queued behind slow jobs (eg. a playlist load) would miss the
+        interaction response deadline. Hence callbacks respond with `interaction.followup` and `interaction.edit_original_response()`.
+        """
+        await interaction.response.defer()
+        await self.cog.get_context(self.guild.id).mailbox.run(getattr(self, f'{self.action}_callback'), interaction)
+    
+    ######################################
+    ############# CALLBACKS ##############
+    ######################################
+
+    async def volume_down_callback(self, interaction: discord.Interaction):
+        """"
+        Handle volume down button callback. 
+        
+        Lower volume by 10. Minimum is 0.
+        It does not needs to update MusicPlayerView.
+        It needs to update music message embed, if player is playing (done once for all clicks merged in the same Lavalink update).
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Get Current Volume (intended, including changes not yet sent to Lavalink)
+        volume = player.volume
+
+        # Check if volume is already minimum (0)
+        if volume == 0:
+            await interaction.followup.send(embed=error_embed("Volume is already at minimum (0%)."), ephemeral=True)
+            return
+        
+        # Lower volume by 10
+        volume-=10
+
+        # Clip volume between 0 and 200
+        volume = max(0, min(200, volume))
+
+        # Set volume (music message embed is updated once the coalesced change is sent to Lavalink)
+        player.queue_update(volume=volume)
+
+    async def previous_track_callback(self, interaction: discord.Interaction):
+        """
+        Handle previous track button callback.
+        
+        Play previous track.
+        It does not needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Get previous track, if it exists, otherwise None
+        previous_track = player.fetch(key='previous_track', default=None)
+
+        # check if previous track exists
+        if not previous_track:
+            await interaction.followup.send(embed=error_embed("No previous track."), ephemeral=True)
+            return
+        
+        # Play previous track
+        await player.play(previous_track)
+
+    async def resume_pause_callback(self, interaction: discord.Interaction):
+        """
+        Handle resume/pause button callback.
+
+        Pause if button is Pause. Resume if button is Resume.
+        It needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+
+        NOTE: When bot is connected without music playing the Resume button is shown. When in this state, clicking Resume
+        will send warning that not music is playing.
+        NOTE: When the player is hibernated, clicking Resume connects the bot to the voice channel, which wakes the player.
+        """
+        # If bot was connected during check, the hibernated player is woken up (at its saved position) by the job posted to
+        # the guild mailbox when connecting, which runs before this callback
+        if interaction.extras["wasConectedDuringCheck"]:
+            return
+
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+        
+        # Toggle intended paused state (sent to Lavalink merged with other changes made meanwhile)
+        player.queue_update(paused=not player.paused)
+
+        # Update MusicPlayerView in music message, from intended state
+        await interaction.edit_original_response(view=self.cog.get_musicplayerview(self.guild))
+    
+    async def next_track_callback(self, interaction: discord.Interaction):
+        """
+        Handle next track button callback.
+        
+        Skips to next track.
+        It does not needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Skip to next track
+        await player.skip()
+    
+    async def volume_up_callback(self, interaction: discord.Interaction):
+        """"
+        Handle volume up button callback. 
+        
+        Elevate volume by 10. Maximum is 200.
+        It does not needs to update MusicPlayerView.
+        It needs to update music message embed, if player is playing (done once for all clicks merged in the same Lavalink update).
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Get Current Volume (intended, including changes not yet sent to Lavalink)
+        volume = player.volume
+
+        # Check if volume is already minimum (0)
+        if volume == 200:
+            await interaction.followup.send(embed=error_embed("Volume is already at maximum (200%)."), ephemeral=True)
+            return
+
+        # Elevate volume by 10
+        volume+=10
+
+        # Clip volume between 0 and 200
+        volume = max(0, min(200, volume))
+
+        # Set volume (music message embed is updated once the coalesced change is sent to Lavalink)
+        player.queue_update(volume=volume)
+    
+    async def loop_callback(self, interaction: discord.Interaction):
+        """
+        Handle loop button callback.
+        
+        Toggle loop.
+        It needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        if player.loop == player.LOOP_NONE:
+            player.set_loop(player.LOOP_QUEUE)
+            interaction.client.timers.expire_message(await interaction.followup.send(embed=success_embed("Looping Queue."), ephemeral=True, wait=True), 5)
+        elif player.loop == player.LOOP_QUEUE:
+            player.set_loop(player.LOOP_SINGLE)
+            interaction.client.timers.expire_message(await interaction.followup.send(embed=success_embed("Looping Track."), ephemeral=True, wait=True), 5)
+        elif player.loop == player.LOOP_SINGLE:
+            player.set_loop(player.LOOP_NONE)
+            interaction.client.timers.expire_message(await interaction.followup.send(embed=success_embed("Looping Disbaled."), ephemeral=True, wait=True), 5)
+        
+        # Update MusicPlayerView in music message
+        await interaction.edit_original_response(view=self.cog.get_musicplayerview(self.guild))
+    
+    async def shuffle_callback(self, interaction: discord.Interaction):
+        """
+        Handle shuffle button callback.
+        
+        Shuffle queue.
+        It does not needs to update MusicPlayerView.
+        It needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Shuffle queue and pending playlist tracks
+        self.cog.shuffle_queue(player)
+
+        # Update music message embed
+        await self.cog.update_music_embed(self.guild)
+    
+    async def autoplay_callback(self, interaction: discord.Interaction):
+        """
+        Handle autoplay button callback.
+        
+        Toggle autoplay.
+        It needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Toggle autoplay
+        if not player.fetch(key="autoplay", default=False):
+            player.store(key="autoplay", value=True)
+        else:
+            player.store(key="autoplay", value=False)
+
+        # Update MusicPlayerView in music message
+        await interaction.edit_original_response(view=self.cog.get_musicplayerview(self.guild))
+    
+    async def stop_callback(self, interaction: discord.Interaction):
+        """
+        Handle stop button callback.
+        
+        Stop music. Resets player default settings. Triggers lavalink QueueEndEvent.
+        It does not needs to update MusicPlayerView.
+        It does not needs to update music message embed.
+        """
+        # Get guild player
+        player = self.cog.lavalink.player_manager.get(self.guild.id)
+
+        # Clear player queue and pending playlist tracks
+        player.queue.clear()
+        self.cog.clear_pending(player)
+
+        # Set player loop to None
+        player.loop = player.LOOP_NONE
+
+        # Stop music player
+        await player.stop()
+
+        # Turn off autoplay if it's on
+        player.store(key="autoplay", value=False)
+
+        # Manually trigger the queue end logic (runs inline, as this callback already runs in the guild mailbox)
+        await self.cog.handle_queue_end(QueueEndEvent(player))
+    
+    async def connect_callback(self, interaction: discord.Interaction):
+        """
+        Handle connect/disconnect button callback.
+
+        Connect if button is Connect. Disconnect if button is Disconnect.
+        It does not needs to update MusicPlayerView.
+        It does needs to update music message embed, as it is alredy handled on disconnect.
+
+        NOTE: When entering thin callback, the bow will always be already connected (because of check_and_join()), hence
+        to know when not to disconnect (when the connect button is clicked), it is necessary to know if the bot was
+        connected during check_and_join(). For that interaction.extras["wasConectedDuringCheck"] is used.
+        """
+        # If bot is connected and was not connected during check, then disconnect
+        # Otherwise do nothing and bot was already connected during check 
+        if self.guild.voice_client is not None and not interaction.extras["wasConectedDuringCheck"]:
+            await self.guild.voice_client.disconnect(force=True)
\ No newline at end of file
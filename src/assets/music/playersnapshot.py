@@ -0,0 +1,127 @@
+import time
+from array import array
+from typing import Any, List, Optional
+from assets.music.queuedtrack import QueuedTrack, compact_track
+from assets.music.tracks import decode_tracks
+
+class PlayerSnapshot:
+    """
+    Lightweight snapshot of a player, taken before its Lavalink player is released, to recreate it later.
+
+    Keeps the voice channel, the current track (compact QueuedTrack) and its position, the queue (compact QueuedTracks,
+    sharing their TrackInfos with any other queue), the pending playlist tracks and the player settings.
+
+    For long lived snapshots (eg. hibernated players), `compact()` further reduces the current track and queue to their
+    encoded strings and requester IDs, which are decoded back in batch when the snapshot is restored.
+    """
+    __slots__ = ('guild_id', 'channel_id', 'current', 'position', 'tracks', 'volume', 'loop', 'autoplay',
+                 'previous_track', 'playlist_cursors', 'taken_at', 'encoded_tracks', 'requesters', 'has_current')
+
+    def __init__(self, player: Any, channel_id: int):
+        self.guild_id: int = player.guild_id
+        self.channel_id = channel_id
+
+        # Current track and position (ms)
+        self.current: Optional[QueuedTrack] = compact_track(player.current) if player.current else None
+        self.position: int = player.position
+
+        # Queue and pending playlist tracks
+        self.tracks: List[QueuedTrack] = list(player.queue)
+        self.playlist_cursors: list = list(player.fetch('playlist_cursors', default=()))
+
+        # Player settings
+        self.volume: int = player.volume
+        self.loop: int = player.loop
+        self.autoplay: bool = player.fetch('autoplay', default=False)
+        self.previous_track: Optional[QueuedTrack] = player.fetch('previous_track', default=None)
+
+        # When snapshot was taken (monotonic)
+        self.taken_at = time.monotonic()
+
+        # Compacted current track (first, if `has_current`) and queue: encoded tracks and their requester IDs (see `compact()`)
+        self.encoded_tracks: Optional[List[str]] = None
+        self.requesters: Optional[array] = None
+        self.has_current = False
+
+    @classmethod
+    def from_compact(cls, guild_id: int, channel_id: int, encoded_tracks: List[str], requesters: List[int], has_current: bool,
+                     position: int, volume: int, loop: int, autoplay: bool):
+        """
+        Creates a compacted snapshot from saved fields (eg. durable player snapshots, see `PlayerSnapshotStore`).
+
+        NOTE: The previous track and pending playlist tracks are not saved, so they are not restored.
+        """
+        snapshot = cls.__new__(cls)
+        snapshot.guild_id, snapshot.channel_id = guild_id, channel_id
+        snapshot.current, snapshot.position, snapshot.tracks = None, position, []
+        snapshot.playlist_cursors, snapshot.previous_track = [], None
+        snapshot.volume, snapshot.loop, snapshot.autoplay = volume, loop, autoplay
+        snapshot.taken_at = time.monotonic()
+        snapshot.encoded_tracks, snapshot.requesters, snapshot.has_current = list(encoded_tracks), array('q', requesters), has_current
+        return snapshot
+
+    def __len__(self):
+        """Number of tracks in snapshot (current track and queue)."""
+        if self.encoded_tracks is not None:
+            return len(self.encoded_tracks)
+        return len(self.tracks) + (1 if self.current else 0)
+
+    @property
+    def is_compact(self):
+        """Whether the current track and queue were compacted into encoded tracks."""
+        return self.encoded_tracks is not None
+
+    def compact(self):
+        """Reduces the current track and queue to encoded tracks and requester IDs (tracks that can't be encoded are dropped)."""
+        if self.is_compact:
+            return
+        self.has_current = bool(self.current and self.current.track)
+        tracks = ([self.current] if self.has_current else []) + [track for track in self.tracks if track.track]
+        self.encoded_tracks = [track.track for track in tracks]
+        self.requesters = array('q', (track.requester or 0 for track in tracks))
+        self.current, self.tracks = None, []
+
+    async def expand(self, client: Any):
+        """Decodes the compacted current track and queue back into QueuedTracks, in batch (see `decode_tracks()`)."""
+        if not self.is_compact:
+            return
+
+        # Decode tracks, and match them to their requesters by encoded track (undecodable tracks are None)
+        decoded = {track.track: track for track in await decode_tracks(client, self.encoded_tracks)}
+        tracks = []
+        for encoded, requester in zip(self.encoded_tracks, self.requesters):
+            track = decoded.get(encoded)
+            if track is not None:
+                track.requester = requester
+                track = compact_track(track)
+            tracks.append(track)
+
+        # Restore current track and queue
+        if self.has_current:
+            self.current, tracks = tracks[0], tracks[1:]
+        self.tracks = [track for track in tracks if track is not None]
+        self.encoded_tracks = self.requesters = None
+
+    async def restore(self, player: Any):
+        """Restores the snapshot into a (new) player, and plays the current track from the saved position."""
+        # Decode compacted tracks
+        await self.expand(player.client)
+
+        # Player settings
+        await player.set_volume(self.volume)
+        player.set_loop(self.loop)
+        player.store(key='autoplay', value=self.autoplay)
+        if self.previous_track:
+            player.store(key='previous_track', value=self.previous_track)
+
+        # Queue and pending playlist tracks
+        player.queue = self.tracks
+        if self.playlist_cursors:
+            player.store(key='playlist_cursors', value=self.playlist_cursors)
+
+        # Play current track from saved position (within the track, eg. if saved as it ended), otherwise next track in queue
+        if self.current:
+            start_time = 0 if self.current.is_stream else max(0, min(self.position, self.current.duration - 1))
+            await player.play(self.current, start_time=start_time)
+        elif player.queue:
+            await player.play()
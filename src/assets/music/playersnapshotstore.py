@@ -0,0 +1,175 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from assets.music.playersnapshot import PlayerSnapshot
+from assets.logger.logger import music_data_logger as logger
+
+class PlayerSnapshotStore:
+    """
+    Durable snapshots of the active players, saved periodically to local storage, so that players can be recovered on
+    startup after the bot process crashed or was restarted (see `MusicCog.recover_players()`).
+
+    Snapshots are saved incrementally, in two parts:
+    - `player_snapshots.json` (rewritten on every save with active players, or if it changed) keeps the small state of every player:
+      {<guild_id>: {'channel_id': <voice channel ID>, 'position': <ms>, 'paused': <bool>, 'volume': <int>, 'loop': <int>,
+      'autoplay': <bool>}}, and when it was saved ('saved_at', unix timestamp).
+    - `player_snapshots/<guild_id>.json` keeps the tracks of a player (current track first, if `has_current`, and queue)
+      as encoded tracks and their requester IDs: {'tracks': [<encoded_track>, ...], 'requesters': [...], 'has_current': <bool>}.
+      It is only rewritten when the current track or the queue changed.
+
+    NOTE: Tracks are saved encoded, so that recovered players decode them in batch instead of searching them again.
+    NOTE: When the Lavalink node restarts while the bot keeps running, lavalink.py sends the live players (current track
+    and position) to the node again once it is ready, and their queues are still in memory, so snapshots are not needed.
+    """
+    def __init__(self, data_path: str, max_age: int = 1800):
+        # Path to `player_snapshots.json`, and to the directory of track files
+        self.data_path = data_path
+        self.tracks_path = os.path.splitext(data_path)[0]
+
+        # Age (in seconds) after which saved snapshots are no longer recovered
+        self.max_age = max_age
+
+        # Saved state of players: {<guild_id>: state}, and when it was saved (unix timestamp)
+        self.players, self.saved_at = self.load_snapshots()
+
+        # Key of the saved tracks of each player (player revision and queue version), to tell if they changed
+        self._tracks_keys: Dict[str, tuple] = {}
+
+        # Set once saved snapshots were recovered (on startup), before which saving would overwrite them
+        self.recovered = asyncio.Event()
+
+        # Counters: state and track files written
+        self.state_writes = 0
+        self.tracks_writes = 0
+
+    ######################################
+    ############### FILES ################
+    ######################################
+
+    def load_snapshots(self) -> Tuple[dict, float]:
+        """Load players state from the `player_snapshots.json` file if it exists, otherwise return an empty dictionary."""
+        try:
+            with open(self.data_path, 'r', encoding="utf-8") as file:
+                data = json.load(file)
+                logger.info(f'Player snapshots loaded from `player_snapshots.json` ({len(data.get("players", {}))} players).')
+                return data.get('players', {}), data.get('saved_at', 0)
+        except FileNotFoundError:
+            return {}, 0
+        except Exception as e:
+            logger.error(f'Failed to load player snapshots: {e}')
+            return {}, 0
+
+    def _write(self, path: str, data: Any):
+        """Writes data to a JSON file, replacing it atomically (a crash mid-write keeps the previous file)."""
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w', encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    def _tracks_file(self, guild_id: str):
+        return os.path.join(self.tracks_path, f'{guild_id}.json')
+
+    def _remove_tracks(self, guild_id: str):
+        """Removes the track file of a player, if it exists."""
+        self._tracks_keys.pop(guild_id, None)
+        try:
+            os.remove(self._tracks_file(guild_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f'Failed to remove player snapshot tracks of guild {guild_id}: {e}')
+
+    ######################################
+    ############### SAVE #################
+    ######################################
+
+    def save(self, players: List[Tuple[Any, int]]):
+        """
+        Saves snapshots of the given active players, as (player, voice channel ID) pairs. Players saved before and no longer
+        given are removed. Track files are only written for players whose current track or queue changed.
+
+        Returns the number of track files written.
+        """
+        players_state = {}
+        written = 0
+        for player, channel_id in players:
+            guild_id = str(player.guild_id)
+
+            # Write tracks, if current track or queue changed
+            key = (player.revision, player.queue.version)
+            if self._tracks_keys.get(guild_id) != key:
+                snapshot = PlayerSnapshot(player, channel_id)
+                snapshot.compact()
+                try:
+                    os.makedirs(self.tracks_path, exist_ok=True)
+                    self._write(self._tracks_file(guild_id), {
+                        'tracks': snapshot.encoded_tracks,
+                        'requesters': snapshot.requesters.tolist(),
+                        'has_current': snapshot.has_current
+                    })
+                except Exception as e:
+                    logger.error(f'Failed to save player snapshot tracks of guild {guild_id}: {e}')
+                    continue
+                self._tracks_keys[guild_id] = key
+                written += 1
+
+            # Player state
+            players_state[guild_id] = {
+                'channel_id': channel_id,
+                'position': player.position if player.current and not player.current.is_stream else 0,
+                'paused': player.paused,
+                'volume': player.volume,
+                'loop': player.loop,
+                'autoplay': player.fetch('autoplay', default=False)
+            }
+
+        # Remove tracks of players no longer active
+        for guild_id in (self.players.keys() | self._tracks_keys.keys()) - players_state.keys():
+            self._remove_tracks(guild_id)
+
+        # Write players state, if it changed or there are active players (to record that their snapshots are still current,
+        # as eg. players on a stream or paused keep the same state)
+        if players_state != self.players or players_state:
+            try:
+                self._write(self.data_path, {'saved_at': time.time(), 'players': players_state})
+            except Exception as e:
+                logger.error(f'Failed to save player snapshots: {e}')
+                return written
+            self.players, self.saved_at = players_state, time.time()
+            self.state_writes += 1
+        self.tracks_writes += written
+        return written
+
+    ######################################
+    ############## RECOVERY ##############
+    ######################################
+
+    def is_stale(self):
+        """Returns True if the saved snapshots are older than `max_age` (too old to be recovered)."""
+        return time.time() - self.saved_at > self.max_age
+
+    def get_snapshot(self, guild_id: int) -> Optional[Tuple[PlayerSnapshot, bool]]:
+        """
+        Get the saved snapshot of a guild player (compacted PlayerSnapshot) and whether it was paused.
+        Returns None if it doesn't exist or its tracks can't be read.
+        """
+        state = self.players.get(str(guild_id))
+        if not state:
+            return None
+        try:
+            with open(self._tracks_file(str(guild_id)), 'r', encoding="utf-8") as file:
+                tracks = json.load(file)
+        except Exception as e:
+            logger.error(f'Failed to load player snapshot tracks of guild {guild_id}: {e}')
+            return None
+        snapshot = PlayerSnapshot.from_compact(
+            guild_id, state['channel_id'], tracks['tracks'], tracks['requesters'], tracks['has_current'],
+            state['position'], state['volume'], state['loop'], state['autoplay']
+        )
+        return snapshot, state['paused']
+
+    def guild_ids(self) -> List[int]:
+        """Returns the IDs of the guilds with a saved player snapshot."""
+        return [int(guild_id) for guild_id in self.players]
@@ -1,48 +1,45 @@
 import discord
-import random
-from assets.utils.reply_embed import error_embed, success_embed, warning_embed
-
-class PlaylistButton(discord.ui.Button):
-    """Class inherited from discord.ui.Button to handle MusicPlayerView Playlist buttons."""
-    def __init__(self, url: str, shuffle: bool, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.pl_url = url
-        self.shuffle = shuffle
+from discord.ui import Button
+from assets.music.playerbutton import PlayerButton
+from assets.utils.reply_embed import error_embed
+
+class PlaylistButton(PlayerButton, template=r'vibebot_playlist_(?P<name>.+)_(?P<guild_id>[0-9]+)'):
+    """
+    Music message saved playlist button, as a dynamic item (see PlayerButton), with custom_id `vibebot_playlist_<name>_<guild_id>`.
+    The playlist settings are read from guild music data when the button is clicked.
+    """
+    def __init__(self, name: str, guild_id: int, **kwargs):
+        super().__init__(f'playlist_{name}', guild_id, **kwargs)
+        self.action = 'playlist'
+        self.pl_name = name
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        """Creates the item for a clicked button, from its custom_id."""
+        button = cls(match['name'], int(match['guild_id']))
+        button.cog = interaction.client.get_cog("MusicCog")
+        button.guild = interaction.guild
+        return button
     
-    async def callback(self, interaction: discord.Interaction):
+    async def playlist_callback(self, interaction: discord.Interaction):
         """
         Callback for when a playlist button is clicked.
 
-        Adds playlists to guilds player queue.
+        Adds playlists to guilds player queue, from the saved playlist snapshot.
         It does not needs to update MusicPlayerView.
-        It needs to update music message embed, if shuffle is True.
+        It does not needs to update music message embed, as it is already handled when adding to queue.
 
-        NOTE: This  buttons is to be used in MusicPLayerView, hence join_and_check() will be ran there as interaction_check.
+        NOTE: check_and_join() is ran before, in PlayerButton interaction_check.
         """
-        # Get guild player
-        player = self.view.cog.lavalink.player_manager.get(interaction.guild.id)
-
-        # Is shuffle is True, set lavalink shuffle for random first song
-        player.set_shuffle(self.shuffle)
-
-        # Add playlists url to queue
-        add_to_queue_check = await self.view.cog.add_to_queue(self.pl_url, interaction.user, interaction.guild)
+        # Get playlist settings
+        playlist = self.cog.get_guild_music_data(self.guild.id).get('playlists', {}).get(self.pl_name)
+        if not playlist:
+            await interaction.followup.send(embed=error_embed(f'Playlist `{self.pl_name}` not found.'), ephemeral=True)
+            return
 
-        # Set lavalink shuffle to False
-        player.set_shuffle(False)
+        # Add playlist to queue
+        add_to_queue_check = await self.cog.add_playlist_to_queue(self.pl_name, playlist.get('url'), playlist.get('shuffle', False), interaction.user, interaction.guild)
 
         # If add_to_queue_check is not None, something went wrong
         if add_to_queue_check:
-            await interaction.response.send_message(embed=error_embed(add_to_queue_check), delete_after=15)
-            return
-        
-        # Defer the interaction
-        await interaction.response.defer()
-
-        # Shuffle rest of queue if shuffle is True
-        if self.shuffle:
-            random.shuffle(player.queue)
-
-            # Update music message embed
-            await self.view.cog.update_music_embed(interaction.guild)
-        
+            interaction.client.timers.expire_message(await interaction.followup.send(embed=error_embed(add_to_queue_check), wait=True), 15)
@@ -0,0 +1,33 @@
+import random
+from typing import List
+
+class PlaylistCursor:
+    """
+    Lazy cursor over the tracks of a large playlist that were not yet added to the player queue.
+
+    Tracks are kept as compact base64 encoded strings, and are only decoded into AudioTracks one page at a time,
+    when the player queue runs low. This keeps memory bounded and adding to queue fast, even for playlists with
+    thousands of tracks.
+    """
+    __slots__ = ('encoded_tracks', 'requester')
+
+    def __init__(self, encoded_tracks: List[str], requester: int):
+        # Encoded tracks not yet added to queue, in order
+        self.encoded_tracks = encoded_tracks
+
+        # ID of the requester of the playlist, to be set in each track
+        self.requester = requester
+
+    def __len__(self):
+        """Number of tracks not yet added to queue."""
+        return len(self.encoded_tracks)
+
+    def take(self, amount: int):
+        """Removes and returns the next `amount` encoded tracks."""
+        page = self.encoded_tracks[:amount]
+        del self.encoded_tracks[:amount]
+        return page
+
+    def shuffle(self):
+        """Shuffles the tracks not yet added to queue."""
+        random.shuffle(self.encoded_tracks)
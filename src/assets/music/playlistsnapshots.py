@@ -0,0 +1,135 @@
+from discord.ext import commands
+import json
+import time
+from typing import Optional
+from lavalink.server import LoadType
+from assets.logger.logger import music_data_logger as logger
+
+class PlaylistSnapshots:
+    """
+    Class to manage saved playlists snapshots.
+
+    A snapshot is a saved playlist resolved once through Lavalink and stored as a list of encoded tracks, so that playing
+    a saved playlist doesn't require any search. Snapshots are stored in `playlist_snapshots.json` in the format:
+    {<guild_id>: {<playlist_name>: {'url': <url>, 'tracks': [<encoded_track>, ...], 'updated_at': <unix timestamp>}}}
+    """
+    def __init__(self, bot: commands.Bot, data_path: str, max_age: int = 24*3600):
+        # Bot Instance
+        self.bot = bot
+
+        # Path to `playlist_snapshots.json`
+        self.data_path = data_path
+
+        # Age (in seconds) after which a snapshot is refreshed in the background
+        self.max_age = max_age
+
+        # Initialize data
+        self.data = self.load_snapshots()
+
+    def load_snapshots(self):
+        """Load snapshots from the `playlist_snapshots.json` file if it exists, otherwise return an empty dictionary."""
+        try:
+            with open(self.data_path, 'r', encoding="utf-8") as file:
+                data = json.load(file)
+                logger.info('Playlist snapshots loaded from `playlist_snapshots.json`.')
+                return data
+        except FileNotFoundError:
+            logger.warning('`playlist_snapshots.json` not found, setting playlist snapshots to an empty dictionary.')
+            return {}
+        except Exception as e:
+            logger.error(f'Failed to load playlist snapshots: {e}')
+            return {}
+
+    def save_snapshots(self):
+        """Save snapshots to the `playlist_snapshots.json` file."""
+        try:
+            with open(self.data_path, 'w', encoding="utf-8") as file:
+                json.dump(self.data, file, ensure_ascii=False)
+                logger.info('Playlist snapshots saved to `playlist_snapshots.json`.')
+        except Exception as e:
+            logger.error(f'Failed to save playlist snapshots: {e}')
+
+    def get_snapshot(self, guild_id: int, name: str) -> Optional[dict]:
+        """Get snapshot of the specified guild playlist. Returns None if it doesn't exist."""
+        return self.data.get(str(guild_id), {}).get(name)
+
+    def remove_snapshot(self, guild_id: int, name: str):
+        """Remove snapshot of the specified guild playlist, if it exists."""
+        if self.data.get(str(guild_id), {}).pop(name, None) is not None:
+            if not self.data[str(guild_id)]:
+                self.data.pop(str(guild_id), None)
+            self.save_snapshots()
+
+    def remove_guild(self, guild_id: int):
+        """Remove all snapshots of the specified guild, if any."""
+        if self.data.pop(str(guild_id), None) is not None:
+            self.save_snapshots()
+
+    def is_stale(self, snapshot: Optional[dict]):
+        """Returns True if the snapshot doesn't exist or is older than `max_age`."""
+        return not snapshot or time.time() - snapshot.get('updated_at', 0) > self.max_age
+
+    async def refresh_snapshot(self, guild_id: int, name: str, url: str, save: bool = True):
+        """
+        Resolve the playlist url through Lavalink and store its tracks as the playlist snapshot.
+
+        If successful returns False. Otherwise, it returns a string with the warning/error.
+        """
+        # Check if there is any lavalink nodes available
+        lavalink_client = getattr(self.bot, 'lavalink', None)
+        if not lavalink_client or not lavalink_client.node_manager.available_nodes:
+            return 'No lavalink nodes available.'
+
+        # Get the results for the playlist from Lavalink
+        try:
+            results = await lavalink_client.get_tracks(url)
+        except Exception as e:
+            logger.error(f'Failed to resolve playlist `{name}` for guild {guild_id}: {e}')
+            return 'I encountered an error while loading that playlist.'
+
+        if results.load_type == LoadType.EMPTY or not results.tracks:
+            return 'No tracks found for that playlist.'
+        elif results.load_type == LoadType.ERROR:
+            return 'I encountered an error while loading that playlist.'
+
+        # Store snapshot
+        self.data.setdefault(str(guild_id), {})[name] = {
+            'url': url,
+            'tracks': [track.track for track in results.tracks if track.track],
+            'updated_at': time.time()
+        }
+        logger.info(f'Playlist snapshot `{name}` for guild {guild_id} refreshed ({len(results.tracks)} tracks).')
+
+        # Save snapshots
+        if save:
+            self.save_snapshots()
+
+        return False
+
+    async def refresh_stale_snapshots(self, playlists_by_guild: dict):
+        """
+        Refresh every snapshot that is missing or older than `max_age`.
+
+        Args:
+            playlists_by_guild - Dictionary in the format {<guild_id>: <guild playlists dict from music data>}.
+
+        Returns the number of refreshed snapshots.
+        """
+        refreshed = 0
+        for guild_id, playlists in playlists_by_guild.items():
+            # Drop snapshots of playlists that no longer exist
+            for name in list(self.data.get(str(guild_id), {})):
+                if name not in playlists:
+                    self.data[str(guild_id)].pop(name, None)
+
+            # Refresh missing, stale or outdated (url changed) snapshots
+            for name, playlist in playlists.items():
+                snapshot = self.get_snapshot(guild_id, name)
+                if self.is_stale(snapshot) or snapshot.get('url') != playlist.get('url'):
+                    if not await self.refresh_snapshot(guild_id, name, playlist.get('url'), save=False):
+                        refreshed += 1
+
+        # Save snapshots once for all refreshes
+        self.save_snapshots()
+
+        return refreshed
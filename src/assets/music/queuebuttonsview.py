@@ -2,45 +2,63 @@ import discord
 from discord import SelectOption
 from discord.ext import commands
 from discord.ui import Button, View, Select
+from assets.music.queuesnapshot import QueueSnapshot
+
+# Maximum number of options in a Discord select
+SELECT_MAX_OPTIONS = 25
+
+# Number of pages skipped by the jump buttons
+PAGE_JUMP = 10
 
 class QueueButtonsView(View):
-    """A view with queue buttons, to be used with /queue."""
+    """
+    A view with queue buttons, to be used with /queue.
+
+    Pages are shown from a QueueSnapshot, which is only taken again on refresh if the queue changed.
+    """
     def __init__(self,
                  cog: commands.Cog,
                  guild: discord.Guild,
-                 current_page: int,
-                 total_pages: int):
+                 snapshot: QueueSnapshot,
+                 current_page: int = 1):
         super().__init__()
         self.cog = cog
         self.guild = guild
+        self.snapshot = snapshot
         self.current_page = current_page
 
         # Initialize buttons
-        self.update_buttons(total_pages)
+        self.update_buttons()
 
     ######################################
     ############## UPDATES ###############
     ######################################
 
-    def update_buttons(self, total_pages: int):
+    def update_buttons(self):
         """
         Update button states based on current page and total pages.
-        
+
         Buttons:
+        - Page selector (Dropdown), with a window of up to 25 pages around current page
+        - First page
         - Previous page
         - Refresh
         - Next page
-        - Page selector (Dropdown)
+        - Last page
+        - Jump back/forward 10 pages (only if there are more than 10 pages)
 
         NOTE: This view os not persistent, hence after bot restarts, interations requested before will fail.
         """
         # Clear previous buttons
         self.clear_items()
+        total_pages = self.snapshot.total_pages
 
-        # Page selector (Dropdown)
+        # Page selector (Dropdown), with a sliding window of pages centered on current page
+        first = max(1, min(self.current_page - SELECT_MAX_OPTIONS // 2, total_pages - SELECT_MAX_OPTIONS + 1))
+        last = min(total_pages, first + SELECT_MAX_OPTIONS - 1)
         options = [
-            discord.SelectOption(label=f"Page {i}/{total_pages}", value=str(i), default=(i == self.current_page))
-            for i in range(1, total_pages + 1)
+            SelectOption(label=f"Page {i}/{total_pages}", value=str(i), default=(i == self.current_page))
+            for i in range(first, last + 1)
         ]
         page_selector = Select(
             options=options,
@@ -49,86 +67,64 @@ class QueueButtonsView(View):
         page_selector.callback = self.page_select_callback
         self.add_item(page_selector)
 
-        # Previous page button
-        previous_page = Button(
-            style=discord.ButtonStyle.grey,
-            label='◁',
-            row=1,
-            disabled=self.current_page == 1
-        )
-        previous_page.callback = self.previous_page_callback
-        self.add_item(previous_page)
-
-        # Refresh button
-        refresh = Button(
-            style=discord.ButtonStyle.blurple,
-            label='⟳',
-            row=1,
-        )
-        refresh.callback = self.refresh_callback
-        self.add_item(refresh)
-
-        # Next page button
-        next_page = Button(
-            style=discord.ButtonStyle.grey,
-            label='▷',
-            row=1,
-            disabled=self.current_page >= total_pages
-        )
-        next_page.callback = self.next_page_callback
-        self.add_item(next_page)
+        # Navigation buttons: (label, style, page to go to, disabled)
+        buttons = [
+            ('|◁', discord.ButtonStyle.grey, 1, self.current_page == 1),
+            ('◁', discord.ButtonStyle.grey, self.current_page - 1, self.current_page == 1),
+            ('⟳', discord.ButtonStyle.blurple, None, False),
+            ('▷', discord.ButtonStyle.grey, self.current_page + 1, self.current_page >= total_pages),
+            ('▷|', discord.ButtonStyle.grey, total_pages, self.current_page >= total_pages),
+        ]
+        for label, style, page, disabled in buttons:
+            button = Button(style=style, label=label, row=1, disabled=disabled)
+            button.callback = self.refresh_callback if page is None else self.go_to_page_callback(page)
+            self.add_item(button)
+
+        # Jump buttons
+        if total_pages > PAGE_JUMP:
+            jump_back = Button(
+                style=discord.ButtonStyle.grey,
+                label=f'-{PAGE_JUMP}',
+                row=2,
+                disabled=self.current_page == 1
+            )
+            jump_back.callback = self.go_to_page_callback(max(1, self.current_page - PAGE_JUMP))
+            self.add_item(jump_back)
+
+            jump_forward = Button(
+                style=discord.ButtonStyle.grey,
+                label=f'+{PAGE_JUMP}',
+                row=2,
+                disabled=self.current_page >= total_pages
+            )
+            jump_forward.callback = self.go_to_page_callback(min(total_pages, self.current_page + PAGE_JUMP))
+            self.add_item(jump_forward)
 
     ######################################
     ######### AUXILIAR FUNCTIONS #########
     ######################################
 
+    def get_embed(self):
+        """Creates the embed of the current page, from the queue snapshot."""
+        return self.cog.queue_embed(self.guild,
+                                    self.snapshot.current_track,
+                                    self.snapshot.page(self.current_page),
+                                    len(self.snapshot),
+                                    self.snapshot.queue_time,
+                                    self.current_page,
+                                    self.snapshot.total_pages,
+                                    self.snapshot.pending)
+
     async def _callback(self, interaction: discord.Interaction):
         """Handles the callbacks after current page is updated."""
-        # Get player for this guild
-        player = self.cog.lavalink.player_manager.get(interaction.guild.id) if self.cog.lavalink else None
-
-        # Get current track
-        current_track = player.current if player else None
-
-        # Get queue list
-        queue = player.queue if player else []
-
-        # Get queue size
-        queue_size = len(queue)
-
-        # Get queue time in ms
-        queue_time = 0
-        queue_time = sum(t.duration for t in queue if not t.is_stream)
-        queue_time += current_track.duration if current_track and not current_track.is_stream else 0
-
-        # Gat total number of pages
-        total_pages = queue_size // 10
-        total_pages += 1 if queue_size % 10 or queue_size == 0 else 0
-
         # Check if valid current_page
-        if self.current_page > total_pages:
-            self.current_page = total_pages
-
-        # Get Queue to show
-        if queue_size > 10:
-            show_queue = queue[self.current_page*10-10:self.current_page*10]
-        else:
-            show_queue = queue
-        
-        # Create embed
-        embed = self.cog.queue_embed(interaction.guild, 
-                                 current_track, 
-                                 show_queue, 
-                                 queue_size, 
-                                 queue_time,
-                                 self.current_page,
-                                 total_pages)
+        self.current_page = max(1, min(self.current_page, self.snapshot.total_pages))
 
         # Update View
-        self.update_buttons(total_pages)
+        self.update_buttons()
 
         # Send embed
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
     ######################################
     ############# CALLBACKS ##############
@@ -142,24 +138,28 @@ class QueueButtonsView(View):
         # Run callback
         await self._callback(interaction)
 
-    async def previous_page_callback(self, interaction: discord.Interaction):
-        """"Handle previous page button callback. Show previous queue page."""
-        # Decrement current page
-        self.current_page -= 1
+    def go_to_page_callback(self, page: int):
+        """Returns a button callback that shows the given queue page."""
+        async def callback(interaction: discord.Interaction):
+            # Set current page
+            self.current_page = page
 
-        # Run callback
-        await self._callback(interaction)
-
-    async def next_page_callback(self, interaction: discord.Interaction):
-        """"Handle next page button callback. Show next queue page."""
-        # Increment current page
-        self.current_page += 1
+            # Run callback
+            await self._callback(interaction)
+        return callback
 
-        # Run callback
-        await self._callback(interaction)
-    
     async def refresh_callback(self, interaction: discord.Interaction):
-        """"Handle refresh button callback. Refresh embed to update queue."""
+        """"Handle refresh button callback. Take a new queue snapshot and refresh embed, only if the queue changed."""
+        # Get player for this guild
+        player = self.cog.lavalink.player_manager.get(interaction.guild.id) if self.cog.lavalink else None
+
+        # If queue didn't change, there is nothing to re-render
+        if QueueSnapshot.version_of(player) == self.snapshot.version:
+            await interaction.response.defer()
+            return
+
+        # Take new snapshot
+        self.snapshot = QueueSnapshot(player, self.cog.get_pending_count(player))
+
         # Run callback
         await self._callback(interaction)
-        
\ No newline at end of file
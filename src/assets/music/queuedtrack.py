@@ -0,0 +1,110 @@
+import sys
+import weakref
+from lavalink import AudioTrack
+from typing import Any, Union
+from assets.music.tracks import decode_track
+
+class TrackInfo:
+    """
+    Immutable metadata of a track, shared (flyweight) by every QueuedTrack of the same track, in any guild.
+
+    Only the fields used to play and display queued tracks are kept. Author and title strings are interned.
+    """
+    __slots__ = ('track', 'title', 'author', 'duration', 'uri', 'is_stream', 'is_seekable', '__weakref__')
+
+    # Shared TrackInfos by encoded track. Entries are dropped once no QueuedTrack uses them.
+    _cache: 'weakref.WeakValueDictionary[str, TrackInfo]' = weakref.WeakValueDictionary()
+
+    def __init__(self, track: AudioTrack):
+        self.track = track.track
+        self.title = sys.intern(track.title)
+        self.author = sys.intern(track.author)
+        self.duration = track.duration
+        self.uri = track.uri
+        self.is_stream = track.is_stream
+        self.is_seekable = track.is_seekable
+
+    @classmethod
+    def get(cls, track: AudioTrack):
+        """Returns the shared TrackInfo of the track, creating it if it doesn't exist."""
+        info = cls._cache.get(track.track)
+        if info is None:
+            info = cls(track)
+            cls._cache[track.track] = info
+        return info
+
+class QueuedTrack:
+    """
+    Compact record of a track in a player queue (or history): the shared TrackInfo and the requester ID.
+
+    It exposes the same attributes as AudioTrack used to display queues (title, author, duration, uri, is_stream,
+    is_seekable, requester), so it can be shown without building the full AudioTrack. The AudioTrack is only built
+    when the track is played, with `to_audio_track()`.
+    """
+    __slots__ = ('info', 'requester')
+
+    def __init__(self, info: TrackInfo, requester: int = 0):
+        self.info = info
+        self.requester = requester
+
+    @property
+    def track(self):
+        return self.info.track
+
+    @property
+    def title(self):
+        return self.info.title
+
+    @property
+    def author(self):
+        return self.info.author
+
+    @property
+    def duration(self):
+        return self.info.duration
+
+    @property
+    def uri(self):
+        return self.info.uri
+
+    @property
+    def is_stream(self):
+        return self.info.is_stream
+
+    @property
+    def is_seekable(self):
+        return self.info.is_seekable
+
+    def to_audio_track(self):
+        """
+        Builds the full AudioTrack to be played, decoding the encoded track locally.
+        If the track can't be decoded locally, it is built from the kept fields instead (enough to be played).
+        """
+        track = decode_track(self.info.track)
+        if track is None:
+            track = AudioTrack({
+                'encoded': self.info.track,
+                'info': {
+                    'identifier': '',
+                    'isSeekable': self.info.is_seekable,
+                    'author': self.info.author,
+                    'length': self.info.duration,
+                    'isStream': self.info.is_stream,
+                    'title': self.info.title,
+                    'uri': self.info.uri,
+                },
+                'pluginInfo': {},
+                'userData': {},
+            }, 0)
+        track.requester = self.requester
+        return track
+
+def requester_id(requester: Any):
+    """Returns the ID of a requester, which may be a discord user/member or already an ID."""
+    return getattr(requester, 'id', requester) or 0
+
+def compact_track(track: Union[AudioTrack, QueuedTrack]):
+    """Returns the QueuedTrack of an AudioTrack. Tracks that can't be compacted (no encoded track) are kept as they are."""
+    if not isinstance(track, AudioTrack) or not track.track:
+        return track
+    return QueuedTrack(TrackInfo.get(track), requester_id(track.requester))
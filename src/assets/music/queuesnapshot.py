@@ -0,0 +1,53 @@
+from typing import Any, Optional
+
+class QueueSnapshot:
+    """
+    Snapshot of a player queue, used by /queue pagination (QueueButtonsView).
+
+    Pages are sliced from the snapshot on demand, so browsing pages never reads the live queue. The snapshot keeps the
+    version of the queue it was taken from, so that it is only taken again when the queue actually changed.
+    """
+    __slots__ = ('version', 'current_track', 'tracks', 'queue_time', 'pending')
+
+    # Number of tracks per page
+    PAGE_SIZE = 10
+
+    def __init__(self, player: Optional[Any], pending: int = 0):
+        # Version of the queue when snapshot was taken
+        self.version = self.version_of(player)
+
+        # Current track and queued tracks (queued tracks are immutable, so a shallow copy is enough)
+        self.current_track = player.current if player else None
+        self.tracks = list(player.queue) if player else []
+
+        # Queue time in ms (including current track), from queue aggregate
+        self.queue_time = player.queue.total_duration if player else 0
+        if self.current_track and not self.current_track.is_stream:
+            self.queue_time += self.current_track.duration
+
+        # Number of pending playlist tracks not yet in queue
+        self.pending = pending
+
+    @staticmethod
+    def version_of(player: Optional[Any]):
+        """
+        Returns the version of the player queue and current track. Changes whenever the queue or current track change.
+
+        NOTE: Uses the player revision (a counter) instead of the identity of the queue and current track, as the address
+        of a freed track can be reused by a later one.
+        """
+        if not player:
+            return None
+        return (player.revision, player.queue.version)
+
+    def __len__(self):
+        return len(self.tracks)
+
+    @property
+    def total_pages(self):
+        """Number of pages (at least 1)."""
+        return max(1, -(-len(self.tracks) // self.PAGE_SIZE))
+
+    def page(self, page: int):
+        """Returns the tracks of the given page (starting at 1)."""
+        return self.tracks[(page-1)*self.PAGE_SIZE:page*self.PAGE_SIZE]
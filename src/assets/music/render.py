@@ -0,0 +1,67 @@
+import weakref
+from typing import Any, Iterable
+
+# Rendered lines of queued tracks, by shared TrackInfo (see queuedtrack.py).
+# Lines don't include the track position, so they stay valid when the queue changes, and are dropped with the track.
+_lines: 'weakref.WeakKeyDictionary[Any, str]' = weakref.WeakKeyDictionary()
+_link_lines: 'weakref.WeakKeyDictionary[Any, str]' = weakref.WeakKeyDictionary()
+
+def format_duration(ms: int, hours: bool = False):
+    """Formats milliseconds as `hh:mm:ss` if longer than an hour (or if `hours` is True), otherwise as `mm:ss`."""
+    ms = int(ms)
+    if hours or ms >= 3600000:
+        return f'{str(ms // 3600000).zfill(2)}:{(ms % 3600000) // 60000:02d}:{(ms % 60000) // 1000:02d}'
+    return f'{str(ms // 60000).zfill(2)}:{ms % 60000 // 1000:02d}'
+
+def format_track_duration(track: Any):
+    """Formats the duration of a track, or `LIVE` for streams."""
+    return 'LIVE' if track.is_stream else format_duration(track.duration)
+
+def _cached(cache: weakref.WeakKeyDictionary, track: Any, render):
+    """Returns the cached line of a queued track, rendering it if needed. Tracks without TrackInfo are not cached."""
+    info = getattr(track, 'info', None)
+    if info is None:
+        return render(track)
+    line = cache.get(info)
+    if line is None:
+        line = render(track)
+        cache[info] = line
+    return line
+
+def _render_line(track: Any):
+    return (
+        f'{track.author} - {track.title} - `{format_track_duration(track)}`'
+        if track.is_seekable else
+        f'{track.uri} - `{format_track_duration(track)}`'
+    )
+
+def _render_link_line(track: Any):
+    return (
+        f'[{track.author} - {track.title}]({track.uri}) - `{format_track_duration(track)}`'
+        if track.is_seekable else
+        f'{track.uri} - `{format_track_duration(track)}`'
+    )
+
+def track_line(track: Any):
+    """Line of a track in the music message queue list: `<author> - <title> - `<duration>``."""
+    return _cached(_lines, track, _render_line)
+
+def track_link_line(track: Any):
+    """Line of a track in the queue embed, with link: `[<author> - <title>](<uri>) - `<duration>``."""
+    return _cached(_link_lines, track, _render_link_line)
+
+def music_queue_list(queue: Any, shown: int = 15):
+    """
+    Queue list of the music message: the next `shown` tracks, from last to first, preceded by the number of tracks not shown.
+    Only the shown tracks are read from the queue.
+    """
+    queue_size = len(queue)
+    queue_list = '__**Queue list:**__\n'
+    if queue_size > shown:
+        queue_list += f'\nAnd **{queue_size-shown}** more...'
+    lines = [f'\n**{position}.** {track_line(track)}' for position, track in enumerate(queue[:shown], start=1)]
+    return queue_list + ''.join(reversed(lines))
+
+def queue_page(tracks: Iterable[Any], start: int):
+    """Lines of a queue embed page, where `start` is the position of the first track."""
+    return ''.join(f'**[{position}]** `-` {track_link_line(track)}\n' for position, track in enumerate(tracks, start=start))
@@ -0,0 +1,141 @@
+import asyncio
+import time
+import lavalink
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from assets.utils.taskregistry import TaskRegistry
+
+class SearchCache:
+    """
+    Class to cache Lavalink search results, used by `/play` query autocomplete.
+
+    - Search results are cached by normalized query, with a time to live and a maximum size (LRU).
+    - Searches are debounced per user: a search only starts if the user didn't type again during `debounce` seconds.
+    - Concurrent autocompletes for the same query share a single search.
+    - Autocompletes always answer before `deadline` seconds: if a fresh search takes too long, the results cached for
+      the longest prefix of the query are served instead, while the search keeps running in the background to fill the cache.
+    - Suggested tracks are stored by token (used as the autocomplete choice value), so that the chosen suggestion
+      can be added to queue without a second search.
+    - Searches run in tasks of the bot TaskRegistry, owned by 'search_cache'.
+    """
+    # Prefix of the tokens used as autocomplete choice values
+    TOKEN_PREFIX = 'vibebot:track:'
+
+    def __init__(self, task_registry: TaskRegistry, max_size: int = 512, ttl: float = 600, debounce: float = 0.3, deadline: float = 2.5, max_results: int = 10):
+        self.task_registry = task_registry
+        self.max_size = max_size
+        self.ttl = ttl
+        self.debounce = debounce
+        self.deadline = deadline
+        self.max_results = max_results
+
+        # Cached search results: {normalized query: (timestamp, [AudioTrack, ...])}
+        self.results: OrderedDict[str, tuple] = OrderedDict()
+
+        # Suggested tracks by token: {token: AudioTrack}
+        self.tracks: OrderedDict[str, lavalink.AudioTrack] = OrderedDict()
+        self._next_token = 0
+
+        # In-flight searches by normalized query
+        self.pending: Dict[str, asyncio.Task] = {}
+
+        # Last autocomplete request of each user, used for debouncing
+        self.user_requests: Dict[int, int] = {}
+
+    @staticmethod
+    def normalize(query: str):
+        """Normalize query to be used as cache key."""
+        return ' '.join(query.lower().split())
+
+    def get(self, query: str) -> Optional[List[lavalink.AudioTrack]]:
+        """Returns the cached results for the query if they exist and are not expired, otherwise None."""
+        key = self.normalize(query)
+        cached = self.results.get(key)
+        if not cached:
+            return None
+        if time.monotonic() - cached[0] > self.ttl:
+            self.results.pop(key, None)
+            return None
+        self.results.move_to_end(key)
+        return cached[1]
+
+    def put(self, query: str, tracks: List[lavalink.AudioTrack]):
+        """Cache the results for the query."""
+        self.results[self.normalize(query)] = (time.monotonic(), tracks[:self.max_results])
+        self.results.move_to_end(self.normalize(query))
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def prefix_match(self, query: str) -> List[lavalink.AudioTrack]:
+        """
+        Returns the cached results of the longest cached prefix of the query, filtered by the words of the query
+        when possible. Returns an empty list if there is no cached prefix.
+        """
+        key = self.normalize(query)
+        for end in range(len(key), 0, -1):
+            tracks = self.get(key[:end])
+            if tracks:
+                words = key.split()
+                filtered = [
+                    track for track in tracks
+                    if all(word in f'{track.author} {track.title}'.lower() for word in words[:-1])
+                ]
+                return filtered or tracks
+        return []
+
+    def store_track(self, track: lavalink.AudioTrack):
+        """Store a suggested track and return its token."""
+        self._next_token += 1
+        token = f'{self.TOKEN_PREFIX}{self._next_token}'
+        self.tracks[token] = track
+        while len(self.tracks) > self.max_size * self.max_results:
+            self.tracks.popitem(last=False)
+        return token
+
+    def get_track(self, token: str) -> Optional[lavalink.AudioTrack]:
+        """Returns the suggested track for the token, otherwise None."""
+        return self.tracks.get(token) if token.startswith(self.TOKEN_PREFIX) else None
+
+    async def _search(self, node: lavalink.Node, query: str):
+        """Search the query in Lavalink and cache its results."""
+        try:
+            results = await node.get_tracks(f'spsearch:{query}')
+            tracks = results.tracks if results.tracks else []
+        except Exception:
+            tracks = []
+        self.put(query, tracks)
+        return tracks
+
+    def search(self, node: lavalink.Node, query: str) -> asyncio.Task:
+        """Returns the in-flight search task for the query, or starts a new one."""
+        key = self.normalize(query)
+        task = self.pending.get(key)
+        if task is None:
+            task = self.task_registry.spawn(self._search(node, query), owner='search_cache', category='search')
+            self.pending[key] = task
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        return task
+
+    async def autocomplete(self, node: lavalink.Node, user_id: int, query: str) -> List[lavalink.AudioTrack]:
+        """Returns track suggestions for the query, always within `deadline` seconds."""
+        start = time.monotonic()
+
+        # Serve fresh cached results
+        cached = self.get(query)
+        if cached is not None:
+            return cached
+
+        # Debounce: only search if the user didn't type again meanwhile
+        request_id = self.user_requests.get(user_id, 0) + 1
+        self.user_requests[user_id] = request_id
+        await asyncio.sleep(self.debounce)
+        if self.user_requests.get(user_id) != request_id:
+            return self.prefix_match(query)
+        self.user_requests.pop(user_id, None)
+
+        # Search, serving cached prefix results if the search doesn't finish before the deadline
+        task = self.search(node, query)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=max(0, self.deadline - (time.monotonic() - start)))
+        except asyncio.TimeoutError:
+            return self.prefix_match(query)
@@ -0,0 +1,86 @@
+import json
+import os
+from typing import List
+
+# Supported track list attachment extensions
+TRACK_LIST_EXTENSIONS = ('.txt', '.m3u', '.m3u8', '.json')
+
+# Maximum size of a track list attachment (in bytes)
+TRACK_LIST_MAX_SIZE = 256 * 1024
+
+def is_track_list(filename: str):
+    """Returns True if the attachment filename is a supported track list."""
+    return filename.lower().endswith(TRACK_LIST_EXTENSIONS)
+
+def parse_text(content: str) -> List[str]:
+    """Parse newline separated queries. Empty lines are ignored."""
+    return [line.strip() for line in content.splitlines() if line.strip()]
+
+def parse_m3u(content: str) -> List[str]:
+    """
+    Parse a M3U/M3U8 playlist.
+
+    Url entries are used as they are. For local file entries (which can't be played), the `#EXTINF` title
+    (usually `<Artist> - <Title>`) is used as query instead, or else the file name without extension.
+    """
+    queries = []
+    extinf_title = None
+    for line in parse_text(content):
+        # Store title of next entry
+        if line.upper().startswith('#EXTINF'):
+            extinf_title = line.split(',', 1)[1].strip() if ',' in line else None
+            continue
+
+        # Ignore other directives and comments
+        if line.startswith('#'):
+            continue
+
+        # Url entries are used directly, local files are searched by title
+        if line.lower().startswith(('http://', 'https://')):
+            queries.append(line)
+        else:
+            queries.append(extinf_title or os.path.splitext(os.path.basename(line.replace('\\', '/')))[0])
+        extinf_title = None
+
+    return queries
+
+def parse_json(content: str) -> List[str]:
+    """
+    Parse a JSON track list.
+
+    Accepts a list (or a dict with a `tracks` list) where each item is either a query string, or an object with
+    an `url`/`query` key, or with `title` and optionally `artist`/`author` keys.
+    """
+    data = json.loads(content)
+    if isinstance(data, dict):
+        data = data.get('tracks', [])
+    if not isinstance(data, list):
+        raise ValueError('JSON track list must be a list.')
+
+    queries = []
+    for item in data:
+        if isinstance(item, str):
+            query = item
+        elif isinstance(item, dict):
+            artist = item.get('artist') or item.get('author')
+            query = item.get('url') or item.get('query') or (
+                f"{artist} - {item['title']}" if artist and item.get('title') else item.get('title')
+            )
+        else:
+            query = None
+        if query and str(query).strip():
+            queries.append(str(query).strip())
+
+    return queries
+
+def parse_track_list(filename: str, content: str) -> List[str]:
+    """
+    Parse a track list attachment into a list of queries, according to its extension.
+    Raises ValueError if the track list is invalid.
+    """
+    filename = filename.lower()
+    if filename.endswith(('.m3u', '.m3u8')):
+        return parse_m3u(content)
+    if filename.endswith('.json'):
+        return parse_json(content)
+    return parse_text(content)
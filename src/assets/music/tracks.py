@@ -0,0 +1,69 @@
+import lavalink
+from lavalink import AudioTrack
+from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qs, urlencode
+
+# Hosts of YouTube urls that can point at a track inside a playlist (`?v=<id>&list=<id>`)
+YOUTUBE_HOSTS = ('youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com')
+
+def decode_track(encoded: str):
+    """
+    Decodes a base64 encoded Lavalink track locally, without any request to Lavalink.
+    Returns the AudioTrack, otherwise returns None if the track could not be decoded.
+
+    NOTE: `lavalink.decode_track()` stores the encoded string under the key `track`, while AudioTrack reads it from
+    `encoded`, leaving `AudioTrack.track` as None (which can't be played). Hence it is set here manually.
+    """
+    try:
+        track = lavalink.decode_track(encoded)
+    except Exception:
+        return None
+    track.track = encoded
+    return track
+
+async def decode_tracks(client: lavalink.Client, encoded_tracks: List[str]):
+    """
+    Decodes a list of base64 encoded Lavalink tracks, keeping their order.
+
+    Tracks are decoded locally whenever possible. The tracks that fail to decode locally (eg. unknown source specific
+    fields) are decoded by Lavalink in a single batch request.
+    Tracks that can't be decoded at all are skipped.
+    """
+    # Decode tracks locally
+    tracks: List[Optional[AudioTrack]] = [decode_track(encoded) for encoded in encoded_tracks]
+
+    # Decode failed tracks with Lavalink in a single request
+    failed = [i for i, track in enumerate(tracks) if track is None]
+    if failed and client and client.node_manager.available_nodes:
+        try:
+            decoded = await client.decode_tracks([encoded_tracks[i] for i in failed])
+            for i, track in zip(failed, decoded):
+                tracks[i] = track
+        except Exception:
+            pass
+
+    return [track for track in tracks if track is not None]
+
+def playlist_track_url(url: str):
+    """
+    Returns the url of the single selected track of a YouTube playlist url (eg. `watch?v=<id>&list=<id>` or
+    `youtu.be/<id>?list=<id>`), so that it can be loaded on its own before the whole playlist.
+    Returns None if the url does not select a track inside a playlist.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    query = parse_qs(parts.query)
+    if 'list' not in query:
+        return None
+
+    # youtu.be/<id>?list=<id>
+    if parts.netloc == 'youtu.be' and parts.path.strip('/'):
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+    # youtube.com/watch?v=<id>&list=<id>
+    if parts.netloc in YOUTUBE_HOSTS and parts.path == '/watch' and query.get('v'):
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode({'v': query['v'][0]}), ''))
+
+    return None
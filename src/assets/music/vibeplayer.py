@@ -0,0 +1,153 @@
+import asyncio
+from time import time, monotonic
+from typing import Optional
+from lavalink import DefaultPlayer, Event
+from assets.music.indexedqueue import IndexedQueue
+from assets.music.queuedtrack import QueuedTrack, compact_track
+from assets.logger.logger import debug_logger
+
+class TrackQueue(IndexedQueue):
+    """IndexedQueue that stores tracks as compact QueuedTracks."""
+    def _wrap(self, item):
+        return compact_track(item)
+
+class PlayerUpdatesFlushedEvent(Event):
+    """
+    Custom Lavalink event, dispatched after a VibePlayer sends its coalesced updates to Lavalink.
+
+    Attributes:
+        player - The player whose updates were sent.
+        updates - The updates sent (`volume`, `position` and/or `paused`).
+    """
+    __slots__ = ('player', 'updates')
+
+    def __init__(self, player: 'VibePlayer', updates: dict):
+        self.player = player
+        self.updates = updates
+
+class VibePlayer(DefaultPlayer):
+    """
+    Lavalink DefaultPlayer whose queue is a TrackQueue (IndexedQueue of compact QueuedTracks) instead of a list.
+
+    Assigning any iterable to `queue` (eg. `player.queue = []`, done by DefaultPlayer) converts it to a TrackQueue.
+    Tracks added to the queue (including the current track re-added by loop) are compacted, and only built back
+    into full AudioTracks when they are played.
+
+    Volume, seek and pause changes made with `queue_update()` are applied locally at once (intended state), and merged
+    within `UPDATE_WINDOW` seconds into a single Lavalink player update carrying the latest values.
+    """
+    # Window (s) in which volume, seek and pause changes are merged into a single Lavalink player update
+    UPDATE_WINDOW = 0.3
+
+    # Bot TaskRegistry, in which flush tasks are spawned (set by MusicCog on load)
+    task_registry = None
+
+    # Bumped whenever the current track changes or the queue is replaced (see `QueueSnapshot.version_of()`)
+    revision = 0
+
+    def __init__(self, guild_id: int, node):
+        super().__init__(guild_id, node)
+
+        # Pending updates, and task sending them after the update window
+        self._pending_updates: dict = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # When player was created (monotonic), so that players about to connect are not reaped
+        self.created_at = monotonic()
+
+    @property
+    def queue(self) -> TrackQueue:
+        return self._queue
+
+    @queue.setter
+    def queue(self, tracks):
+        self._queue = tracks if isinstance(tracks, TrackQueue) else TrackQueue(tracks)
+        self.revision += 1
+
+    @property
+    def current(self):
+        return self._current
+
+    @current.setter
+    def current(self, track):
+        # Set by lavalink.py on track start (including autoplay tracks played directly) and on stop
+        self._current = track
+        self.revision += 1
+
+    async def play_track(self, track, *args, **kwargs):
+        # A pending seek belongs to the previous track
+        self._pending_updates.pop('position', None)
+
+        # Build full AudioTrack from compact QueuedTrack
+        if isinstance(track, QueuedTrack):
+            track = track.to_audio_track()
+        return await super().play_track(track, *args, **kwargs)
+
+    ######################################
+    ######### COALESCED UPDATES ##########
+    ######################################
+
+    def queue_update(self, volume: Optional[int] = None, position: Optional[int] = None, paused: Optional[bool] = None):
+        """
+        Set volume, position (ms) and/or paused state of the player.
+
+        Changes are applied locally at once, so `volume`, `position` and `paused` already show the intended state (to be
+        used for feedback and further changes), and sent to Lavalink after `UPDATE_WINDOW` seconds, merged with any
+        other change made meanwhile. A `PlayerUpdatesFlushedEvent` is dispatched after they are sent.
+        """
+        now = int(time() * 1000)
+
+        # Volume
+        if volume is not None:
+            self.volume = max(min(volume, 1000), 0)
+            self._pending_updates['volume'] = self.volume
+
+        # Position (sent as the intended position when updates are flushed)
+        if position is not None and self.current:
+            self._last_position = max(min(int(position), self.current.duration), 0)
+            self._last_update = now
+            self._pending_updates['position'] = True
+
+        # Paused state (position is frozen/resumed from the intended position)
+        if paused is not None:
+            self._last_position = self.position
+            self._last_update = now
+            self.paused = paused
+            self._pending_updates['paused'] = paused
+
+        # Schedule flush
+        if self._pending_updates and not self._flush_task:
+            if self.task_registry:
+                self._flush_task = self.task_registry.spawn(self._flush_later(), owner=self.guild_id, category='player_flush')
+            else:
+                self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """Flush pending updates after the update window."""
+        await asyncio.sleep(self.UPDATE_WINDOW)
+        self._flush_task = None
+        await self.flush_updates()
+
+    async def flush_updates(self):
+        """Send pending updates to Lavalink in a single player update, and dispatch `PlayerUpdatesFlushedEvent`."""
+        # Get pending updates
+        updates, self._pending_updates = self._pending_updates, {}
+        if not updates or self.client.player_manager.get(self.guild_id) is not self:
+            return
+        if updates.pop('position', False) and self.current:
+            updates['position'] = self.position
+
+        # Send updates
+        try:
+            await self.node.update_player(guild_id=self._internal_id, **updates)
+        except Exception as e:
+            debug_logger.error(f'Failed to update player of guild {self.guild_id} ({updates}): {e}')
+            return
+        
+        self.client._dispatch_event(PlayerUpdatesFlushedEvent(self, updates))
+
+    async def update_state(self, state: dict):
+        # Position updates from Lavalink are outdated while a seek is pending
+        if 'position' in self._pending_updates:
+            return
+        await super().update_state(state)
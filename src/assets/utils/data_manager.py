@@ -16,6 +16,9 @@ class DataManager:
         # Initialize data 
         self.data = self.load_music_data()
 
+        # Whether data has changes not saved yet (see `add_music_data(save=False)` and `flush_music_data()`)
+        self.dirty = False
+
         # Clean up music data
         self.cleanup_music_data()
     
@@ -48,9 +51,17 @@ class DataManager:
             with open(self.data_path, 'w', encoding="utf-8") as file:
                 json.dump(self.data, file, indent=4, ensure_ascii=False)
                 logger.info(f'Music data saved to `music_data.json`.')
+            self.dirty = False
         except Exception as e:
             logger.error(f'Failed to save music data: {e}')
 
+    def flush_music_data(self):
+        """Save music data to the `music_data.json` file, only if it has unsaved changes. Returns True if it was saved."""
+        if not self.dirty:
+            return False
+        self.save_music_data()
+        return True
+
     def cleanup_music_data(self):
         """Remove music data for guilds where the bot is no longer in."""
         # Get a list of guild IDs where the bot is currently in
@@ -66,9 +77,10 @@ class DataManager:
         # Save the updated music data
         self.save_music_data()
 
-    def add_music_data(self, guild_id: int, keys: Union[str, List[str]], values: Union[Any, List[Any]], root_keys: Union[str, List[str]] = None):
+    def add_music_data(self, guild_id: int, keys: Union[str, List[str]], values: Union[Any, List[Any]], root_keys: Union[str, List[str]] = None, save: bool = True):
         """
         Adds key-value pairs to the data dictionary, and saves it in `music_data.json`.
+        If `save` is False, the change is only kept in memory, and saved with the next save or flush (see `flush_music_data()`).
         
         Args:
             guild_id - The guild ID to add the key-value pair to.
@@ -103,9 +115,12 @@ class DataManager:
             target_dict.update(zip(keys, values))
         else:
             target_dict[keys] = values
+
+        # Save music data, or defer it
+        if not save:
+            self.dirty = True
+            return
         logger.info(f'Music data for guild {guild_id} added/updated.')
-        
-        # Save music data
         self.save_music_data() 
 
     def get_guild_music_data(self, guild_id: int):
@@ -0,0 +1,46 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+class PhaseTimer:
+    """
+    Accumulates the time spent in named phases, for startup/shutdown reports.
+
+    Usage:
+        timer = PhaseTimer()
+        with timer.phase('purge'):
+            ...
+        logger.info(timer.report())
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+
+        # Total time (s), number of runs and longest run (s) of each phase, in order of first run
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.longest = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager that times a run of the phase."""
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - phase_start
+            self.totals[name] += elapsed
+            self.counts[name] += 1
+            self.longest[name] = max(self.longest[name], elapsed)
+
+    @property
+    def elapsed(self):
+        """Time (s) since the timer was created."""
+        return time.perf_counter() - self.start
+
+    def report(self):
+        """Returns a single line report of the phases: `<phase>: <total>s (<runs>x, max <longest>s)`."""
+        phases = ', '.join(
+            f'{name}: {total:.2f}s ({self.counts[name]}x, max {self.longest[name]:.2f}s)'
+            for name, total in self.totals.items()
+        )
+        return f'{self.elapsed:.2f}s total | {phases or "no phases"}'
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
+from typing import Coroutine, Dict, Hashable, List, Optional
+from assets.logger.logger import debug_logger
+
+class CategoryStats:
+    """Finished tasks of a category: how many finished, failed and were cancelled, and their total/highest lifetime (s)."""
+    __slots__ = ('finished', 'failed', 'cancelled', 'total_lifetime', 'max_lifetime')
+
+    def __init__(self):
+        self.finished = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.total_lifetime = 0.0
+        self.max_lifetime = 0.0
+
+class TaskRegistry:
+    """
+    Registry of the bot background tasks, shared by the whole bot (`bot.task_registry`).
+
+    - Every task is spawned with an owner (a guild ID, or a subsystem name like 'music') and a category (eg. 'message_delete'),
+      and named `<category>:<owner>` (with an optional suffix), so that it can be identified in logs and debuggers.
+    - Live tasks are tracked until they finish, and their lifetime is recorded by category.
+    - Failed tasks (any exception but cancellation) are logged.
+    - All tasks of an owner can be cancelled with `cancel_owner()`, and `shutdown()` cancels tasks and waits for them to
+      finish, up to a timeout (supervised shutdown).
+    - `live_counts()` returns the number of live tasks by category, so that leaks are visible (eg. in diagnostics).
+    """
+    def __init__(self):
+        # Live tasks: {task: (owner, category, started at (monotonic))}, and live tasks by owner
+        self.live: Dict[asyncio.Task, tuple] = {}
+        self.by_owner: Dict[Hashable, set] = defaultdict(set)
+
+        # Finished tasks stats by category
+        self.stats: Dict[str, CategoryStats] = defaultdict(CategoryStats)
+
+    ######################################
+    ############## SPAWNING ##############
+    ######################################
+
+    def spawn(self, coro: Coroutine, *, owner: Hashable, category: str, name: Optional[str] = None) -> asyncio.Task:
+        """Creates a task running `coro`, owned by `owner`, and tracks it. Returns the task."""
+        task = asyncio.create_task(coro, name=f'{category}:{owner}{f":{name}" if name else ""}')
+        self.live[task] = (owner, category, time.monotonic())
+        self.by_owner[owner].add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task):
+        """Untracks a finished task, records its lifetime and logs its failure, if any."""
+        entry = self.live.pop(task, None)
+        if entry is None:
+            return
+        owner, category, started_at = entry
+
+        # Untrack task
+        owner_tasks = self.by_owner.get(owner)
+        if owner_tasks is not None:
+            owner_tasks.discard(task)
+            if not owner_tasks:
+                del self.by_owner[owner]
+
+        # Record lifetime
+        stats = self.stats[category]
+        lifetime = time.monotonic() - started_at
+        stats.finished += 1
+        stats.total_lifetime += lifetime
+        stats.max_lifetime = max(stats.max_lifetime, lifetime)
+
+        # Record cancellation, or log failure
+        if task.cancelled():
+            stats.cancelled += 1
+        elif task.exception() is not None:
+            stats.failed += 1
+            debug_logger.error(f'Task `{task.get_name()}` failed after {lifetime:.2f}s: {task.exception()!r}')
+
+    ######################################
+    ############ CANCELLATION ############
+    ######################################
+
+    def tasks_of(self, owner: Hashable) -> List[asyncio.Task]:
+        """Returns the live tasks of an owner."""
+        return list(self.by_owner.get(owner, ()))
+
+    def owners(self) -> List[Hashable]:
+        """Returns the owners with live tasks."""
+        return list(self.by_owner)
+
+    def cancel_owner(self, owner: Hashable, category: Optional[str] = None) -> List[asyncio.Task]:
+        """Cancels the live tasks of an owner (only of the given category, if given). Returns the cancelled tasks."""
+        tasks = [task for task in self.tasks_of(owner) if category is None or self.live[task][1] == category]
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    async def shutdown(self, owners: Optional[List[Hashable]] = None, timeout: float = 5.0):
+        """
+        Cancels the live tasks of the given owners (all owners if None), and waits up to `timeout` seconds for them to finish.
+        Tasks still running after the timeout are logged. Returns the number of cancelled tasks.
+        """
+        # Cancel tasks (except the calling task)
+        current = asyncio.current_task()
+        tasks = [
+            task for owner in (self.owners() if owners is None else owners)
+            for task in self.tasks_of(owner) if task is not current
+        ]
+        if not tasks:
+            return 0
+        for task in tasks:
+            task.cancel()
+
+        # Wait for them to finish
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            debug_logger.warning(f'Task `{task.get_name()}` did not finish within {timeout}s of being cancelled.')
+        return len(tasks)
+
+    ######################################
+    ############## METRICS ###############
+    ######################################
+
+    def live_counts(self) -> Dict[str, int]:
+        """Returns the number of live tasks by category."""
+        return dict(Counter(category for _, category, _ in self.live.values()))
+
+    def summary(self) -> str:
+        """Returns a one line summary: live tasks by category, and failed/cancelled tasks and highest lifetime by category."""
+        live = ', '.join(f'{category}: {count}' for category, count in sorted(self.live_counts().items())) or 'none'
+        finished = ', '.join(
+            f'{category}: {stats.finished} ({stats.failed} failed, {stats.cancelled} cancelled, max {stats.max_lifetime:.1f}s)'
+            for category, stats in sorted(self.stats.items())
+        ) or 'none'
+        return f'live ({live}), finished ({finished})'
@@ -0,0 +1,167 @@
+import asyncio
+import inspect
+import discord
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+from assets.logger.logger import debug_logger
+from assets.utils.taskregistry import TaskRegistry
+
+class Timer:
+    """A timer scheduled in a TimerWheel. Use `cancel()` to cancel it."""
+    __slots__ = ('wheel', 'category', 'key', 'rounds', 'slot', 'callback', 'args', 'cancelled')
+
+    def __init__(self, wheel: 'TimerWheel', category: str, key: Optional[Hashable], rounds: int, slot: int, callback: Callable, args: tuple):
+        self.wheel = wheel
+        self.category = category
+        self.key = key
+        self.rounds = rounds
+        self.slot = slot
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancels the timer, if it didn't fire yet. O(1)."""
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel._remove(self)
+
+class TimerWheel:
+    """
+    Hashed timer wheel, shared by the whole bot (`bot.timers`), for idle disconnects and message expiries.
+
+    - Timers are stored in `slots` buckets of `resolution` seconds. Scheduling and cancelling are O(1), and a single
+      task ticks the wheel while there are pending timers (instead of one sleeping task per timer).
+    - Timers longer than a full turn of the wheel wait `rounds` turns in their bucket.
+    - Timers can be given a `key`: scheduling a timer with the same category and key replaces the previous one, and
+      it can be cancelled by key with `cancel()`.
+    - Fired callbacks run in the event loop (coroutine callbacks in a task of the bot TaskRegistry, owned by 'timers'),
+      and their errors are logged.
+
+    NOTE: Timers fire up to `resolution` seconds late.
+    """
+    def __init__(self, task_registry: TaskRegistry, resolution: float = 1.0, slots: int = 512):
+        self.task_registry = task_registry
+        self.resolution = resolution
+        self.slots: List[Set[Timer]] = [set() for _ in range(slots)]
+        self.current_slot = 0
+
+        # Keyed timers: {(category, key): Timer}, and number of pending timers by category
+        self.keyed: Dict[tuple, Timer] = {}
+        self.counts: Counter = Counter()
+
+        # Task ticking the wheel, while there are pending timers
+        self._tick_task: Optional[asyncio.Task] = None
+
+    ######################################
+    ############# SCHEDULING #############
+    ######################################
+
+    def schedule(self, delay: float, callback: Callable, *args: Any, category: str = 'default', key: Optional[Hashable] = None):
+        """
+        Schedules `callback(*args)` to be called after `delay` seconds. Returns the Timer.
+        If `key` is given, any pending timer with the same category and key is cancelled.
+        """
+        # Replace keyed timer
+        if key is not None:
+            self.cancel(category, key)
+
+        # Get bucket and number of full turns to wait (a timer of exactly N turns waits N-1 turns in the current bucket)
+        ticks = max(1, round(delay / self.resolution))
+        rounds = (ticks - 1) // len(self.slots)
+        slot = (self.current_slot + ticks - rounds * len(self.slots)) % len(self.slots)
+
+        # Add timer
+        timer = Timer(self, category, key, rounds, slot, callback, args)
+        self.slots[slot].add(timer)
+        self.counts[category] += 1
+        if key is not None:
+            self.keyed[(category, key)] = timer
+
+        # Start ticking
+        if not self._tick_task or self._tick_task.done():
+            self._tick_task = self.task_registry.spawn(self._tick(), owner='timers', category='timer_wheel')
+        return timer
+
+    def cancel(self, category: str, key: Hashable):
+        """Cancels the pending timer with the given category and key. Returns True if there was one."""
+        timer = self.keyed.get((category, key))
+        if not timer:
+            return False
+        timer.cancel()
+        return True
+
+    def _remove(self, timer: Timer):
+        """Removes a timer from its bucket and from the keyed timers."""
+        self.slots[timer.slot].discard(timer)
+        self.counts[timer.category] -= 1
+        if not self.counts[timer.category]:
+            del self.counts[timer.category]
+        if timer.key is not None and self.keyed.get((timer.category, timer.key)) is timer:
+            del self.keyed[(timer.category, timer.key)]
+
+    ######################################
+    ############### TICKING ##############
+    ######################################
+
+    async def _tick(self):
+        """
+        Advances the wheel every `resolution` seconds and fires due timers, until there are no pending timers.
+        Ticks are scheduled against event loop time deadlines, so that late ticks don't delay the following ones (no drift).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while self.counts:
+            deadline += self.resolution
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            self.current_slot = (self.current_slot + 1) % len(self.slots)
+
+            # Fire due timers of current bucket, other timers wait one more turn
+            for timer in list(self.slots[self.current_slot]):
+                if timer.rounds:
+                    timer.rounds -= 1
+                    continue
+                timer.cancelled = True
+                self._remove(timer)
+                self._fire(timer)
+
+    def _fire(self, timer: Timer):
+        """Calls the timer callback."""
+        try:
+            result = timer.callback(*timer.args)
+            if inspect.iscoroutine(result):
+                self.task_registry.spawn(result, owner='timers', category=timer.category)
+        except Exception as e:
+            debug_logger.error(f'Timer `{timer.category}` callback failed: {e}')
+
+    def pending_counts(self):
+        """Returns the number of pending timers by category."""
+        return dict(self.counts)
+
+    def close(self):
+        """Cancels all pending timers and stops ticking."""
+        for timer in [timer for slot in self.slots for timer in slot]:
+            timer.cancel()
+        if self._tick_task:
+            self._tick_task.cancel()
+
+    ######################################
+    ########## MESSAGE EXPIRY ############
+    ######################################
+
+    def expire_message(self, message: Optional[discord.Message], delay: float):
+        """Deletes the message after `delay` seconds (replaces `delete_after=` of `send()`)."""
+        if message:
+            self.schedule(delay, self._delete, message.delete, category='message_expiry')
+
+    def expire_response(self, interaction: discord.Interaction, delay: float):
+        """Deletes the interaction response after `delay` seconds (replaces `delete_after=` of `send_message()`)."""
+        self.schedule(delay, self._delete, interaction.delete_original_response, category='message_expiry')
+
+    @staticmethod
+    async def _delete(delete: Callable):
+        """Deletes a message, ignoring messages already deleted or not deletable anymore."""
+        try:
+            await delete()
+        except discord.HTTPException:
+            pass
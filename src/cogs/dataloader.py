@@ -1,6 +1,6 @@
 import os
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from assets.utils.data_manager import DataManager
 from assets.logger.logger import music_data_logger as logger
 
@@ -18,6 +18,20 @@ class DataLoader(commands.Cog):
 
         # Set bot.data_manager to data_manager
         self.bot.data_manager = data_manager
+
+    async def cog_load(self):
+        """Start periodic flush of deferred music data changes."""
+        self.flush_music_data.start()
+
+    async def cog_unload(self):
+        """Stop periodic flush, and flush deferred music data changes."""
+        self.flush_music_data.cancel()
+        self.bot.data_manager.flush_music_data()
+
+    @tasks.loop(seconds=30)
+    async def flush_music_data(self):
+        """Background task to save music data changes that were deferred (eg. guild activity, see `DataManager.add_music_data()`)."""
+        self.bot.data_manager.flush_music_data()
     
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
@@ -1,22 +1,64 @@
 import os
 import discord
 from discord import app_commands, Embed, PartialEmoji
-from discord.ext import commands
+from discord.ext import commands, tasks
 import lavalink
 from lavalink.server import LoadType
-from lavalink.events import TrackStartEvent, QueueEndEvent, NodeConnectedEvent, TrackEndEvent
+from lavalink.events import TrackStartEvent, QueueEndEvent, NodeConnectedEvent, NodeReadyEvent, TrackEndEvent
 import asyncio
+import random
+import time
 import re
+from collections import deque
 from typing import Union, List, Any, Optional
 from assets.logger.logger import music_logger as logger, debug_logger
 from assets.music.lavalinkvoiceclient import LavalinkVoiceClient
+from assets.music.vibeplayer import VibePlayer, PlayerUpdatesFlushedEvent
 from assets.music.musicplayerview import MusicPlayerView
+from assets.music.playerbutton import PlayerButton
+from assets.music.playlistbutton import PlaylistButton
 from assets.music.queuebuttonsview import QueueButtonsView
+from assets.music.queuesnapshot import QueueSnapshot
 from assets.music.lastfm import LastFMClient
+from assets.music.playlistcursor import PlaylistCursor
+from assets.music.tracks import decode_tracks, playlist_track_url
+from assets.music.queuedtrack import compact_track
+from assets.music.render import format_duration, format_track_duration, track_link_line, music_queue_list, queue_page
+from assets.music.tracklist import is_track_list, parse_track_list, parse_text, TRACK_LIST_MAX_SIZE
 from assets.utils.reply_embed import error_embed, success_embed, warning_embed, info_embed
+from assets.utils.phasetimer import PhaseTimer
+from assets.music.guildhealth import GuildHealth, CHANNEL_MISSING, WEBHOOK_MISSING
+from assets.music.playersnapshot import PlayerSnapshot
+from assets.music.guildmusiccontext import GuildMusicContext, AUTO_PAUSE_GRACE, HIBERNATE_AFTER
+from assets.music.guildmailbox import serialized, respond
+from assets.music.musicstate import MusicState
 
 url_rx = re.compile(r'https?://(?:www\.)?.+')
 
+# Number of tracks added to the queue at once. Remaining playlist tracks are kept in a PlaylistCursor
+QUEUE_PAGE_SIZE = 50
+
+# Queue size under which the next page of pending playlist tracks is added to the queue
+QUEUE_LOW_WATER = 10
+
+# Maximum number of queries in a single bulk enqueue (multi-line message or track list attachment)
+BULK_MAX_QUERIES = 100
+
+# Maximum number of queries searched concurrently in a bulk enqueue
+BULK_CONCURRENCY = 5
+
+# Maximum number of guilds whose music text channel is restored concurrently on startup
+RESTORE_CONCURRENCY = 5
+
+# Minimum age (s) of an orphaned player (no voice connection, current track or queue) before it is reaped
+REAP_MIN_AGE = 60
+
+# Interval (s) between durable snapshots of the active players
+PLAYER_SNAPSHOT_INTERVAL = 30
+
+# Maximum number of players recovered concurrently from durable snapshots
+RECOVERY_CONCURRENCY = 5
+
 ############################################################################################################
 ############################################ MusicCogClass #################################################
 ############################################################################################################
@@ -39,10 +81,30 @@ class MusicCog(commands.Cog):
         self.bot.lastfm = LastFMClient(os.getenv('LASTFM_API_KEY'))
         self.lastfm = self.bot.lastfm
 
+        # Startup restoration of music text channels (set in `cog_load()`)
+        self.restore_task: Optional[asyncio.Task] = None
+
+        # Live state of the music cog, kept in the bot so that it survives hot reloads (see `MusicState`), created if it doesn't exist
+        if not hasattr(self.bot, 'music_state'):
+            data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),'../assets/data')
+            self.bot.music_state = MusicState(self.bot, data_dir)
+        self.state: MusicState = self.bot.music_state
+
+        # Shortcuts to the live state: guilds not yet restored, guild health, guild contexts, released and hibernated players,
+        # auto-pause counters, search cache for /play autocomplete, saved playlists snapshots and durable player snapshots
+        self.unrestored_guilds = self.state.unrestored_guilds
+        self.guild_health = self.state.guild_health
+        self.contexts = self.state.contexts
+        self.released_players = self.state.released_players
+        self.hibernated_players = self.state.hibernated_players
+        self.auto_pause_stats = self.state.auto_pause_stats
+        self.search_cache = self.state.search_cache
+        self.playlist_snapshots = self.state.playlist_snapshots
+        self.player_snapshots = self.state.player_snapshots
+
         # Set music_data to Data Manager (loaded in dataloader cog)
         self.music_data = self.bot.data_manager
         self.save_music_data = self.music_data.save_music_data
-        self.add_music_data = self.music_data.add_music_data
         self.get_guild_music_data = self.music_data.get_guild_music_data
 
     ######################################
@@ -62,7 +124,7 @@ class MusicCog(commands.Cog):
             if not hasattr(self.bot, 'lavalink'):
                 try:
                     # Initialize the Lavalink client
-                    self.bot.lavalink = lavalink.Client(self.bot.user.id)
+                    self.bot.lavalink = lavalink.Client(self.bot.user.id, player=VibePlayer)
                     logger.info('Lavalink client initialized.')
 
                     # Add node to Lavalink client
@@ -79,12 +141,40 @@ class MusicCog(commands.Cog):
             # Assign the Lavalink client to self.lavalink for easy access
             self.lavalink: lavalink.Client = self.bot.lavalink
 
-            # Add event hooks
+            # Spawn player flush tasks in the bot task registry
+            VibePlayer.task_registry = self.bot.task_registry
+
+            # Add event hooks (replacing the ones of the previous cog instance, after a hot reload)
+            self.lavalink._event_hooks.clear()
             self.lavalink.add_event_hooks(self)
 
+            # Register player buttons handlers (for all guilds music messages)
+            self.bot.add_dynamic_items(PlayerButton, PlaylistButton)
+
+            # After a hot reload, re-attach to the live state. Otherwise, all guilds need to be restored
+            if self.state.reloading:
+                self.reattach_live_state()
+            else:
+                self.unrestored_guilds.update(guild_music_data.get('guild_id') for guild_music_data in self.music_data.values())
+
             # Cleanup messages from music text channels that are not the music message, and create missing music messages.
-            # Set existing music messages to default and restore MusicPlayerViews for these.
-            await self.cleanup_music_channels()
+            # Set existing music messages (and their MusicPlayerViews) to default.
+            # Runs in the background, music commands are accepted in each guild as soon as it is restored.
+            if self.unrestored_guilds:
+                self.restore_task = self.bot.task_registry.spawn(self.cleanup_music_channels(), owner='music', category='restore')
+
+            # Start background refresh of saved playlists snapshots
+            self.refresh_playlist_snapshots.start()
+
+            # After a hot reload, resume player recovery if it was cancelled (the node is already ready, so `on_node_ready()`
+            # is not emitted again)
+            if self.state.reloading and self.lavalink.node_manager.available_nodes:
+                self.start_player_recovery()
+
+            # Start periodic orphaned players reaper, durable player snapshots, and diagnostics log
+            self.reap_players.start()
+            self.save_player_snapshots.start()
+            self.log_diagnostics.start()
             
         except Exception as e:
             # Gracefully unload the cog if an exception occurs during setup
@@ -104,49 +194,211 @@ class MusicCog(commands.Cog):
         client will be created. This ensures the Lavalink client and its events are properly 
         refreshed when the cog is reloaded.
 
-        Additionally, all Lavalink-related tasks will be identified and canceled to prevent 
-        potential issues with lingering tasks after unloading.
+        Additionally, all background tasks owned by the music cog (its subsystems and guilds) are cancelled through the bot
+        task registry, waiting for them to finish, to prevent potential issues with lingering tasks after unloading.
+        Tasks owned by the bot (eg. the timer wheel) keep running.
 
+        NOTE: On a hot reload (see `reload_music()`), only the cog's own tasks and handlers are stopped. The Lavalink client,
+        its event hooks (replaced by the new cog instance), guild mailboxes and tasks, and the live state are kept.
         NOTE: Use `self.bot.lavalink` instead of `self.lavalink` in this function, as `self.lavalink` 
         may not be defined when the cog is being unloaded--for example, if an exception occurs 
         early in `cog_load`.
         """
+        # Stop background refresh of saved playlists snapshots, orphaned players reaper, durable player snapshots and periodic diagnostics log
+        self.refresh_playlist_snapshots.cancel()
+        self.reap_players.cancel()
+        self.save_player_snapshots.cancel()
+        self.log_diagnostics.cancel()
+
+        # Unregister player buttons handlers
+        self.bot.remove_dynamic_items(PlayerButton, PlaylistButton)
+
+        # On hot reload, only stop startup restoration of music text channels (resumed by the new cog instance), and keep the rest
+        if self.state.reloading:
+            await self.bot.task_registry.shutdown(['music'])
+            return
+
+        # Cancel queued player mutations and event handlers of guild mailboxes
+        for context in self.contexts.values():
+            context.mailbox.close()
+
+        # Clear event hooks
         if hasattr(self.bot, 'lavalink') and self.bot.lavalink:
-            # Clear event hooks
             try:
                 self.bot.lavalink._event_hooks.clear()
                 logger.info('Lavalink event hooks removed.')
             except Exception as e:
                 logger.error(f'Failed to remove Lavalink event hooks: {e}')
 
-            # Cancel all Lavalink-related tasks
-            try:
-                pending_tasks = [t for t in asyncio.all_tasks() if not t.done()]
-                for task in pending_tasks:
-                    if "lavalink" in str(task):
-                        task.cancel()
-                logger.info(f'Cancelled all Lavalink-related tasks.')
-            except Exception as e:
-                logger.error(f'Failed to cancel Lavalink tasks: {e}')
+        # Cancel all tasks owned by the music cog subsystems (eg. startup restoration) and by guilds, and wait for them
+        try:
+            owners = [owner for owner in self.bot.task_registry.owners() if owner in ('music', 'search_cache') or isinstance(owner, int)]
+            cancelled = await self.bot.task_registry.shutdown(owners)
+            logger.info(f'Cancelled {cancelled} music tasks.')
+        except Exception as e:
+            logger.error(f'Failed to cancel music tasks: {e}')
 
-            # Close Lavalink Client
+        # Close Lavalink Client
+        if hasattr(self.bot, 'lavalink') and self.bot.lavalink:
             try:
                 await self.bot.lavalink.close()
                 logger.info('Lavalink client closed.')
             except Exception as e:
                 logger.error(f'Failed to close Lavalink Client: {e}')
-    
+
+        # Drop live state, as players are gone
+        if getattr(self.bot, 'music_state', None) is self.state:
+            del self.bot.music_state
+
+    ######################################
+    ############ HOT RELOAD ##############
+    ######################################
+
+    @commands.command(name='reload-music', hidden=True)
+    @commands.is_owner()
+    async def reload_music(self, ctx: commands.Context):
+        """
+        Hot reloads the music cog (bot owner only), to roll out code changes without interrupting playback.
+
+        The Lavalink client, players, queues and voice clients stay connected, and the live state (see `MusicState`) is
+        handed over to the new cog instance, which re-attaches to it (see `reattach_live_state()`).
+
+        NOTE: Only `cogs.music` is reloaded, not the `assets` modules its live objects are instances of.
+        NOTE: If the new code fails to load, discord.py loads the previous module back, which re-attaches the same way.
+        """
+        self.state.reloading = True
+        try:
+            await self.bot.reload_extension('cogs.music')
+        except Exception as e:
+            logger.error(f'Failed to hot reload music cog: {e}')
+            await ctx.send(embed=error_embed(f'Failed to reload music cog: {e}'))
+            return
+        finally:
+            self.state.reloading = False
+
+        logger.info('Music cog hot reloaded.')
+        await ctx.send(embed=success_embed('Music cog reloaded.'))
+
+    def reattach_live_state(self):
+        """
+        Called on load after a hot reload. Re-attaches the live voice clients to this cog instance.
+
+        Event hooks, player buttons handlers, background tasks and VibePlayer task registry are set up by `cog_load()` as
+        usual, and guild contexts, caches and held players are taken from the live state in `__init__()`.
+
+        NOTE: Timers scheduled before the reload (eg. hibernation) still call the previous cog instance, which works on the
+        same live state.
+        """
+        voice_clients = [voice_client for voice_client in self.bot.voice_clients if isinstance(voice_client, LavalinkVoiceClient)]
+        for voice_client in voice_clients:
+            voice_client.cog = self
+        logger.info(
+            f'Re-attached to live state: {len(voice_clients)} voice clients, {len(self.lavalink.player_manager)} players, '
+            f'{len(self.contexts)} guild contexts, {len(self.released_players) + len(self.hibernated_players)} held players.'
+        )
+
+    ######################################
+    ######### GRACEFUL SHUTDOWN ##########
+    ######################################
+
+    def stop_accepting_work(self):
+        """
+        First step of the graceful shutdown (see `shutdown()` in `main.py`): new music commands, buttons and messages are
+        refused (see `check_voice()`), background loops are stopped, and startup restoration and player recovery are cancelled.
+        """
+        self.state.draining = True
+        self.refresh_playlist_snapshots.cancel()
+        self.reap_players.cancel()
+        self.log_diagnostics.cancel()
+        self.bot.task_registry.cancel_owner('music')
+
+    async def drain_mailboxes(self, timeout: float = 2.0):
+        """Waits up to `timeout` seconds for the in-flight jobs of all guild mailboxes. Returns the number of mailboxes left busy."""
+        results = await asyncio.gather(*(context.mailbox.wait_idle(timeout) for context in self.contexts.values()))
+        return results.count(False)
+
+    def flush_player_snapshots(self):
+        """
+        Saves durable snapshots of the active players a last time (so that they are recovered on the next startup), and
+        stops their periodic save, as players are about to be disconnected.
+
+        NOTE: Nothing is saved if the saved snapshots were not recovered yet, so that they are not overwritten.
+        """
+        self.save_player_snapshots.cancel()
+        if not self.player_snapshots.recovered.is_set():
+            return
+        players = [
+            (context.player, context.voice_client.channel.id) for context in self.contexts.values()
+            if isinstance(context.voice_client, LavalinkVoiceClient) and context.player and context.player.current
+        ]
+        self.player_snapshots.save(players)
+
+    async def disconnect_voice(self):
+        """Disconnects from all voice channels, releasing their players. Returns the number of voice clients disconnected."""
+        voice_clients = [voice_client for voice_client in self.bot.voice_clients if isinstance(voice_client, LavalinkVoiceClient)]
+        results = await asyncio.gather(*(voice_client.disconnect(force=True) for voice_client in voice_clients), return_exceptions=True)
+        for voice_client, result in zip(voice_clients, results):
+            if isinstance(result, Exception):
+                logger.error(f'Failed to disconnect from voice in guild {voice_client.guild_id}: {result}')
+        return len(voice_clients)
+
+    async def reset_music_messages(self):
+        """
+        Sets the music messages that are not in their default state (eg. Now Playing) back to default, with at most
+        `RESTORE_CONCURRENCY` guilds at a time (rate limits of each request are handled by discord.py).
+        Their state is persisted, so that they are not edited again on startup. Returns the number of music messages reset.
+
+        NOTE: Players must be disconnected before (see `disconnect_voice()`), so that music messages render their default state.
+        """
+        semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+        guilds = [
+            guild for guild in (self.bot.get_guild(guild_music_data.get('guild_id') or 0) for guild_music_data in self.music_data.values()
+                                if guild_music_data.get('music_text_channel_id') and not guild_music_data.get('music_message_default', False))
+            if guild
+        ]
+
+        async def reset(guild: discord.Guild):
+            async with semaphore:
+                await self.update_music_embed(guild, with_view=True)
+
+        await asyncio.gather(*(reset(guild) for guild in guilds), return_exceptions=True)
+        return len(guilds)
+
+    ######################################
+    ########### GUILD CONTEXTS ###########
+    ######################################
+
+    def get_context(self, guild_id: int):
+        """Gets the GuildMusicContext of a guild, creating it (from its music data) if it doesn't exist."""
+        context = self.contexts.get(guild_id)
+        if context is None:
+            context = self.contexts[guild_id] = GuildMusicContext(guild_id, self.get_guild_music_data(guild_id), self.bot.task_registry)
+        return context
+
+    def add_music_data(self, guild_id: int, keys: Union[str, List[str]], values: Union[Any, List[Any]], root_keys: Union[str, List[str]] = None, save: bool = True):
+        """
+        Adds key-value pairs to the guild music data and saves it, unless `save` is False (see `DataManager.add_music_data()`).
+        The guild context (music text channel IDs and settings) is reloaded, if it exists.
+        """
+        self.music_data.add_music_data(guild_id=guild_id, keys=keys, values=values, root_keys=root_keys, save=save)
+        context = self.contexts.get(int(guild_id))
+        if context:
+            context.load(self.get_guild_music_data(guild_id))
+
     ######################################
     ############# WEBHOOKS  ##############
     ######################################
 
     async def get_webhook(self, guild_id: int):
-        """Gets an existing webhook for the music text channel, otherwise returns None."""
-        # Check if we have a stored webhook for this channel
-        webhook = self.get_guild_music_data(guild_id).get('music_text_channel_webhook')
-        if webhook:
+        """Gets an existing webhook for the music text channel (cached in the guild context), otherwise returns None."""
+        # Check if we have a cached webhook, or a stored webhook for this channel
+        context = self.get_context(guild_id)
+        if context.webhook:
+            return context.webhook
+        if context.webhook_id:
             try:
-                return await self.bot.fetch_webhook(webhook.get('id'))
+                context.webhook = await self.bot.fetch_webhook(context.webhook_id)
+                return context.webhook
             except discord.NotFound:
                 return None
             except Exception:
@@ -170,13 +422,14 @@ class MusicCog(commands.Cog):
         webhook = await music_text_channel.create_webhook(name=f'{self.bot.user.name} Player', 
                                                           avatar=await self.bot.user.display_avatar.read())
 
-        # Store webhook in `music_data.json`
+        # Store webhook in `music_data.json`, and cache it in guild context
         self.add_music_data(
             guild_id=guild_id,
             keys=['url', 'id', 'token'],
             values=[webhook.url, webhook.id, webhook.token],
             root_keys='music_text_channel_webhook'
         )
+        self.get_context(guild_id).webhook = webhook
 
         return webhook
     
@@ -194,6 +447,72 @@ class MusicCog(commands.Cog):
         # Create webhook
         return await self.create_webhook(guild_id, music_text_channel=music_text_channel)
 
+    async def get_music_webhook(self, guild_id: int, force: bool = False):
+        """
+        Gets music text channel webhook (creating it if needed) for updates of the music message, tracking guild health.
+
+        Returns None if the guild has no music text channel set up, if the guild is broken and its backoff didn't expire
+        (unless `force` is True), or if the webhook could not be obtained (the failure is recorded in guild health).
+        """
+        # Guilds without music text channel set up are not broken
+        if not self.get_context(guild_id).is_set_up:
+            return None
+
+        # Skip broken guilds, until their backoff expires
+        if not force and not self.guild_health.should_attempt(guild_id):
+            return None
+
+        # Get webhook
+        try:
+            webhook = await self.get_or_create_webhook(guild_id)
+        except Exception as e:
+            self.record_guild_failure(guild_id, e)
+            return None
+
+        # If webhook is None, it means music text channel does not exist
+        if not webhook:
+            self.record_guild_failure(guild_id, CHANNEL_MISSING)
+        return webhook
+
+    ######################################
+    ########### GUILD HEALTH #############
+    ######################################
+
+    def record_guild_failure(self, guild_id: int, failure: Union[str, Exception]):
+        """Records a failure of the guild music text channel, given its failure class or the error. Transient errors are ignored."""
+        failure = failure if isinstance(failure, str) else GuildHealth.classify(failure)
+        if not failure:
+            return
+
+        # Drop cached webhook if it (or its channel) is missing
+        if failure in (CHANNEL_MISSING, WEBHOOK_MISSING) and guild_id in self.contexts:
+            self.contexts[guild_id].webhook = None
+        if self.guild_health.record_failure(guild_id, failure):
+            logger.warning(f'Music text channel of guild {guild_id} is broken ({failure}). Background updates paused until repaired.')
+
+    def record_guild_success(self, guild_id: int):
+        """Records a successful request to the guild music text channel."""
+        if self.guild_health.record_success(guild_id):
+            logger.info(f'Music text channel of guild {guild_id} repaired.')
+
+    def request_guild_repair(self, guild_id: int):
+        """
+        Called on user interactions. If the guild is broken, runs a single repair of its music text channel in the background.
+        
+        NOTE: Only one repair is allowed per backoff window (see `GuildHealth`).
+        """
+        if self.guild_health.begin_repair(guild_id):
+            self.bot.task_registry.spawn(self.repair_guild(guild_id), owner=guild_id, category='guild_repair')
+
+    async def repair_guild(self, guild_id: int):
+        """Repair guild music text channel: recreate webhook and music message if missing, and update music message."""
+        try:
+            await self.cleanup_music_channel(self.get_guild_music_data(guild_id))
+        except Exception as e:
+            self.record_guild_failure(guild_id, e)
+        finally:
+            self.guild_health.end_repair(guild_id)
+
     ######################################
     ######## MUSIC TEXT CHANNEL ##########
     ######################################
@@ -203,16 +522,14 @@ class MusicCog(commands.Cog):
         # Get default music message text and embed
         message_text, embed = self.get_default_music_message()
 
-        # Get MusicPlayerView for this guild if it exists, otherwise create a new one
-        musicplayerview = self.get_musicplayerview(webhook.guild_id)
-        if not musicplayerview:
-            musicplayerview = MusicPlayerView(self.bot, self, webhook.guild)
+        # Get MusicPlayerView for this guild
+        musicplayerview = self.get_musicplayerview(webhook.guild)
 
         # Get bot nick name in guild
         bot_guild_user = webhook.guild.get_member(self.bot.user.id)
         bot_nick = bot_guild_user.display_name if bot_guild_user else self.bot.user.name
 
-        # Send the music message (this adds view to bots persistent views automatically)
+        # Send the music message (buttons are handled by the registered PlayerButton/PlaylistButton dynamic items)
         music_message = await webhook.send(message_text, embed=embed, view=musicplayerview, wait=True, username=bot_nick, avatar_url=self.bot.user.display_avatar.url)
 
         # Add guild music data to music data and save in `music_data.json`
@@ -237,71 +554,33 @@ class MusicCog(commands.Cog):
 
         return message_text, embed
     
-    async def update_music_embed(self, guild: discord.Guild):
-        """Update the music message embed in the music text channel."""
-        # get guild music data
-        guild_music_data = self.get_guild_music_data(guild.id)
+    async def update_music_embed(self, guild: discord.Guild, with_view: bool = False):
+        """
+        Update the music message embed in the music text channel.
+        If `with_view` is True, the MusicPlayerView is also updated in the same message edit.
+        """
+        # Get guild context
+        context = self.get_context(guild.id)
 
-        # Get webhook if it exists or try to create it, otherwise if it fails return
-        webhook = await self.get_or_create_webhook(guild.id)
+        # Get webhook if it exists or try to create it, otherwise if it fails (or guild is broken) return
+        webhook = await self.get_music_webhook(guild.id)
         if not webhook:
             return
 
         # get player for this guild
-        player = self.lavalink.player_manager.get(guild.id)
+        player = context.player
 
         # check if player exists and is playing to update track, otherwise sets default music message
         if player and player.is_playing:
-            # Generate queue list string, and gets queue time
+            # Generate queue list string from cached track lines, and get queue time from queue aggregate
             queue_size = len(player.queue)
-            queue_time = 0
-            queue_list = '__**Queue list:**__\n'
-            if queue_size > 15:
-                queue_list += f'\nAnd **{queue_size-15}** more...'
-
-            for i,item in enumerate(player.queue[::-1]):
-                # get track position in queue
-                position = queue_size-i
-
-                # Accumulate queue time for non-streams
-                if not item.is_stream:
-                    queue_time += item.duration
-                
-                # For track beyond next 15 continue to next track
-                if position > 15:
-                    continue
-
-                # Set track duration string
-                if item.is_stream:
-                    track_duration_str = 'LIVE'
-                else:
-                    track_duration_str = (
-                            f'{str(item.duration // 3600000).zfill(2)}:{(item.duration % 3600000) // 60000:02d}:{(item.duration % 60000) // 1000:02d}'
-                            if item.duration >= 3600000 else
-                            f'{str(item.duration // 60000).zfill(2)}:{item.duration % 60000 // 1000:02d}'
-                        )
-                
-                # Add track to queue list string
-                queue_list += (
-                        f'\n**{position}.** '
-                        f'{item.author} - {item.title}'
-                        f' - `{track_duration_str}`' 
-                        if item.is_seekable else
-                        f'\n**{position}.** '
-                        f'{item.uri}'
-                        f' - `{track_duration_str}`'
-                    )
+            queue_time = player.queue.total_duration
+            queue_list = music_queue_list(player.queue)
             
             # Get current track information
             current_track = player.current
-            if current_track.is_stream:
-                current_track_duration_str = 'LIVE'
-            else:
-                current_track_duration_str = (
-                        f'{str(current_track.duration // 3600000).zfill(2)}:{(current_track.duration % 3600000) // 60000:02d}:{(current_track.duration % 60000) // 1000:02d}'
-                        if current_track.duration >= 3600000 else
-                        f'{str(current_track.duration // 60000).zfill(2)}:{current_track.duration % 60000 // 1000:02d}'
-                    )
+            current_track_duration_str = format_track_duration(current_track)
+            if not current_track.is_stream:
                 queue_time += current_track.duration
 
             # Create music message Embed
@@ -309,24 +588,21 @@ class MusicCog(commands.Cog):
                           description=(
                               f'**[{current_track.author} - {current_track.title}]({current_track.uri})**'
                               f' - `{current_track_duration_str}`\n'
-                              f'Requester: {current_track.requester.mention}\n'
+                              f'Requester: <@{current_track.requester}>\n'
                               f'Channel: {guild.voice_client.channel.mention}'
                               if current_track.is_seekable else
                               f'**{current_track.uri}**'
                               f' - `{current_track_duration_str}`\n'
-                              f'Requester: {current_track.requester.mention}\n'
+                              f'Requester: <@{current_track.requester}>\n'
                               f'Channel: {guild.voice_client.channel.mention}'
                               )
             )
             embed.set_author(name='Now Playing')
             embed.set_thumbnail(url=current_track.artwork_url if current_track.artwork_url else self.bot.user.display_avatar.url)
-            queue_time_str = (
-                    f'{str(queue_time // 3600000).zfill(2)}:{(queue_time % 3600000) // 60000:02d}:{(queue_time % 60000) // 1000:02d}'
-                    if queue_time >= 3600000 else
-                    f'{str(queue_time // 60000).zfill(2)}:{queue_time % 60000 // 1000:02d}'
-                )
+            queue_time_str = format_duration(queue_time)
+            pending = self.get_pending_count(player)
             embed.set_footer(text=(
-                f'{queue_size} songs in queue for '
+                f'{queue_size} songs in queue{f" (+{pending} pending)" if pending else ""} for '
                 f'{queue_time_str} of listening | Volume: {player.volume}%'
                 )
             )
@@ -336,33 +612,147 @@ class MusicCog(commands.Cog):
         
         # Edit music message, if it exists
         try:
-            await webhook.edit_message(guild_music_data.get('music_message_id'), content=queue_list, embed=embed, allowed_mentions=discord.AllowedMentions(users=False))
-        except Exception:
+            if with_view:
+                await webhook.edit_message(context.music_message_id, content=queue_list, embed=embed, view=self.get_musicplayerview(guild), allowed_mentions=discord.AllowedMentions(users=False))
+            else:
+                await webhook.edit_message(context.music_message_id, content=queue_list, embed=embed, allowed_mentions=discord.AllowedMentions(users=False))
+        except Exception as e:
+            if with_view:
+                context.view_state = None
+            self.record_music_message_state(guild.id, embed_default=False)
+            self.record_guild_failure(guild.id, e)
             return
 
+        # Record rendered state of music message, and guild health
+        self.record_music_message_state(guild.id, embed_default=not (player and player.is_playing))
+        self.record_guild_success(guild.id)
+
+    def record_music_message_state(self, guild_id: int, embed_default: Optional[bool] = None):
+        """
+        Records whether the music message currently shows the default embed and MusicPlayerView, and persists it in
+        `music_data.json` (only when it changes), so that unchanged music messages are not edited on startup.
+        Set `embed_default` after editing the music message embed.
+
+        NOTE: If the last edit of the embed or view failed, or the view state is unknown, the music message is not default.
+        NOTE: As this runs on every track start and end, the change is only kept in memory and saved with the next periodic
+        flush of music data. Guilds whose player was active when the bot stopped are never fast-pathed on startup (see
+        `cleanup_music_channel()`), in case their last change wasn't saved.
+        """
+        # Get music data for this guild in case it exists, otherwise return
+        guild_music_data = self.get_guild_music_data(guild_id)
+        if not guild_music_data:
+            return
+
+        # Record embed state
+        context = self.get_context(guild_id)
+        if embed_default is not None:
+            context.embed_default = embed_default
+
+        # Persist rendered state, if it changed
+        is_default = context.embed_default and MusicPlayerView.is_default_state(context.view_state)
+        if guild_music_data.get('music_message_default', False) != is_default:
+            self.add_music_data(guild_id=guild_id, keys='music_message_default', values=is_default, save=False)
+
+    def get_guild_activity(self, guild_music_data: dict):
+        """
+        Returns the timestamp of the last known activity of a guild: the last time the bot connected to voice in it,
+        or the last message sent in its music text channel (from cache, without any request).
+        """
+        last_active = guild_music_data.get('last_active', 0)
+        music_text_channel = self.bot.get_channel(guild_music_data.get('music_text_channel_id') or 0)
+        if music_text_channel and getattr(music_text_channel, 'last_message_id', None):
+            last_active = max(last_active, discord.utils.snowflake_time(music_text_channel.last_message_id).timestamp())
+        return last_active
+
+    def is_guild_restored(self, guild_id: int):
+        """Returns True if the music text channel of the guild was already restored on startup (or doesn't need to be)."""
+        return guild_id not in self.unrestored_guilds
+
     async def cleanup_music_channels(self):
         """
-        For all guilds:
+        For all guilds, in the background on startup:
         Remove messages from music text channels that are not the music message and create missing music messages.
-        Set music message to default.
-        Restore MusicPlayerView.
+        Set music message (and its MusicPlayerView) to default.
+
+        Guilds are restored by most recent activity first, with at most `RESTORE_CONCURRENCY` guilds at a time
+        (rate limits of each request are handled by discord.py). Music commands are accepted in each guild as soon
+        as it is restored. A startup report with per-phase timings is logged at the end.
         """
-        # Iterate through all guilds in `music_data.json`
-        for guild_music_data in self.music_data.values():
-            # Clean music text channel for this guild
-            await self.cleanup_music_channel(guild_music_data)
+        timer = PhaseTimer()
+        results = {'restored': 0, 'skipped': 0, 'failed': 0}
+        semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+        # Order guilds not yet restored by most recent activity
+        with timer.phase('rank'):
+            guilds_music_data = sorted(
+                (guild_music_data for guild_music_data in self.music_data.values() if guild_music_data.get('guild_id') in self.unrestored_guilds),
+                key=self.get_guild_activity, reverse=True
+            )
 
-        logger.info('Music text channels cleaned up, music messages set to default and MusicPlayerViews.')
+        async def restore(guild_music_data: dict):
+            async with semaphore:
+                try:
+                    # Clean music text channel for this guild
+                    if await self.cleanup_music_channel(guild_music_data, timer=timer):
+                        results['restored'] += 1
+                    else:
+                        results['skipped'] += 1
+                except Exception as e:
+                    results['failed'] += 1
+                    self.record_guild_failure(guild_music_data.get('guild_id'), e)
+                    logger.error(f'Failed to restore music text channel of guild {guild_music_data.get("guild_id")}: {e}')
+                finally:
+                    # Accept commands in this guild
+                    self.unrestored_guilds.discard(guild_music_data.get('guild_id'))
+
+        # Restore all guilds
+        await asyncio.gather(*(restore(guild_music_data) for guild_music_data in guilds_music_data))
+
+        logger.info(
+            f'Music text channels cleaned up and music messages set to default: {results["restored"]} restored, '
+            f'{results["skipped"]} skipped (no music text channel or broken), {results["failed"]} failed | {timer.report()}'
+        )
     
-    async def cleanup_music_channel(self, guild_music_data: dict, force_recreate: bool = False):
+    async def cleanup_music_channel(self, guild_music_data: dict, force_recreate: bool = False, timer: Optional[PhaseTimer] = None):
         """
         For given guild:
         Remove messages from music text channels that are not the music message and create missing music messages.
-        Set music message to default.
-        Restore MusicPlayerView.
+        Set music message (and its MusicPlayerView) to default.
+        Returns True if the music text channel was restored, otherwise False (music text channel does not exist or is broken).
+
+        `timer` (optional) accumulates the time spent in each phase.
+
+        Fast path: if the last message of the music text channel (from cache) is the music message, there is nothing to
+        purge, and if the music message was left in its default state (see `record_music_message_state()`), it is not
+        edited either. Hence unchanged music text channels are restored without any request.
+
+        NOTE: MusicPlayerViews don't need to be restored, as their buttons are handled by the registered dynamic items.
+        NOTE: A music message deleted while the bot was offline is only detected if other messages were sent after it.
         """
+        timer = timer or PhaseTimer()
+        guild_id = guild_music_data.get('guild_id')
+        music_message_id = guild_music_data.get('music_message_id')
+
+        # Check if the music message is the last message of the music text channel, from cache
+        music_text_channel = self.bot.get_channel(guild_music_data.get('music_text_channel_id') or 0)
+        is_last_message = (
+            not force_recreate 
+            and music_text_channel is not None 
+            and getattr(music_text_channel, 'last_message_id', None) == music_message_id
+        )
+
+        # If music message was left in default state, there is nothing to do (unless the guild had an active player saved)
+        if is_last_message and guild_music_data.get('music_message_default', False) and str(guild_id) not in self.player_snapshots.players:
+            with timer.phase('fast_path'):
+                context = self.get_context(guild_id)
+                context.embed_default = True
+                context.view_state = MusicPlayerView.get_state(self, music_text_channel.guild, context.playlist_version)
+                self.record_music_message_state(guild_id)
+            return True
+
         # Get webhook
-        webhook = await self.get_or_create_webhook(guild_music_data.get('guild_id'))
+        with timer.phase('webhook'):
+            webhook = await self.get_music_webhook(guild_id, force=True)
 
         # If webhook is None, it means music text channel does not exist
         # If music text channel does not exist skip iteration
@@ -370,82 +760,503 @@ class MusicCog(commands.Cog):
         # in case music channel is created again (deafult volume, playlists, etc.)
         # This note is important when called in cleanup_music_channels()
         if not webhook:
-            return
-
-        # get music message from ID
-        music_message_id = guild_music_data.get('music_message_id')
+            return False
 
         # delete all messages in music text channel that are not the music message, unless , force_recreate is True
-        if not force_recreate:
-            await webhook.channel.purge(check=lambda m: m.id != music_message_id, bulk=True)
-        else:
-            await webhook.channel.purge(bulk=True)
+        # Skipped if the music message is the last message (nothing to delete)
+        with timer.phase('purge'):
+            if is_last_message:
+                pass
+            elif not force_recreate:
+                await webhook.channel.purge(check=lambda m: m.id != music_message_id, bulk=True)
+            else:
+                await webhook.channel.purge(bulk=True)
 
         # Get music message
-        try:
-            music_message = await webhook.fetch_message(music_message_id)
-        except Exception:
-            music_message = None
+        with timer.phase('fetch'):
+            try:
+                music_message = await webhook.fetch_message(music_message_id)
+            except Exception:
+                music_message = None
 
         # If music message does not exist, create it. Otherwise, set it to default
         if not music_message:
-            await self.create_music_message(webhook)
-            await self.update_music_embed(webhook.guild)
-            return
-
-        # Get MusicPlayerView for this guild if it exists, otherwise create a new one
-        musicplayerview = self.get_musicplayerview(webhook.guild_id)
-        if not musicplayerview:
-            musicplayerview = MusicPlayerView(self.bot, self, webhook.guild)
-
-        # Set  MusicPlayerView in music message
-        await webhook.edit_message(music_message_id, view=musicplayerview)
-
-        # Update Music embed
-        await self.update_music_embed(webhook.guild)
+            with timer.phase('create'):
+                await self.create_music_message(webhook)
+                await self.update_music_embed(webhook.guild)
+            return True
+
+        # Update Music embed and MusicPlayerView, in a single edit
+        with timer.phase('edit'):
+            await self.update_music_embed(webhook.guild, with_view=True)
+        return True
     
     ######################################
     ######### MUSIC PLAYER VIEW ##########
     ######################################
     
-    def get_musicplayerview(self, guild_id: int):
-        """Get MusicPlayerView for the specified guild. Returns None if not found."""
-        for view in self.bot.persistent_views:
-            if isinstance(view, MusicPlayerView) and view.guild.id == guild_id:
-                return view
-        return None
+    def get_musicplayerview(self, guild: discord.Guild):
+        """
+        Build the MusicPlayerView for the current state of the specified guild, to be sent in its music message.
+        Its state is recorded as the one shown in the music message.
+        """
+        context = self.get_context(guild.id)
+        musicplayerview = MusicPlayerView(self, guild, context.playlist_version)
+        context.view_state = musicplayerview.state
+        return musicplayerview
     
-    async def update_musicplayerview(self, guild_id: int):
+    async def update_musicplayerview(self, guild_id: int, playlists_changed: bool = False):
         """
         Update MusicPlayerView for the specified guild music message.
+        If the view state didn't change, nothing is done (no music message edit).
+        Set `playlists_changed` when the guild playlists changed, to rebuild playlist buttons.
 
         Useful to update MusicPLayerView buttons outside of Player interactions.
-        In player interactions, use `interaction.response.edit_message(view=self)`.
+        In player interactions, use `interaction.response.edit_message(view=self.cog.get_musicplayerview(guild))`.
         """
-        # Get music data for this guild in case it exists, otherwise return
-        guild_music_data = self.get_guild_music_data(guild_id)
-        if not guild_music_data:
+        # Get guild context, in case guild has a music text channel set up, otherwise return
+        context = self.get_context(guild_id)
+        if not context.is_set_up:
             return
 
-        # Get webhook if it exists or try to create it, otherwise if it fails return
-        webhook = await self.get_or_create_webhook(guild_id)
+        # Bump guild playlists version, if they changed
+        if playlists_changed:
+            context.playlist_version += 1
+
+        # If view state didn't change, there is nothing to update
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
+        state = MusicPlayerView.get_state(self, guild, context.playlist_version)
+        if state == context.view_state:
+            return
+
+        # Get webhook if it exists or try to create it, otherwise if it fails (or guild is broken) return
+        webhook = await self.get_music_webhook(guild_id)
         if not webhook:
             return
+
+        # Edit music message with updated view, if it exists. If it fails, force next update.
+        try:
+            await webhook.edit_message(context.music_message_id, view=self.get_musicplayerview(guild))
+        except Exception as e:
+            context.view_state = None
+            self.record_guild_failure(guild_id, e)
+        else:
+            self.record_guild_success(guild_id)
         
-        # Get MusicPlayerView and update it for this guild if it exists, otherwise create a new one
-        musicplayerview = self.get_musicplayerview(guild_id)
-        if not musicplayerview:
-            musicplayerview = MusicPlayerView(self.bot, self, webhook.guild)
+        # Record rendered state of music message
+        self.record_music_message_state(guild_id)
+
+    ######################################
+    ########## BACKGROUND TASKS ##########
+    ######################################
+
+    @tasks.loop(hours=1)
+    async def refresh_playlist_snapshots(self):
+        """
+        Background task to refresh saved playlists snapshots.
+
+        Refreshes snapshots older than `PlaylistSnapshots.max_age`, and creates missing ones 
+        (eg. for playlists added before snapshots existed, or when Lavalink was unavailable on `/pl add`).
+        """
+        # Get saved playlists for all guilds
+        playlists_by_guild = {
+            guild_id: guild_music_data.get('playlists')
+            for guild_id, guild_music_data in self.music_data.items() if guild_music_data.get('playlists')
+        }
+
+        # Refresh stale snapshots
+        refreshed = await self.playlist_snapshots.refresh_stale_snapshots(playlists_by_guild)
+        if refreshed:
+            logger.info(f'Refreshed {refreshed} playlist snapshots.')
+
+    @tasks.loop(minutes=5)
+    async def reap_players(self):
+        """
+        Background task to destroy orphaned players: players with no voice connection, no current track and an empty queue,
+        older than `REAP_MIN_AGE` (so that players about to connect are kept).
+        """
+        # Find orphaned players
+        now = time.monotonic()
+        orphaned = [
+            guild_id for guild_id, player in self.lavalink.player_manager
+            if not player.is_connected and not player.current and not player.queue
+            and now - getattr(player, 'created_at', 0) >= REAP_MIN_AGE
+        ]
+
+        # Destroy them
+        for guild_id in orphaned:
+            try:
+                await self.lavalink.player_manager.destroy(guild_id)
+                self.state.reaped_players += 1
+            except Exception as e:
+                logger.error(f'Failed to reap player of guild {guild_id}: {e}')
+        if orphaned:
+            logger.info(f'Reaped {len(orphaned)} orphaned players ({self.state.reaped_players} since startup).')
+
+    @tasks.loop(seconds=PLAYER_SNAPSHOT_INTERVAL)
+    async def save_player_snapshots(self):
+        """
+        Background task to save durable snapshots of the active players (connected, with a current track), to recover them
+        after a crash or a Lavalink node restart (see `PlayerSnapshotStore` and `recover_players()`).
+
+        NOTE: Skipped while no Lavalink node is available, as player positions are not updated by the node meanwhile.
+        """
+        if not self.lavalink.node_manager.available_nodes:
+            return
+        players = [
+            (context.player, context.voice_client.channel.id) for context in self.contexts.values()
+            if isinstance(context.voice_client, LavalinkVoiceClient) and context.player and context.player.current
+        ]
+        self.player_snapshots.save(players)
+
+    @save_player_snapshots.before_loop
+    async def before_save_player_snapshots(self):
+        """Wait for saved player snapshots to be recovered on startup, before overwriting them."""
+        await self.player_snapshots.recovered.wait()
+
+    @tasks.loop(hours=1)
+    async def log_diagnostics(self):
+        """Background task to periodically log diagnostics (see `get_diagnostics()`). Mailbox metrics are reset after each log."""
+        logger.info(f'Diagnostics: {self.get_diagnostics()}')
+        for context in self.contexts.values():
+            context.mailbox.reset_metrics()
+
+    @log_diagnostics.before_loop
+    async def before_log_diagnostics(self):
+        """Wait for startup restoration of music text channels to finish before logging diagnostics."""
+        if self.restore_task:
+            await asyncio.wait([self.restore_task])
+
+    def get_diagnostics(self):
+        """
+        Returns a single line of diagnostics:
+        - Players (and orphaned players reaped)
+        - Guild mailboxes: queued jobs, jobs run, average/highest wait and highest depth (since last log), and slowest guild
+        - Pending timers by category (bot timer wheel)
+        - Background tasks: live tasks by category, and finished/failed/cancelled tasks by category (bot task registry)
+        - Auto-pause counters
+        - Hibernated players
+        - Durable player snapshots: saved players, and state/track files written
+        - Broken guilds (with their failure class and consecutive failures)
+        """
+        # Pending timers
+        timers = self.bot.timers.pending_counts()
+        timers_str = ', '.join(f'{category}: {count}' for category, count in timers.items()) or 'none'
+
+        # Auto-pause counters
+        auto_pause = self.auto_pause_stats
+        auto_pause_str = (
+            f'{auto_pause["paused"]} paused, {auto_pause["released"]} released, {auto_pause["resumed"]} resumed, '
+            f'{len(self.released_players)} held, {auto_pause["stream_seconds_saved"]:.0f} stream-seconds and '
+            f'{auto_pause["cpu_seconds_saved"]:.1f} CPU-seconds saved'
+        )
+
+        # Hibernated players
+        hibernated_str = f'{len(self.hibernated_players)} hibernated players ({sum(map(len, self.hibernated_players.values()))} tracks)'
+
+        # Durable player snapshots
+        snapshots = self.player_snapshots
+        snapshots_str = f'{len(snapshots.players)} saved, {snapshots.state_writes} state and {snapshots.tracks_writes} track writes'
+
+        # Players
+        players_str = f'{len(self.lavalink.player_manager)} players ({self.state.reaped_players} reaped)'
+
+        # Guild mailboxes
+        mailboxes = [context.mailbox for context in self.contexts.values()]
+        processed = sum(mailbox.processed for mailbox in mailboxes)
+        slowest = max(mailboxes, key=lambda mailbox: mailbox.max_wait, default=None)
+        mailboxes_str = (
+            f'{sum(map(len, mailboxes))} queued, {processed} run, '
+            f'avg wait {sum(mailbox.total_wait for mailbox in mailboxes) / processed * 1000 if processed else 0:.0f}ms, '
+            f'max wait {slowest.max_wait * 1000 if slowest else 0:.0f}ms{f" (guild {slowest.guild_id})" if slowest and slowest.max_wait else ""}, '
+            f'max depth {max((mailbox.max_depth for mailbox in mailboxes), default=0)}'
+        )
+
+        # Broken guilds
+        broken_guilds = self.guild_health.broken_guilds()
+        broken_guilds_str = ', '.join(f'{guild_id} ({failure}, {failures}x)' for guild_id, failure, failures, _ in broken_guilds)
+        return (
+            f'{players_str} | '
+            f'mailboxes ({mailboxes_str}) | '
+            f'pending timers ({timers_str}) | '
+            f'tasks {self.bot.task_registry.summary()} | '
+            f'auto-pause ({auto_pause_str}) | '
+            f'{hibernated_str} | '
+            f'player snapshots ({snapshots_str}) | '
+            f'{len(broken_guilds)} broken guilds{f": {broken_guilds_str}" if broken_guilds else ""}'
+        )
+
+    @refresh_playlist_snapshots.before_loop
+    async def before_refresh_playlist_snapshots(self):
+        """Wait for a Lavalink node to be available before refreshing playlist snapshots."""
+        while not self.lavalink.node_manager.available_nodes:
+            await asyncio.sleep(5)
+
+    ######################################
+    ############ AUTO-PAUSE ##############
+    ######################################
+
+    async def check_voice_channel_listeners(self, guild: discord.Guild):
+        """
+        Auto-pause the player at once when no listeners (non-bot members) remain in the bot's voice channel, and release
+        it after the guild grace period (see `release_player()`). Resume it when a listener joins before that.
+
+        NOTE: Players paused by users are not auto-paused, and auto-pause can be disabled with `/auto-pause`.
+        """
+        # Get voice client and player for this guild
+        context = self.get_context(guild.id)
+        voice_client, player = context.voice_client, context.player
+        if not isinstance(voice_client, LavalinkVoiceClient) or not player:
+            return
+
+        # Check if there are listeners, and if player is auto-paused
+        has_listeners = any(not member.bot for member in voice_client.channel.members)
+        auto_pause = player.fetch('auto_pause', default=None)
+
+        # Auto-pause, if playing and auto-pause is enabled
+        if not has_listeners and auto_pause is None:
+            if not player.is_playing or player.paused or not context.settings.auto_pause:
+                return
+            player.store(key='auto_pause', value=(time.monotonic(), self.get_remaining_playback(player), self.get_player_cpu_share(player.node)))
+            player.queue_update(paused=True)
+            self.auto_pause_stats['paused'] += 1
+            self.bot.timers.schedule(context.settings.auto_pause_grace, context.mailbox.post, self.release_player, guild.id,
+                                     category='auto_pause_release', key=guild.id)
+
+        # Resume, if auto-paused
+        elif has_listeners and auto_pause is not None:
+            self.bot.timers.cancel('auto_pause_release', guild.id)
+            player.delete('auto_pause')
+            player.queue_update(paused=False)
+            self.record_auto_pause_savings(auto_pause)
+            self.auto_pause_stats['resumed'] += 1
+
+    async def release_player(self, guild_id: int):
+        """
+        Called when the grace period of an auto-paused player expires. Takes a PlayerSnapshot, and disconnects (releasing
+        the Lavalink player and voice connection). The player is recreated if someone joins the voice channel before the
+        bot would have disconnected for being idle (see `resume_released_player()`).
+        """
+        # Get voice client and player
+        context = self.get_context(guild_id)
+        voice_client, player = context.voice_client, context.player
+        if not isinstance(voice_client, LavalinkVoiceClient) or not player or player.fetch('auto_pause', default=None) is None:
+            return
+
+        # Take snapshot and disconnect
+        self.released_players[guild_id] = (PlayerSnapshot(player, voice_client.channel.id), player.fetch('auto_pause'))
+        await voice_client.disconnect(force=True)
+        self.auto_pause_stats['released'] += 1
+
+        # Drop snapshot when the bot would have disconnected for being idle
+        if context.settings.auto_disconnect:
+            self.bot.timers.schedule(context.settings.idle_timer, self.drop_released_player, guild_id,
+                                     category='released_player_expiry', key=guild_id)
+
+    async def resume_released_player(self, guild: discord.Guild, voice_channel: discord.VoiceChannel):
+        """Reconnects to the voice channel of a released player, and restores it from its snapshot (queue and position)."""
+        # Get snapshot, if not already resumed or dropped
+        released = self.released_players.pop(guild.id, None)
+        if not released:
+            return
+        snapshot, auto_pause = released
+        self.bot.timers.cancel('released_player_expiry', guild.id)
+        self.record_auto_pause_savings(auto_pause)
+
+        # Check if there is any lavalink nodes available
+        if not self.lavalink.node_manager.available_nodes:
+            return
+
+        # Reconnect and restore player
+        try:
+            await voice_channel.connect(cls=LavalinkVoiceClient)
+            await snapshot.restore(self.lavalink.player_manager.get(guild.id))
+            self.auto_pause_stats['resumed'] += 1
+        except Exception as e:
+            logger.error(f'Failed to resume released player of guild {guild.id}: {e}')
+
+    def drop_released_player(self, guild_id: int):
+        """Drops the snapshot of a released player, if any (it will not be resumed)."""
+        released = self.released_players.pop(guild_id, None)
+        if released:
+            self.bot.timers.cancel('released_player_expiry', guild_id)
+            self.record_auto_pause_savings(released[1])
+
+    def record_auto_pause_savings(self, auto_pause: tuple):
+        """
+        Adds the streaming time saved by an auto-pause to the counters: time since auto-paused, up to the remaining playback
+        when auto-paused (as the player would have stopped then), and the node CPU time it would have used.
+        """
+        paused_at, remaining, cpu_share = auto_pause
+        saved = min(time.monotonic() - paused_at, remaining)
+        self.auto_pause_stats['stream_seconds_saved'] += saved
+        self.auto_pause_stats['cpu_seconds_saved'] += saved * cpu_share
+
+    @staticmethod
+    def get_remaining_playback(player: lavalink.DefaultPlayer):
+        """Returns the remaining playback time (s) of the player: rest of current track and queue (streams not counted)."""
+        remaining = player.queue.total_duration
+        if player.current and not player.current.is_stream:
+            remaining += max(player.current.duration - player.position, 0)
+        return remaining / 1000
+
+    @staticmethod
+    def get_player_cpu_share(node: lavalink.Node):
+        """Returns the estimated node CPU usage (in cores) of a playing player, from the node stats."""
+        stats = node.stats
+        if not stats or stats.playing_players <= 0:
+            return 0.0
+        return stats.lavalink_load * stats.cpu_cores / stats.playing_players
+
+    ######################################
+    ############ HIBERNATION #############
+    ######################################
+
+    def is_hibernated(self, guild_id: int):
+        """Returns True if the guild player is hibernated."""
+        return guild_id in self.hibernated_players
+
+    def schedule_hibernation(self, player: lavalink.DefaultPlayer):
+        """
+        Starts the hibernation timer of a player paused by users, or stops it if the player is not paused.
+        Hibernation can be disabled and its pause duration changed with `/hibernation`.
+        """
+        context = self.get_context(player.guild_id)
+        if player.paused and player.fetch('auto_pause', default=None) is None and context.settings.hibernate:
+            self.bot.timers.schedule(context.settings.hibernate_after, context.mailbox.post, self.hibernate_player, player.guild_id,
+                                     category='hibernate', key=player.guild_id)
         else:
-            musicplayerview.update_buttons()
+            self.bot.timers.cancel('hibernate', player.guild_id)
+
+    async def hibernate_player(self, guild_id: int):
+        """
+        Called when the hibernation timer of a paused player expires. Takes a compacted PlayerSnapshot (queue as encoded
+        tracks) and disconnects, releasing the Lavalink player and voice connection.
+        The player is woken at its saved position when the bot connects again (eg. with the Resume button).
+        """
+        # Get voice client and player, which must still be paused by users
+        context = self.get_context(guild_id)
+        voice_client, player = context.voice_client, context.player
+        if not isinstance(voice_client, LavalinkVoiceClient) or not player or not player.is_playing or not player.paused:
+            return
 
-        # Edit music message with updated view, if it exists
+        # Take compacted snapshot, and disconnect (MusicPlayerView shows the Resume button to wake the player)
+        snapshot = PlayerSnapshot(player, voice_client.channel.id)
+        snapshot.compact()
+        self.hibernated_players[guild_id] = snapshot
+        await voice_client.disconnect(force=True)
+        logger.info(f'Player of guild {guild_id} hibernated ({len(snapshot)} tracks).')
+
+    async def restore_held_player(self, guild_id: int):
+        """
+        Posted to the guild mailbox when the bot connects to a voice channel (see `LavalinkVoiceClient.connect()`), so that
+        the slow wake doesn't delay the connect (eg. in an interaction check) and is serialized with the queue jobs.
+        Wakes the hibernated player, restoring its queue and playing from its saved position. Tracks added since connecting
+        (eg. with /play) are kept after the restored queue.
+        A player released while its voice channel was empty is dropped, as it is no longer resumed.
+        """
+        # Drop released player
+        self.drop_released_player(guild_id)
+
+        # Get player (the bot may have disconnected again before this job ran) and hibernated player, if any
+        player = self.lavalink.player_manager.get(guild_id)
+        if not player or guild_id not in self.hibernated_players:
+            return
+        snapshot = self.hibernated_players.pop(guild_id)
+
+        # Restore player, adding back the tracks added since connecting
+        added = ([player.current] if player.current else []) + list(player.queue)
         try:
-            await webhook.edit_message(guild_music_data.get('music_message_id') ,view=musicplayerview)
-        except Exception:
+            await snapshot.restore(player)
+            for track in added:
+                player.add(track=track, requester=track.requester)
+            logger.info(f'Player of guild {guild_id} woken up from hibernation ({len(snapshot)} tracks).')
+        except Exception as e:
+            logger.error(f'Failed to wake hibernated player of guild {guild_id}: {e}')
+
+    ######################################
+    ########## PLAYER RECOVERY ###########
+    ######################################
+
+    async def recover_players(self):
+        """
+        On startup, recreates in bulk the players saved in durable snapshots (see `PlayerSnapshotStore`) of guilds without a
+        connected player: rejoins their voice channel, and restores their queue, settings and current track near the saved position.
+        Tracks are decoded in batch from their saved encoded form (see `PlayerSnapshot.expand()`), instead of searched again.
+
+        Once done, snapshots start being saved again (see `save_player_snapshots()`). If cancelled (eg. hot reload), they are
+        not, so that the snapshots of guilds not yet recovered are kept for the next cog instance to recover.
+
+        NOTE: Snapshots older than `PlayerSnapshotStore.max_age` are not recovered, and recovery waits for the music text
+        channels to be restored, so that their music messages are not reset to default after it.
+        """
+        try:
+            await self.recover_saved_players()
+        except Exception as e:
+            logger.error(f'Failed to recover players from snapshots: {e}')
+        self.player_snapshots.recovered.set()
+
+    async def recover_saved_players(self):
+        """Recovers the players saved in durable snapshots. See `recover_players()`."""
+        # Wait for startup restoration of music text channels
+        if self.restore_task:
+            await asyncio.wait([self.restore_task])
+
+        # Skip stale snapshots
+        if self.player_snapshots.is_stale():
+            logger.info('Player snapshots are too old to be recovered.')
+            return
+
+        # Get guilds with a saved player and without a connected player
+        guilds = [
+            guild for guild in map(self.bot.get_guild, self.player_snapshots.guild_ids())
+            if guild and not isinstance(self.get_context(guild.id).voice_client, LavalinkVoiceClient)
+        ]
+        if not guilds:
             return
 
-                
+        # Recover players, with limited concurrency (each in its guild mailbox)
+        semaphore = asyncio.Semaphore(RECOVERY_CONCURRENCY)
+        async def recover(guild: discord.Guild):
+            async with semaphore:
+                return await self.get_context(guild.id).mailbox.run(self.recover_player, guild)
+        results = await asyncio.gather(*(recover(guild) for guild in guilds), return_exceptions=True)
+        recovered = sum(result is True for result in results)
+        logger.info(f'Recovered {recovered}/{len(guilds)} players from snapshots.')
+
+    async def recover_player(self, guild: discord.Guild):
+        """
+        Recovers the saved player of a guild (see `recover_players()`). The voice channel must still have listeners.
+        Returns True if the player was recovered.
+        """
+        # Check that the bot is still not connected, and that a lavalink node is available
+        if isinstance(self.get_context(guild.id).voice_client, LavalinkVoiceClient) or not self.lavalink.node_manager.available_nodes:
+            return False
+
+        # Get snapshot, and its voice channel (which must have listeners)
+        saved = self.player_snapshots.get_snapshot(guild.id)
+        if not saved:
+            return False
+        snapshot, paused = saved
+        voice_channel = guild.get_channel(snapshot.channel_id)
+        if not isinstance(voice_channel, (discord.VoiceChannel, discord.StageChannel)) or not any(not member.bot for member in voice_channel.members):
+            return False
+
+        # Reconnect and restore player (paused, if it was)
+        try:
+            await voice_channel.connect(cls=LavalinkVoiceClient)
+            player = self.lavalink.player_manager.get(guild.id)
+            await snapshot.restore(player)
+            if paused and player.current:
+                await player.set_pause(True)
+        except Exception as e:
+            logger.error(f'Failed to recover player of guild {guild.id}: {e}')
+            return False
+        logger.info(f'Player of guild {guild.id} recovered ({len(snapshot)} tracks).')
+        return True
+
     ######################################
     ########## LAVALINK EVENTS ###########
     ######################################
@@ -455,23 +1266,67 @@ class MusicCog(commands.Cog):
         """This is a custom event, emitted when a connection to a Lavalink node is successfully established."""
         logger.info(f'Lavalink client node `{event.node.name}` connected.')
     
+    @lavalink.listener(NodeReadyEvent)
+    async def on_node_ready(self, event: NodeReadyEvent):
+        """
+        This event is emitted when a Lavalink node is ready to be used. The first time (on startup), players saved in durable
+        snapshots are recovered (see `recover_players()`).
+
+        NOTE: When the node is ready again after a restart, lavalink.py sends the live players to it by itself.
+        """
+        self.start_player_recovery()
+
+    def start_player_recovery(self):
+        """Spawns `recover_players()`, unless players were already recovered or are being recovered."""
+        if self.player_snapshots.recovered.is_set() or self.bot.task_registry.live_counts().get('player_recovery'):
+            return
+        self.bot.task_registry.spawn(self.recover_players(), owner='music', category='player_recovery')
+
     @lavalink.listener(TrackStartEvent)
     async def on_track_start(self, event: TrackStartEvent):
+        """This event is emitted when a track begins playing (e.g. via player.play()). Handled in the guild mailbox."""
+        self.get_context(event.player.guild_id).mailbox.post(self.handle_track_start, event)
+
+    @lavalink.listener(QueueEndEvent)
+    async def on_queue_end(self, event: QueueEndEvent):
+        """This is a custom event, emitted by the DefaultPlayer when there are no more tracks in the queue. Handled in the guild mailbox."""
+        self.get_context(event.player.guild_id).mailbox.post(self.handle_queue_end, event)
+
+    @lavalink.listener(TrackEndEvent)
+    async def on_track_end(self, event: TrackEndEvent):
+        """This event is emitted when the player finished playing a track. Handled in the guild mailbox."""
+        self.get_context(event.player.guild_id).mailbox.post(self.handle_track_end, event)
+
+    @lavalink.listener(PlayerUpdatesFlushedEvent)
+    async def on_player_updates_flushed(self, event: PlayerUpdatesFlushedEvent):
+        """This custom event is emitted when a player sent its coalesced volume, seek and pause changes to Lavalink. Handled in the guild mailbox."""
+        self.get_context(event.player.guild_id).mailbox.post(self.handle_player_updates_flushed, event)
+
+    ######################################
+    ###### LAVALINK EVENT HANDLERS #######
+    ######################################
+
+    async def handle_track_start(self, event: TrackStartEvent):
         """
-        This event is emitted when a track begins playing (e.g. via player.play()).
+        Handles TrackStartEvent, in the guild mailbox.
 
         Used to:
             - Stopping the auto-disconnect idle timer
+            - Add next page of pending playlist tracks to the queue
             - Update music message embed
             - Update MusicPlayerView
         """
         # Get voice client for this guild
         guild_id = event.player.guild_id
-        voice_client = discord.utils.get(self.bot.voice_clients, guild__id=guild_id)
+        voice_client = self.get_context(guild_id).voice_client
 
         # if voice client exists and is of type LavalinkVoiceClient, cancel idle timer task
-        if voice_client and isinstance(voice_client, LavalinkVoiceClient):
-            voice_client.stop_idle_timer()
+        if not isinstance(voice_client, LavalinkVoiceClient):
+            return
+        voice_client.stop_idle_timer()
+
+        # Add next page of pending playlist tracks, if queue is running low
+        await self.refill_queue(event.player)
         
         # Update music message embed
         await self.update_music_embed(voice_client.guild)
@@ -479,33 +1334,39 @@ class MusicCog(commands.Cog):
         # Update MusicPlayerView in music message
         await self.update_musicplayerview(guild_id)
 
-    @lavalink.listener(QueueEndEvent)
-    async def on_queue_end(self, event: QueueEndEvent):
+    async def handle_queue_end(self, event: QueueEndEvent):
         """
-        This is a custom event, emitted by the DefaultPlayer when there are no more tracks in the queue.
+        Handles QueueEndEvent, in the guild mailbox.
         
         Used to:
+            - Keep playing pending playlist tracks, if any
             - Start the auto-disconnect idle timer
             - If autoplay is on adds recomended track to queue
             - Update music message embed
             - Update MusicPlayerView
             - Deletes previous track from guilds player
         """
+        # If there are pending playlist tracks, add them to the queue and keep playing
+        if await self.refill_queue(event.player):
+            await event.player.play()
+            return
+
         # Get voice client for this guild
         guild_id = event.player.guild_id
-        voice_client = discord.utils.get(self.bot.voice_clients, guild__id=guild_id)
+        voice_client = self.get_context(guild_id).voice_client
 
         # if voice client exists and is of type LavalinkVoiceClient, start idle timer task
-        if voice_client and isinstance(voice_client, LavalinkVoiceClient):
-            await voice_client.start_idle_timer()    
+        if not isinstance(voice_client, LavalinkVoiceClient):
+            return
+        await voice_client.start_idle_timer()
 
         # Check if autoplay is on
         if event.player.fetch(key='autoplay', default=False):
             # Get previous track
             track = event.player.fetch(key='previous_track', default=None)
 
-            # Get recommended track
-            recommended_track = self.lastfm.get_recommendation(track['title'], track['author'])
+            # Get recommended track (blocking Last.fm request, in a thread so that the event loop and other guilds aren't stalled)
+            recommended_track = await asyncio.to_thread(self.lastfm.get_recommendation, track.title, track.author)
             
             # If recommended track exists, add it to queue
             if recommended_track:
@@ -527,20 +1388,41 @@ class MusicCog(commands.Cog):
         except Exception:
             pass
     
-    @lavalink.listener(TrackEndEvent)
-    async def on_track_end(self, event: TrackEndEvent):
+    async def handle_track_end(self, event: TrackEndEvent):
         """
-        This event is emitted when the player finished playing a track.
+        Handles TrackEndEvent, in the guild mailbox.
 
         Used to:
             - Save in guilds player the previous track
         """
-        # Get player for this guild
-        player = self.lavalink.player_manager.get(event.player.guild_id)
+        # Store previous track, as a compact QueuedTrack
+        event.player.store(key='previous_track', value=compact_track(event.track))
+
+    async def handle_player_updates_flushed(self, event: PlayerUpdatesFlushedEvent):
+        """
+        Handles PlayerUpdatesFlushedEvent, in the guild mailbox.
 
-        # Store previous track
-        if player:
-            player.store(key='previous_track', value=event.track)
+        Used to:
+            - Update music message embed once for all volume changes (volume is only shown while playing)
+            - Update MusicPlayerView, if the intended paused state wasn't shown yet (nothing is edited otherwise)
+            - Start/Stop the hibernation timer of paused players
+        """
+        # Get guild
+        guild = self.bot.get_guild(event.player.guild_id)
+        if not guild:
+            return
+
+        # Update music message embed
+        if 'volume' in event.updates and event.player.is_playing:
+            await self.update_music_embed(guild)
+
+        # Update MusicPlayerView in music message
+        if 'paused' in event.updates:
+            await self.update_musicplayerview(guild.id)
+
+        # Start hibernation timer when paused by users (not auto-paused), or stop it when resumed
+        if 'paused' in event.updates:
+            self.schedule_hibernation(event.player)
         
     
     ######################################
@@ -554,88 +1436,170 @@ class MusicCog(commands.Cog):
         if not message.guild:
             return
         
-        # Get webhook
-        webhook = await self.get_webhook(message.guild.id)
+        # Get guild context
+        context = self.get_context(message.guild.id)
         
         # Ignore message from VibeBot and music text channel webhook
-        if message.author == self.bot.user or message.author.id == webhook.id:
+        if message.author == self.bot.user or message.author.id == context.webhook_id:
             return
-        
-        # Get music data for this guild in case it exists, otherwise None
-        guild_music_data = self.get_guild_music_data(message.guild.id)
-        music_text_channel_id = guild_music_data.get('music_text_channel_id')
 
         # Check is message is from a music text channel, and not from VibeBot
-        if music_text_channel_id == message.channel.id:
+        if context.music_text_channel_id == message.channel.id:
 
             # Delete message asynchronously without blovking rest of function (running in parallel task)
             async def delete_message():
                 try:
                     await message.delete()
                 except discord.Forbidden:
-                    await message.channel.send(
-                        embed=error_embed("I need `manage_messages`, `read_message_history`, and `view_channel` permissions in this text channel."),
-                        delete_after=15
-                    )
+                    self.bot.timers.expire_message(await message.channel.send(
+                        embed=error_embed("I need `manage_messages`, `read_message_history`, and `view_channel` permissions in this text channel.")
+                    ), 15)
                 except discord.NotFound:
                     pass
                 except Exception as e:
                     pass
-            asyncio.create_task(delete_message())
 
             # Check if message is not from other bot    
             if message.author.bot:
+                self.bot.task_registry.spawn(delete_message(), owner=message.guild.id, category='message_delete')
                 return
+
+            # Get queries from message lines and track list attachments (read before the message is deleted)
+            queries, attachment_errors = await self.get_message_queries(message)
+            self.bot.task_registry.spawn(delete_message(), owner=message.guild.id, category='message_delete')
             
-            # Check if bot should join and create player
-            check = await self.check_and_join(message.author, message.guild, should_connect=True, should_bePlaying=False)
+            # Check if bot should join and create player. Connecting (if needed) is done below
+            check, voice_channel = self.check_voice(message.author, message.guild, should_connect=True, should_bePlaying=False)
             if check:
-                await message.channel.send(embed=error_embed(check), delete_after=15)
+                self.bot.timers.expire_message(await message.channel.send(embed=error_embed(check)), 15)
+                return
+
+            # Check if there is anything to add to queue
+            if not queries:
+                self.bot.timers.expire_message(await message.channel.send(embed=error_embed('\n'.join(attachment_errors) or 'No queries found.')), 15)
+                return
+
+            # Get player for this guild
+            player = self.lavalink.player_manager.get(message.guild.id)
+
+            # Search queries, connecting to voice channel concurrently if needed
+            tracks, failed, playlist_urls, connect_check = await self.connect_and_resolve(voice_channel, queries, player.node)
+            if connect_check:
+                self.bot.timers.expire_message(await message.channel.send(embed=error_embed(connect_check)), 15)
+                return
+
+            # Add tracks to queue
+            if tracks:
+                await self.add_tracks_to_queue(tracks, message.author, message.guild, playlist_urls=playlist_urls)
+
+            # Send message if single query not successful
+            if len(queries) == 1 and not attachment_errors:
+                if failed:
+                    self.bot.timers.expire_message(await message.channel.send(embed=error_embed(failed[0][2])), 15)
                 return
 
-            # Add query to queue and send message if not successful
-            add_to_queue_check = await self.add_to_queue(message.content, message.author, message.guild)
-            if add_to_queue_check:
-                await message.channel.send(embed=error_embed(add_to_queue_check), delete_after=15)
+            # Send summary message for multiple queries
+            summary = f'Added **{len(tracks)}** tracks from **{len(queries)}** queries.'
+            if attachment_errors or failed:
+                summary += '\n\n__**Failed:**__\n' + '\n'.join(
+                    attachment_errors + [f'**{line}.** `{query[:80]}` - {error}' for line, query, error in failed]
+                )
+                if len(summary) > 4000:
+                    summary = summary[:4000] + '\n...'
+                self.bot.timers.expire_message(await message.channel.send(embed=warning_embed(summary)), 30)
                 return
+            self.bot.timers.expire_message(await message.channel.send(embed=success_embed(summary)), 15)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        """
+        Called when a member changes voice state. Used to auto-pause when the bot's voice channel empties, 
+        resume when someone joins it again, and recreate players released while their voice channel was empty.
+        """
+        # Only members joining or leaving voice channels matter
+        if member.bot or before.channel == after.channel:
+            return
+        guild = member.guild
+
+        # Resume released player when someone joins its voice channel (in the guild mailbox)
+        mailbox = self.get_context(guild.id).mailbox
+        released = self.released_players.get(guild.id)
+        if released and after.channel and after.channel.id == released[0].channel_id and not guild.voice_client:
+            await mailbox.run(self.resume_released_player, guild, after.channel)
+            return
+
+        # Auto-pause or resume, if bot's voice channel was left or joined (in the guild mailbox)
+        voice_client = guild.voice_client
+        if voice_client and voice_client.channel in (before.channel, after.channel):
+            await mailbox.run(self.check_voice_channel_listeners, guild)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Called when a Message is deleted. If it is a music message, it is no longer in default state (forces full cleanup on startup)."""
+        # Check if message is the guild music message
+        if not payload.guild_id or self.get_context(payload.guild_id).music_message_id != payload.message_id:
+            return
+
+        # Record music message as not default
+        self.record_music_message_state(payload.guild_id, embed_default=False)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
-        """Handle bot leaving a server. Remove guild from: persistent MusicPlayerViews."""
-        # Removes guild from persistent MusicPlayerViews
-        musicplayerview = self.get_musicplayerview(guild.id)
-        if musicplayerview:
-            musicplayerview.stop()
+        """Handle bot leaving a server. Remove guild from: guild contexts, guild health, released and hibernated players, view layouts, playlist snapshots."""
+        # Removes guild context (cancelling its queued mailbox jobs) and health state
+        context = self.contexts.pop(guild.id, None)
+        if context:
+            context.mailbox.close()
+        self.guild_health.remove(guild.id)
+
+        # Removes guild released and hibernated players
+        self.released_players.pop(guild.id, None)
+        self.hibernated_players.pop(guild.id, None)
+
+        # Removes guild cached MusicPlayerView layouts
+        MusicPlayerView.forget_guild(guild.id)
+
+        # Removes guild playlist snapshots
+        self.playlist_snapshots.remove_guild(guild.id)
     
     ######################################
     ######### BOT JOIN & CHECK ###########
     ######################################
 
-    async def check_and_join(self, author: discord.Member, guild: discord.Guild, should_connect: bool, should_bePlaying: None):
+    def check_voice(self, author: discord.Member, guild: discord.Guild, should_connect: bool, should_bePlaying: None):
         """
-        This function serves as a prerequisite check for all music-related commands. 
-        It ensures that a player exists for the guild and attempts to connect the bot to the author's voice channel when possible. 
-        If successful returns False. Otherwise, it returns a string with the warning/error.
-
-        NOTE: In this function, the player is created before the bot connects to a voice channel. 
-        While this might seem like an inefficient use of resources — since players will be initialized for guilds even if the bot 
-        isn't connected — this approach guarantees that a player is always available when needed, minimizing potential bugs.
-        Ideally, the player should only be created upon connecting to a voice channel. 
-        However, this could lead to issues if a player is unexpectedly destroyed without a corresponding disconnection, which might 
-        occur due to a bug, a Lavalink restart, or the automatic removal of inactive players. 
-        By ensuring the player is always initialized before executing music commands, we reduce the risk of such problems.
+        Synchronous validation part of `check_and_join()`, without connecting to a voice channel.
+        It ensures that a player exists for the guild and checks if the bot can connect to the author's voice channel when needed.
+
+        Returns a tuple (check, voice_channel).
+        If successful, check is False and voice_channel is the author's voice channel if the bot still needs to connect to it,
+        otherwise None. If not successful, check is a string with the warning/error and voice_channel is None.
+
+        NOTE: The player is only created (if it doesn't exist) once all checks pass, when the bot is about to connect or is already
+        connected, so that interactions that fail the checks don't allocate players that never connect.
+        Creating it when the bot is already connected guarantees that a player is always available when needed, in case a player
+        was unexpectedly destroyed without a corresponding disconnection (eg. a bug or a Lavalink restart).
+        Players left without voice connection, current track or queue are destroyed by `reap_players()`.
         """
         # Dont allow private messages
         if guild is None:
-            return 'This command can only be used in a server.'
+            return 'This command can only be used in a server.', None
+
+        # Refuse new work while the bot is shutting down
+        if self.state.draining:
+            return 'VibeBot is restarting. Please try again in a few seconds.', None
+
+        # Check if guild music text channel was already restored on startup
+        if not self.is_guild_restored(guild.id):
+            return 'VibeBot is still starting up in this server. Please try again in a few seconds.', None
+
+        # Repair guild music text channel, if broken
+        self.request_guild_repair(guild.id)
         
         # Check if there is any lavalink nodes available
         if not self.lavalink.node_manager.available_nodes:
-            return 'No lavalink nodes available.'
+            return 'No lavalink nodes available.', None
         
-        # Create player if not exists
-        player = self.lavalink.player_manager.create(guild.id)
-
         # Get Bot voice client if exists, otherwise None
         voice_client = guild.voice_client
 
@@ -644,10 +1608,10 @@ class MusicCog(commands.Cog):
             # Check if bot is in voice channel.
             if voice_client is not None:
                 # If yes, inform to join the same channel
-                return 'You need to join my voice channel first.'
+                return 'You need to join my voice channel first.', None
             
             # If not, inform to join a voice channel
-            return 'Join a voice channel first.'
+            return 'Join a voice channel first.', None
 
         # Get author voice channel
         voice_channel = author.voice.channel
@@ -656,29 +1620,57 @@ class MusicCog(commands.Cog):
         if voice_client is None:
             # Stop for commands that require bot to already be in voice channel
             if not should_connect:
-                return 'I\'m not playing music.'
+                return 'I\'m not playing music.', None
             
             # Get bot's permission in the author's voice channel
             permissions = voice_channel.permissions_for(guild.me)
 
             # Check if bot has permission to connect and speak in the author's voice channel
             if not permissions.connect or not permissions.speak or not permissions.view_channel:
-                return 'I need `connect`, `speak` and `view_channel` permissions.'
+                return 'I need `connect`, `speak` and `view_channel` permissions.', None
 
             # Check if author's voice channel has user limit, is full and if bot has permission to move members (as it allows to enter full voice channel)
             if (voice_channel.user_limit > 0) and (len(voice_channel.members) >= voice_channel.user_limit) and not guild.me.guild_permissions.move_members:
-                return 'Your voice channel is full.'
+                return 'Your voice channel is full.', None
 
-            # Connect to author's voice channel
-            await voice_channel.connect(cls=LavalinkVoiceClient)
+            # Stop for commands that require bot to be playing, as it won't be playing after connecting
+            if should_bePlaying:
+                return 'I\'m not playing music.', None
+
+            # Create player (if not exists), and bot should connect to author's voice channel
+            self.lavalink.player_manager.create(guild.id)
+            return False, voice_channel
         
         # If bot is in voice channel, but not in author's voice channel
         elif voice_client.channel.id != voice_channel.id:
-            return 'You need to join my voice channel first.'
+            return 'You need to join my voice channel first.', None
         
+        # Create player if not exists
+        player = self.lavalink.player_manager.create(guild.id)
+
         # Stop for commands that require bot to be playing when it's not
         if not player.is_playing and should_bePlaying:
-            return 'I\'m not playing music.'
+            return 'I\'m not playing music.', None
+
+        # If bot already is in author's voice channel
+        return False, None
+
+    async def check_and_join(self, author: discord.Member, guild: discord.Guild, should_connect: bool, should_bePlaying: None):
+        """
+        This function serves as a prerequisite check for all music-related commands. 
+        It ensures that a player exists for the guild and attempts to connect the bot to the author's voice channel when possible. 
+        If successful returns False. Otherwise, it returns a string with the warning/error.
+
+        See `check_voice()` for the checks done.
+        """
+        # Check if command should continue
+        check, voice_channel = self.check_voice(author, guild, should_connect, should_bePlaying)
+        if check:
+            return check
+
+        # Connect to author's voice channel
+        if voice_channel:
+            await voice_channel.connect(cls=LavalinkVoiceClient)
 
         # If bot connected to author's voice channel or already is in author's voice channel
         return False
@@ -702,15 +1694,49 @@ class MusicCog(commands.Cog):
         # Get player for this guild
         player = self.lavalink.player_manager.get(guild.id)
 
+        # Search query in lavalink
+        tracks, error, playlist_url = await self.resolve_query(query, player.node)
+        if error:
+            return error
+
+        # Add tracks to queue
+        await self.add_tracks_to_queue(tracks, author, guild, playlist_urls=[playlist_url] if playlist_url else None)
+
+        return False
+
+    async def resolve_query(self, query: str, node: lavalink.Node):
+        """
+        Search the user query in lavalink.
+
+        The query can eith be url or name. If it is url, it can be a playlist.
+        Default search engine is Spotify.
+
+        If the url selects a track inside a playlist, only that track is loaded, so that it doesn't wait for the whole 
+        playlist. The rest of the playlist is then loaded in the background (see `load_playlist()`).
+
+        Returns a tuple (tracks, error, playlist_url). If successful, tracks is the list of tracks to add to queue and error is None.
+        Otherwise, tracks is an empty list and error is a string with the warning/error.
+        playlist_url is the url of the playlist whose remaining tracks must still be loaded, otherwise None.
+        """
         # Remove leading and trailing <>. <> may be used to suppress embedding links in Discord.
         query = query.strip('<>')
 
         # Check if query is url. If not, the deafault search engine is used.
         if not url_rx.match(query):
             query = f'spsearch:{query}'
+
+        # If url selects a track inside a playlist, load only that track first (falls back to the whole playlist if it fails)
+        track_url = playlist_track_url(query)
+        if track_url:
+            tracks, error, _ = await self.resolve_query(track_url, node)
+            if not error:
+                return tracks, None, query
         
         # Get the results for the query from Lavalink.
-        results = await player.node.get_tracks(query)
+        try:
+            results = await node.get_tracks(query)
+        except Exception:
+            return [], 'I encountered an error while searching for that query.', None
 
         # Check each valid load_types:
         #   TRACK    - direct URL to a track
@@ -718,39 +1744,311 @@ class MusicCog(commands.Cog):
         #   SEARCH   - query prefixed with either "ytsearch:" or "scsearch:". This could possibly be expanded with plugins.
         #   EMPTY    - no results for the query (result.tracks will be empty)
         #   ERROR    - the track encountered an exception during loading
-        if results.load_type == LoadType.EMPTY:
-            return 'No results found.'
+        if results.load_type == LoadType.EMPTY or not results.tracks:
+            return [], 'No results found.', None
         
         elif results.load_type == LoadType.ERROR:
-            return 'I encountered an error while searching for that query.'
+            return [], 'I encountered an error while searching for that query.', None
         
         elif results.load_type == LoadType.PLAYLIST:
             # Get List of tracks in the playlist
-            tracks = results.tracks
-
-            # Add each track from playlists to the queue
-            for track in tracks:
-                # Save author mention for music message embed
-                track.extra['requester'] = author
-                player.add(track=track)
+            return results.tracks, None, None
 
         else: # (TRACK or SEARCH)
             # Get first track from results
-            track = results.tracks[0]
+            return [results.tracks[0]], None, None
 
-            # Save author mention for music message embed
-            track.extra['requester'] = author
+    async def resolve_queries(self, queries: List[str], node: lavalink.Node):
+        """
+        Search multiple user queries in lavalink.
 
-            # Add track to queue
-            player.add(track=track)
+        Queries are searched concurrently (at most `BULK_CONCURRENCY` at a time), and the resolved tracks are returned 
+        in the same order the queries were submitted.
 
-        # If player is not playing, start playing. Otherwise, refresh embed.
-        if not player.is_playing:
-            await player.play()
-        else:
+        Returns a tuple (tracks, failed, playlist_urls), where tracks is the list of resolved tracks, failed is a list of
+        (line number, query, error) for each query that failed, and playlist_urls is the list of playlists whose remaining
+        tracks must still be loaded (see `resolve_query()`).
+        """
+        # Search queries concurrently, with bounded parallelism
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        async def resolve(query: str):
+            async with semaphore:
+                return await self.resolve_query(query, node)
+        results = await asyncio.gather(*(resolve(query) for query in queries))
+
+        # Collect tracks in submission order
+        tracks = []
+        failed = []
+        playlist_urls = []
+        for line, (query, (resolved_tracks, error, playlist_url)) in enumerate(zip(queries, results), start=1):
+            if error:
+                failed.append((line, query, error))
+            else:
+                tracks.extend(resolved_tracks)
+                if playlist_url:
+                    playlist_urls.append(playlist_url)
+
+        return tracks, failed, playlist_urls
+
+    async def connect_and_resolve(self, voice_channel: Optional[discord.VoiceChannel], queries: List[str], node: lavalink.Node):
+        """
+        Search queries with `resolve_queries()`. If the bot is not in a voice channel yet (voice_channel is given), 
+        it connects to it concurrently, as both are the slowest steps before audio starts.
+
+        Returns a tuple (tracks, failed, playlist_urls, check). If connecting or searching fails, the search results are dropped and 
+        check is a string with the warning/error. Otherwise, check is False.
+        """
+        # Bot already in voice channel, only search
+        if not voice_channel:
+            tracks, failed, playlist_urls = await self.resolve_queries(queries, node)
+            return tracks, failed, playlist_urls, False
+
+        # Connect and search concurrently
+        connect_result, resolve_result = await asyncio.gather(
+            voice_channel.connect(cls=LavalinkVoiceClient),
+            self.resolve_queries(queries, node),
+            return_exceptions=True
+        )
+        if isinstance(connect_result, BaseException):
+            return [], [], [], 'I couldn\'t connect to your voice channel.'
+        if isinstance(resolve_result, BaseException):
+            return [], [], [], 'I encountered an error while searching for that query.'
+        return *resolve_result, False
+
+    async def get_message_queries(self, message: discord.Message):
+        """
+        Get the queries from a music text channel message: one query per non empty line of the message, followed by
+        the queries in track list attachments (`.txt`, `.m3u`, `.json`).
+
+        Returns a tuple (queries, errors), where errors is a list of strings with the attachments that couldn't be read.
+        At most `BULK_MAX_QUERIES` queries are returned.
+        """
+        queries = parse_text(message.content)
+        errors = []
+
+        # Read track list attachments
+        for attachment in message.attachments:
+            if not is_track_list(attachment.filename):
+                continue
+            if attachment.size > TRACK_LIST_MAX_SIZE:
+                errors.append(f'`{attachment.filename}` - Track list is too large (max {TRACK_LIST_MAX_SIZE // 1024}KB).')
+                continue
+            try:
+                content = (await attachment.read()).decode('utf-8-sig')
+                queries.extend(parse_track_list(attachment.filename, content))
+            except Exception:
+                errors.append(f'`{attachment.filename}` - Could not read track list.')
+
+        # Limit number of queries
+        if len(queries) > BULK_MAX_QUERIES:
+            errors.append(f'Only the first {BULK_MAX_QUERIES} queries were added.')
+            queries = queries[:BULK_MAX_QUERIES]
+
+        return queries, errors
+
+    async def add_tracks_to_queue(self, 
+                                  tracks: List[lavalink.AudioTrack], 
+                                  author: discord.Member, 
+                                  guild: discord.Guild, 
+                                  encoded_tracks: Optional[List[str]] = None,
+                                  playlist_urls: Optional[List[str]] = None):
+        """
+        Add already resolved tracks to lavalink queue, without any search.
+
+        Tracks are streamed to the queue: if the player is not playing, the first track starts playing as soon as it is added,
+        and only the first `QUEUE_PAGE_SIZE` tracks are added to the queue. The remaining tracks, followed by `encoded_tracks`
+        (already encoded tracks, if given), are kept in a lazy PlaylistCursor and added page by page when the queue runs low.
+        The remaining tracks of `playlist_urls` (playlists whose selected track was resolved on its own, see `resolve_query()`)
+        are loaded in the background and added after.
+
+        NOTE: This function assumes that `check_and_join()` has already been called before this function is called. 
+        NOTE: Runs in the guild mailbox, serialized with the other player mutations and Lavalink event handlers.
+        """
+        # Run in the guild mailbox
+        mailbox = self.get_context(guild.id).mailbox
+        if not mailbox.is_current():
+            return await mailbox.run(self.add_tracks_to_queue, tracks, author, guild, encoded_tracks, playlist_urls)
+
+        # Get player for this guild
+        player = self.lavalink.player_manager.get(guild.id)
+
+        # Check if player is already playing
+        was_playing = player.is_playing
+
+        # Add first page of tracks to the queue
+        for i, track in enumerate(tracks[:QUEUE_PAGE_SIZE]):
+            # Save author ID for music message embed
+            player.add(track=track, requester=author.id)
+
+            # If player is not playing, start playing as soon as the first track is added
+            if i == 0 and not was_playing:
+                await player.play()
+
+        # Keep remaining tracks in a lazy PlaylistCursor
+        pending = [track.track for track in tracks[QUEUE_PAGE_SIZE:] if track.track] + (encoded_tracks or [])
+        if pending:
+            cursors = player.fetch('playlist_cursors')
+            if cursors is None:
+                cursors = deque()
+                player.store('playlist_cursors', cursors)
+            cursors.append(PlaylistCursor(pending, author.id))
+
+        # Load remaining playlist tracks in the background
+        if playlist_urls:
+            loads = player.fetch('playlist_loads')
+            if loads is None:
+                loads = set()
+                player.store('playlist_loads', loads)
+            for url in playlist_urls:
+                load = object()
+                loads.add(load)
+                self.bot.task_registry.spawn(self.load_playlist(url, load, author, guild), owner=guild.id, category='playlist_load')
+
+        # If player was already playing, refresh embed.
+        if was_playing:
             # Update music embed
             await self.update_music_embed(guild)
 
+    async def load_playlist(self, url: str, load: object, author: discord.Member, guild: discord.Guild):
+        """
+        Load the whole playlist of a url whose selected track was already added to the queue (see `resolve_query()`), 
+        and add its remaining tracks to the queue with `add_loaded_playlist()`.
+        """
+        # Get player for this guild
+        player = self.lavalink.player_manager.get(guild.id)
+        if not player:
+            return
+
+        # Load playlist, without its selected track (already in queue)
+        tracks = []
+        try:
+            results = await player.node.get_tracks(url)
+            if results.load_type == LoadType.PLAYLIST:
+                tracks = list(results.tracks)
+                if 0 <= results.playlist_info.selected_track < len(tracks):
+                    del tracks[results.playlist_info.selected_track]
+        except Exception as e:
+            logger.warning(f'Failed to load the rest of playlist {url} in guild {guild.id}: {e}')
+
+        await self.add_loaded_playlist(tracks, load, author, guild)
+
+    async def add_loaded_playlist(self, tracks: List[lavalink.AudioTrack], load: object, author: discord.Member, guild: discord.Guild):
+        """
+        Add the remaining tracks of a playlist loaded by `load_playlist()` to the queue. They are dropped if the load
+        was dropped in the meantime (queue cleared or player stopped, see `clear_pending()`).
+
+        NOTE: Runs in the guild mailbox, serialized with the other player mutations and Lavalink event handlers.
+        """
+        # Run in the guild mailbox
+        mailbox = self.get_context(guild.id).mailbox
+        if not mailbox.is_current():
+            return await mailbox.run(self.add_loaded_playlist, tracks, load, author, guild)
+
+        # Check if load was dropped
+        player = self.lavalink.player_manager.get(guild.id)
+        loads = player.fetch('playlist_loads') if player else None
+        if not loads or load not in loads:
+            return
+        loads.discard(load)
+
+        # Add tracks to queue
+        if tracks:
+            await self.add_tracks_to_queue(tracks, author, guild)
+
+    async def refill_queue(self, player: lavalink.DefaultPlayer):
+        """
+        Add the next pages of pending playlist tracks (PlaylistCursors) to the queue, while the queue is running low.
+        Returns True if any track was added to the queue, otherwise False.
+        """
+        # Get pending PlaylistCursors for this player
+        cursors = player.fetch('playlist_cursors')
+
+        # Add pages until queue is no longer running low
+        added = False
+        while cursors and len(player.queue) < QUEUE_LOW_WATER:
+            cursor = cursors[0]
+
+            # Decode next page of tracks and add them to the queue
+            for track in await decode_tracks(self.lavalink, cursor.take(QUEUE_PAGE_SIZE)):
+                player.add(track=track, requester=cursor.requester)
+                added = True
+            
+            # Remove cursor when all its tracks were added to queue
+            if not len(cursor):
+                cursors.popleft()
+
+        return added
+
+    @staticmethod
+    def get_pending_count(player: Optional[lavalink.DefaultPlayer]):
+        """Returns the number of pending playlist tracks (in PlaylistCursors) not yet added to the queue."""
+        if not player:
+            return 0
+        return sum(len(cursor) for cursor in player.fetch('playlist_cursors', default=()))
+
+    @staticmethod
+    def shuffle_queue(player: lavalink.DefaultPlayer):
+        """Shuffles the queue and the pending playlist tracks (PlaylistCursors) not yet added to the queue."""
+        player.queue.shuffle()
+        for cursor in player.fetch('playlist_cursors', default=()):
+            cursor.shuffle()
+
+    @staticmethod
+    def clear_pending(player: lavalink.DefaultPlayer):
+        """Removes all pending playlist tracks (PlaylistCursors and playlists still loading) not yet added to the queue."""
+        player.delete('playlist_cursors')
+        player.delete('playlist_loads')
+
+    async def add_playlist_to_queue(self, name: str, url: str, shuffle: bool, author: discord.Member, guild: discord.Guild):
+        """
+        Add saved playlist to lavalink queue.
+
+        The playlist tracks are taken from the playlist snapshot, without any search. If the snapshot does not exist yet,
+        the playlist url is searched instead and the snapshot is refreshed in the background.
+        If shuffle is True, the playlist tracks are shuffled before being added to the queue.
+
+        If successful returns False. Otherwise, it returns a string with the warning/error.
+
+        NOTE: This function assumes that `check_and_join()` has already been called before this function is called. 
+        """
+        # Get playlist snapshot
+        snapshot = self.playlist_snapshots.get_snapshot(guild.id, name)
+
+        # If snapshot does not exist, search playlist url and refresh snapshot in the background
+        if not snapshot or snapshot.get('url') != url:
+            self.bot.task_registry.spawn(self.playlist_snapshots.refresh_snapshot(guild.id, name, url), owner=guild.id, category='snapshot_refresh')
+
+            # Get player for this guild
+            player = self.lavalink.player_manager.get(guild.id)
+
+            # Is shuffle is True, set lavalink shuffle for random first song
+            player.set_shuffle(shuffle)
+
+            # Add playlists url to queue
+            add_to_queue_check = await self.add_to_queue(url, author, guild)
+
+            # Set lavalink shuffle to False
+            player.set_shuffle(False)
+
+            # Shuffle rest of queue if shuffle is True
+            if not add_to_queue_check and shuffle:
+                self.shuffle_queue(player)
+                await self.update_music_embed(guild)
+            return add_to_queue_check
+
+        # Get snapshot encoded tracks, and shuffle them if shuffle is True
+        encoded_tracks = list(snapshot.get('tracks', []))
+        if shuffle:
+            random.shuffle(encoded_tracks)
+
+        # Decode only the first page of tracks, the remaining are kept encoded until needed
+        tracks = await decode_tracks(self.lavalink, encoded_tracks[:QUEUE_PAGE_SIZE])
+        if not tracks:
+            return 'No tracks found for that playlist.'
+
+        # Add tracks to queue
+        await self.add_tracks_to_queue(tracks, author, guild, encoded_tracks=encoded_tracks[QUEUE_PAGE_SIZE:])
+
         return False
     
     ######################################
@@ -764,6 +2062,30 @@ class MusicCog(commands.Cog):
             for pl_name in self.get_guild_music_data(interaction.guild.id).get('playlists', {}) if current.lower() in pl_name.lower()
         ]
     
+    async def play_autocomplete(self, interaction: discord.Interaction, current: str):
+        """
+        Auxiliar function to autocomplete track suggestions for the query input of /play.
+
+        Suggestions come from the debounced and cached SearchCache, which always answers within Discord's deadline.
+        The choice value is a SearchCache token, so that the chosen track is added to queue without a second search.
+        """
+        # Skip short queries, urls and when no lavalink nodes are available
+        if len(current.strip()) < 3 or url_rx.match(current) or not self.lavalink or not self.lavalink.node_manager.available_nodes:
+            return []
+
+        # Get suggestions
+        node = self.lavalink.node_manager.find_ideal_node()
+        tracks = await self.search_cache.autocomplete(node, interaction.user.id, current)
+
+        # Create choices (name is limited to 100 characters)
+        choices = []
+        for track in tracks[:self.search_cache.max_results]:
+            duration = format_track_duration(track)
+            name = f'{track.author} - {track.title}'
+            name = f'{name[:100 - len(duration) - 6]}... ({duration})' if len(name) + len(duration) + 3 > 100 else f'{name} ({duration})'
+            choices.append(app_commands.Choice(name=name, value=self.search_cache.store_track(track)))
+        return choices
+
     @staticmethod
     def is_valid_emoji(interaction: discord.Interaction, emoji: str):
         """Checks if the emoji is valid (Unicode or custom guild emoji)."""
@@ -791,51 +2113,24 @@ class MusicCog(commands.Cog):
                     queue_size: int, 
                     queue_time: int,
                     current_page: int,
-                    total_pages: int):
-        """Creates an embed for the queue."""
+                    total_pages: int,
+                    pending: int = 0):
+        """Creates an embed for the queue. `pending` is the number of pending playlist tracks not yet in queue."""
         # Initialize description of embed
         description = ""
 
         # Format current track
         current_track_str = None
         if current_track:
-            current_track_duration_str = (
-                f'{str(current_track.duration // 3600000).zfill(2)}:{(current_track.duration % 3600000) // 60000:02d}:{(current_track.duration % 60000) // 1000:02d}'
-                if current_track.duration >= 3600000 else
-                f'{str(current_track.duration // 60000).zfill(2)}:{current_track.duration % 60000 // 1000:02d}'
-            )
-            current_track_str=(
-                f'[{current_track.author} - {current_track.title}]({current_track.uri})'
-                f' - `{current_track_duration_str}`'
-                if current_track.is_seekable else
-                f'{current_track.uri}'
-                f' - `{current_track_duration_str}`'
-            )
+            current_track_str = track_link_line(current_track)
         description += '**♪ Now playing**\n'
         description += f'> {current_track_str}\n\n' if current_track_str else '> `No music`\n\n'
 
         # Format queue
-        description += f'**🎶 Tracks in queue({queue_size})**\n'
+        description += f'**🎶 Tracks in queue({queue_size}{f" +{pending} pending" if pending else ""})**\n'
         if len(queue) == 0:
             description += '> `No track in queue`'
-        for i,track in enumerate(queue):
-            if track.is_stream:
-                track_duration_str = 'LIVE'
-            else:
-                track_duration_str = (
-                    f'{str(track.duration // 3600000).zfill(2)}:{(track.duration % 3600000) // 60000:02d}:{(track.duration % 60000) // 1000:02d}'
-                    if track.duration >= 3600000 else
-                    f'{str(track.duration // 60000).zfill(2)}:{track.duration % 60000 // 1000:02d}'
-                )
-            description += (
-                f'**[{(current_page-1)*10+i+1}]** `-` '
-                f'[{track.author} - {track.title}]({track.uri})'
-                f' - `{track_duration_str}`\n' 
-                if track.is_seekable else
-                f'**[{(current_page-1)*10+i+1}]** `-` '
-                f'{track.uri}'
-                f' - `{track_duration_str}`\n'
-            )
+        description += queue_page(queue, (current_page-1)*10+1)
 
         # Create embed
         embed = Embed(
@@ -845,11 +2140,7 @@ class MusicCog(commands.Cog):
         )
 
         # Format queue time
-        queue_time_str = (
-            f'{str(queue_time // 3600000).zfill(2)}:{(queue_time % 3600000) // 60000:02d}:{(queue_time % 60000) // 1000:02d}'
-            if queue_time >= 3600000 else
-            f'{str(queue_time // 60000).zfill(2)}:{queue_time % 60000 // 1000:02d}'
-        )
+        queue_time_str = format_duration(queue_time)
         embed.add_field(
             name='**⏱ Queue time**',
             value=f'> `{queue_time_str}`',
@@ -1087,6 +2378,90 @@ class MusicCog(commands.Cog):
         else:
             await interaction.response.send_message(embed=info_embed(f'Auto-disconnect `disabled`.'))
     
+    @app_commands.command(name='auto-pause', description='Enable or Disable auto-pause when voice channel empties. Change auto-pause grace period.', extras={'Category': 'Music', 'Sub-Category': 'Settings'})
+    @app_commands.guild_only()
+    @app_commands.checks.cooldown(1, 10.0)
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.checks.bot_has_permissions(embed_links=True)
+    @app_commands.choices(state=[
+    app_commands.Choice(name="Enable", value=1),
+    app_commands.Choice(name="Disable", value=0)
+    ])
+    @app_commands.describe(
+        state="Enable/Disable auto-pause",
+        grace="Set seconds after auto-pause to release the player (it resumes if someone joins before auto-disconnect)",
+    )
+    async def set_auto_pause(self, interaction: discord.Integration, state: Optional[app_commands.Choice[int]] = None, grace: Optional[app_commands.Range[int, 10, 3600]] = None):
+        """Enable or Disable auto-pause when voice channel empties. Change auto-pause grace period."""
+        # Check if any arguments used
+        if not state and not grace:
+            await interaction.response.send_message(embed=error_embed("You must provide at least one argument."), ephemeral=True)
+            return
+        
+        # Set state, if state provided
+        if state:
+            self.add_music_data(
+                guild_id=interaction.guild.id,
+                keys='auto_pause',
+                values=bool(state.value)
+            )
+
+        # Set grace period, if grace provided
+        if grace:
+            self.add_music_data(
+                guild_id=interaction.guild.id,
+                keys='auto_pause_grace',
+                values=grace
+            )
+        
+        # Send info message
+        if self.get_guild_music_data(interaction.guild.id).get('auto_pause', True):
+            await interaction.response.send_message(embed=info_embed(f"Auto-pause `enabled`.\nGrace period: `{self.get_guild_music_data(interaction.guild.id).get('auto_pause_grace', AUTO_PAUSE_GRACE)}s`"))
+        else:
+            await interaction.response.send_message(embed=info_embed(f'Auto-pause `disabled`.'))
+    
+    @app_commands.command(name='hibernation', description='Enable or Disable hibernation of paused players. Change pause duration before hibernating.', extras={'Category': 'Music', 'Sub-Category': 'Settings'})
+    @app_commands.guild_only()
+    @app_commands.checks.cooldown(1, 10.0)
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.checks.bot_has_permissions(embed_links=True)
+    @app_commands.choices(state=[
+    app_commands.Choice(name="Enable", value=1),
+    app_commands.Choice(name="Disable", value=0)
+    ])
+    @app_commands.describe(
+        state="Enable/Disable hibernation",
+        timer="Set pause duration in seconds before the player hibernates (Resume wakes it up)",
+    )
+    async def set_hibernation(self, interaction: discord.Integration, state: Optional[app_commands.Choice[int]] = None, timer: Optional[app_commands.Range[int, 60, 86400]] = None):
+        """Enable or Disable hibernation of paused players. Change pause duration before hibernating."""
+        # Check if any arguments used
+        if not state and not timer:
+            await interaction.response.send_message(embed=error_embed("You must provide at least one argument."), ephemeral=True)
+            return
+        
+        # Set state, if state provided
+        if state:
+            self.add_music_data(
+                guild_id=interaction.guild.id,
+                keys='hibernate',
+                values=bool(state.value)
+            )
+
+        # Set timer, if timer provided
+        if timer:
+            self.add_music_data(
+                guild_id=interaction.guild.id,
+                keys='hibernate_after',
+                values=timer
+            )
+        
+        # Send info message
+        if self.get_guild_music_data(interaction.guild.id).get('hibernate', True):
+            await interaction.response.send_message(embed=info_embed(f"Hibernation `enabled`.\nPause duration: `{self.get_guild_music_data(interaction.guild.id).get('hibernate_after', HIBERNATE_AFTER)}s`"))
+        else:
+            await interaction.response.send_message(embed=info_embed(f'Hibernation `disabled`.'))
+    
     @app_commands.command(name='music-settings', description='Shows guild\'s music player settings', extras={'Category': 'Music', 'Sub-Category': 'Settings'})
     @app_commands.guild_only()
     @app_commands.checks.cooldown(1, 10.0)
@@ -1117,6 +2492,7 @@ class MusicCog(commands.Cog):
             value=(
                 f'🔖 **Music Text Channel:** {music_text_channel.mention if music_text_channel else "*None*"}\n'
                 f'💬 **Music Message:** {music_message.jump_url if music_message else "*None*"}\n'
+                f'🩺 **Status:** `{self.guild_health.entries[interaction.guild.id].failure if self.guild_health.is_broken(interaction.guild.id) else "OK"}`\n'
             ),
             inline=False
         )
@@ -1136,6 +2512,10 @@ class MusicCog(commands.Cog):
             value=(
                 f'🔌 **Auto Disconnect:** `{guild_music_data.get("auto_disconnect", "True")}`\n'
                 f'⏳ **Idle Timer:** `{guild_music_data.get("idle_timer", 300)}s`\n'
+                f'⏸️ **Auto Pause:** `{guild_music_data.get("auto_pause", "True")}`\n'
+                f'⌛ **Auto Pause Grace:** `{guild_music_data.get("auto_pause_grace", AUTO_PAUSE_GRACE)}s`\n'
+                f'💤 **Hibernation:** `{guild_music_data.get("hibernate", "True")}`\n'
+                f'🕰️ **Hibernate After:** `{guild_music_data.get("hibernate_after", HIBERNATE_AFTER)}s`\n'
             ),
             inline=False
         )
@@ -1147,6 +2527,62 @@ class MusicCog(commands.Cog):
     ########## PLAYER / COMMANDS #########
     ######################################
     
+    @app_commands.command(name='play', description='Play a track or playlist by name or url', extras={'Category': 'Music', 'Sub-Category': 'Player'})
+    @app_commands.guild_only()
+    @app_commands.checks.cooldown(1, 2.0)
+    @app_commands.checks.bot_has_permissions(embed_links=True)
+    @app_commands.autocomplete(query=play_autocomplete)
+    @app_commands.describe(
+        query="Track name or url (Spotify, Youtube, Soundcloud, AppleMusic, etc.)"
+    )
+    async def play(self, interaction: discord.Interaction, query: str):
+        """Play a track or playlist by name or url. Chosen autocomplete suggestions are added to queue without searching again."""
+        # Check if command should continue using check_voice(). Connecting (if needed) is done below
+        check, voice_channel = self.check_voice(interaction.user, interaction.guild, should_connect=True, should_bePlaying=False)
+        if check:
+            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            return
+
+        # Prevents the interaction from timing out
+        await interaction.response.defer(ephemeral=True)
+
+        # Get player for this guild
+        player = self.lavalink.player_manager.get(interaction.guild.id)
+
+        # Get chosen autocomplete suggestion, if any
+        suggested_track = self.search_cache.get_track(query)
+
+        # Add suggested track (copy, as it may be chosen again), connecting to voice channel if needed
+        if suggested_track:
+            if voice_channel:
+                try:
+                    await voice_channel.connect(cls=LavalinkVoiceClient)
+                except Exception:
+                    await interaction.followup.send(embed=error_embed('I couldn\'t connect to your voice channel.'), ephemeral=True)
+                    return
+            tracks = [lavalink.AudioTrack(suggested_track)]
+            playlist_urls = []
+
+        # Otherwise, search query, connecting to voice channel concurrently if needed
+        else:
+            tracks, failed, playlist_urls, connect_check = await self.connect_and_resolve(voice_channel, [query], player.node)
+            if connect_check or failed:
+                await interaction.followup.send(embed=error_embed(connect_check or failed[0][2]), ephemeral=True)
+                return
+
+        # Add tracks to queue
+        await self.add_tracks_to_queue(tracks, interaction.user, interaction.guild, playlist_urls=playlist_urls)
+
+        # Send success message
+        message = (
+            f'Added `{tracks[0].author} - {tracks[0].title}` to queue.'
+            if len(tracks) == 1 else
+            f'Added `{len(tracks)}` tracks to queue.'
+        )
+        if playlist_urls:
+            message += ' The rest of the playlist is being added.'
+        await interaction.followup.send(embed=success_embed(message), ephemeral=True)
+
     @app_commands.command(name='volume', description='Change bot\'s audio volume', extras={'Category': 'Music', 'Sub-Category': 'Player'})
     @app_commands.guild_only()
     @app_commands.checks.cooldown(1, 3.0)
@@ -1154,26 +2590,24 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         volume="Set the player volume (0-200)"
     )
+    @serialized
     async def volume(self, interaction: discord.Interaction, volume: app_commands.Range[int, 0, 200]):
         """Change bot's audio volume."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=False)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
         player = self.lavalink.player_manager.get(interaction.guild.id)
 
-        # Set player volume
-        await player.set_volume(volume)
-
-        # Update music message embed
-        if player.is_playing:
-            await self.update_music_embed(interaction.guild)
+        # Set player volume (music message embed is updated once the change is sent to Lavalink)
+        player.queue_update(volume=volume)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Volume set to `{volume}%`'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Volume set to `{volume}%`'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='seek', description='Skips to a specified time in the current song', extras={'Category': 'Music', 'Sub-Category': 'Player'})
     @app_commands.guild_only()
@@ -1182,12 +2616,13 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         time="Time to skip to (in seconds)",
     )
+    @serialized
     async def seek_time(self, interaction: discord.Integration, time: app_commands.Range[int, 0, 999999999]):
         """Skips to a specific time in the current song."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
@@ -1201,14 +2636,15 @@ class MusicCog(commands.Cog):
 
         # Check if given time is valid
         if time > current_track_duration:
-            await interaction.response.send_message(embed=error_embed(f'Invalid time. Current track is `{int(current_track_duration)}` seconds long.'), ephemeral=True)
+            await respond(interaction, embed=error_embed(f'Invalid time. Current track is `{int(current_track_duration)}` seconds long.'), ephemeral=True)
             return
 
-        # Seek to given time
-        await player.seek(time * 1000)
+        # Seek to given time (sent to Lavalink merged with other changes made meanwhile)
+        player.queue_update(position=time * 1000)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Skipped to `{time}` seconds'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Skipped to `{time}` seconds'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='fast-forward', description='Fast forwards the current track by a specificied ammount. Default is 15 seconds.', extras={'Category': 'Music', 'Sub-Category': 'Player'})
     @app_commands.guild_only()
@@ -1217,22 +2653,24 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         time="Time to fast forward by (in seconds)",
     )
+    @serialized
     async def fast_forward(self, interaction: discord.Integration, time: Optional[app_commands.Range[int, 0, 999999999]] = 15):
         """Fast forwards the current track by a specificied ammount. Default is 15 seconds."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
         player = self.lavalink.player_manager.get(interaction.guild.id)
 
-        # Seek to given time
-        await player.seek(player.position + time * 1000)
+        # Seek to given time, from intended position (sent to Lavalink merged with other changes made meanwhile)
+        player.queue_update(position=player.position + time * 1000)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Fast forwarded by `{time}` seconds.\nNew position: `{int(player.position / 1000)}s`'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Fast forwarded by `{time}` seconds.\nNew position: `{int(player.position / 1000)}s`'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='rewind', description='Rewinds the current track by a specificied ammount. Default is 15 seconds.', extras={'Category': 'Music', 'Sub-Category': 'Player'})
     @app_commands.guild_only()
@@ -1241,22 +2679,24 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         time="Time to rewind by (in seconds)",
     )
+    @serialized
     async def rewind(self, interaction: discord.Integration, time: Optional[app_commands.Range[int, 0, 999999999]] = 15):
         """Rewinds the current track by a specificied ammount. Default is 15 seconds."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
         player = self.lavalink.player_manager.get(interaction.guild.id)
 
-        # Seek to given time
-        await player.seek(player.position - time * 1000)
+        # Seek to given time, from intended position (sent to Lavalink merged with other changes made meanwhile)
+        player.queue_update(position=player.position - time * 1000)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Rewound by `{time}` seconds.\nNew position: `{int(player.position / 1000)}s`'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Rewound by `{time}` seconds.\nNew position: `{int(player.position / 1000)}s`'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='time', description='Get the current time of the playing track.', extras={'Category': 'Music', 'Sub-Category': 'Player'})
     @app_commands.guild_only()
@@ -1282,18 +2722,10 @@ class MusicCog(commands.Cog):
             return
 
         # Get track duration
-        track_duration_str = (
-            f'{str(track.duration // 3600000).zfill(2)}:{(track.duration % 3600000) // 60000:02d}:{(track.duration % 60000) // 1000:02d}'
-            if track.duration >= 3600000 else
-            f'{str(track.duration // 60000).zfill(2)}:{track.duration % 60000 // 1000:02d}'
-        )
+        track_duration_str = format_duration(track.duration)
 
-        # Get track position
-        track_position_str = (
-            f'{str(player.position // 3600000).zfill(2)}:{(player.position % 3600000) // 60000:02d}:{(player.position % 60000) // 1000:02d}'
-            if track.duration >= 3600000 else
-            f'{str(player.position // 60000).zfill(2)}:{player.position % 60000 // 1000:02d}'
-        )
+        # Get track position, in the same format as the track duration
+        track_position_str = format_duration(player.position, hours=track.duration >= 3600000)
 
         # Send info message
         await interaction.response.send_message(embed=info_embed(f'Current track position: `{track_position_str}`/`{track_duration_str}`'))
@@ -1317,65 +2749,38 @@ class MusicCog(commands.Cog):
         # Get player for this guild
         player = self.lavalink.player_manager.get(interaction.guild.id)
 
-        # Get current track
-        current_track = player.current
-
-        # Get queue list
-        queue = player.queue
-
-        # Get queue size
-        queue_size = len(queue)
-
-        # Get queue time in ms
-        queue_time = 0
-        queue_time = sum(t.duration for t in queue if not t.is_stream)
-        queue_time += current_track.duration if current_track and not current_track.is_stream else 0
-
-        # Get first 10 or less tracks to show
-        if queue_size > 10:
-            show_queue = queue[:10]
-        else:
-            show_queue = queue
-
-        # Gat total number of pages
-        total_pages = queue_size // 10
-        total_pages += 1 if queue_size % 10 or queue_size == 0 else 0
-        
-        # Create embed
-        embed = self.queue_embed(interaction.guild, 
-                                 current_track, 
-                                 show_queue, 
-                                 queue_size, 
-                                 queue_time,
-                                 1,
-                                 total_pages)
+        # Take a snapshot of the queue, to be paginated by the view
+        view = QueueButtonsView(self, interaction.guild, QueueSnapshot(player, self.get_pending_count(player)))
 
-        # Send embed
-        await interaction.response.send_message(embed=embed, view=QueueButtonsView(self, interaction.guild, 1, total_pages), ephemeral=True)
+        # Send embed with first page
+        await interaction.response.send_message(embed=view.get_embed(), view=view, ephemeral=True)
 
     @app_commands.command(name='clear-queue', description='Clear the queue', extras={'Category': 'Music', 'Sub-Category': 'Queue'})
     @app_commands.guild_only()
     @app_commands.checks.cooldown(1, 5.0)
     @app_commands.checks.bot_has_permissions(embed_links=True)
+    @serialized
     async def clear_queue(self, interaction: discord.Integration):
         """Clear the queue."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
         player = self.lavalink.player_manager.get(interaction.guild.id)
 
-        # Clear queue
+        # Clear queue and pending playlist tracks
         player.queue.clear()
+        self.clear_pending(player)
 
         # Update music message embed
         await self.update_music_embed(interaction.guild)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Queue cleared.'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Queue cleared.'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='jump', description='Jump to specified track in the queue', extras={'Category': 'Music', 'Sub-Category': 'Queue'})
     @app_commands.guild_only()
@@ -1384,12 +2789,13 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         position="Position of track in queue",
     )
+    @serialized
     async def jump(self, interaction: discord.Integration, position: app_commands.Range[int, 1, 999999999]):
         """Jump to specified track in the queue."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
@@ -1400,14 +2806,14 @@ class MusicCog(commands.Cog):
 
         # Check if given position is valid
         if position > len(queue):
-            await interaction.response.send_message(embed=error_embed(f'Position must be between `1` and `{len(queue)}`.'), ephemeral=True)
+            await respond(interaction, embed=error_embed(f'Position must be between `1` and `{len(queue)}`.'), ephemeral=True)
             return
 
-        # Check if loop queue is enabled
+        # Check if loop queue is enabled (skipped tracks go to the end of the queue), otherwise drop skipped tracks
         if player.loop == player.LOOP_QUEUE:
-            player.queue = queue[position - 1:] + queue[:position - 1]
+            queue.rotate(position - 1)
         else:
-            player.queue = queue[position - 1:]
+            queue.drop_front(position - 1)
         
         # Play selected track
         if player.loop == player.LOOP_SINGLE:
@@ -1416,7 +2822,8 @@ class MusicCog(commands.Cog):
             await player.skip()
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Jumped to position `{position}` in queue.'), delete_after=7)
+        await respond(interaction, embed=success_embed(f'Jumped to position `{position}` in queue.'))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='remove', description='Remove specified track from queue', extras={'Category': 'Music', 'Sub-Category': 'Queue'})
     @app_commands.guild_only()
@@ -1425,12 +2832,13 @@ class MusicCog(commands.Cog):
     @app_commands.describe(
         position="Position of track in queue",
     )
+    @serialized
     async def remove_from_queue(self, interaction: discord.Integration, position: app_commands.Range[int, 1, 999999999]):
         """Remove specified track from queue"""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
@@ -1441,7 +2849,7 @@ class MusicCog(commands.Cog):
 
         # Check if given position is valid
         if position > len(queue):
-            await interaction.response.send_message(embed=error_embed(f'Position must be between `1` and `{len(queue)}`.'), ephemeral=True)
+            await respond(interaction, embed=error_embed(f'Position must be between `1` and `{len(queue)}`.'), ephemeral=True)
             return
 
         # Remove track from queue
@@ -1456,7 +2864,8 @@ class MusicCog(commands.Cog):
             if removed_track.is_seekable else
             f'Track `{position}. {removed_track.uri}` removed from queue.'
         )
-        await interaction.response.send_message(embed=success_embed(message), delete_after=7)
+        await respond(interaction, embed=success_embed(message))
+        self.bot.timers.expire_response(interaction, 7)
     
     @app_commands.command(name='move', description='Move specified track in queue', extras={'Category': 'Music', 'Sub-Category': 'Queue'})
     @app_commands.guild_only()
@@ -1469,12 +2878,13 @@ class MusicCog(commands.Cog):
         frrom="Current position of track in queue",
         to="New position of track in queue"
     )
+    @serialized
     async def move(self, interaction: discord.Integration, frrom: app_commands.Range[int, 1, 999999999], to: app_commands.Range[int, 1, 999999999]):
         """Move specified track in queue."""
         # Check if command should continue using check_and_join()
         check = await self.check_and_join(interaction.user, interaction.guild, should_connect=False, should_bePlaying=True)
         if check:
-            await interaction.response.send_message(embed=error_embed(check), ephemeral=True)
+            await respond(interaction, embed=error_embed(check), ephemeral=True)
             return
 
         # Get player for this guild
@@ -1482,7 +2892,7 @@ class MusicCog(commands.Cog):
 
         # Check if given from position is valid
         if frrom > len(player.queue):
-            await interaction.response.send_message(embed=error_embed(f'`from` position must be between `1` and `{len(player.queue)}`.'), ephemeral=True)
+            await respond(interaction, embed=error_embed(f'`from` position must be between `1` and `{len(player.queue)}`.'), ephemeral=True)
             return
 
         # Check if to position is valid
@@ -1490,19 +2900,22 @@ class MusicCog(commands.Cog):
             to = len(player.queue)
 
         # Move track in queue
-        track = player.queue.pop(frrom-1)
-        player.queue.insert(to-1, track)
+        track = player.queue.move(frrom-1, to-1)
 
         # Update music message embed
         await self.update_music_embed(interaction.guild)
 
-        # Send success message
+        # Send success message, with the time until the moved track starts (if current track is not a stream)
         message = (
             f'Moved track `{track.author} - {track.title}` from **{frrom}.** to **{to}.** in queue.'
             if track.is_seekable else
             f'Moved track `{track.uri}` from **{frrom}.** to **{to}.** in queue.'
         )
-        await interaction.response.send_message(embed=success_embed(message), delete_after=7)
+        if player.current and not player.current.is_stream:
+            starts_in = player.current.duration - player.position + player.queue.starts_in(to-1)
+            message += f'\nStarts in `{format_duration(max(0, starts_in))}`.'
+        await respond(interaction, embed=success_embed(message))
+        self.bot.timers.expire_response(interaction, 7)
     
     ######################################
     ######### PLAYLISTS / COMMANDS #######
@@ -1630,6 +3043,20 @@ class MusicCog(commands.Cog):
             keys.append('shuffle')
             values.append(bool(shuffle.value))
 
+        # If Lavalink is available, resolve playlist and store its snapshot (which validates the url). Otherwise, the playlist
+        # is added without snapshot, which is created by `refresh_playlist_snapshots()` once Lavalink is available.
+        has_nodes = bool(self.lavalink.node_manager.available_nodes)
+        if has_nodes:
+            # Prevents the interaction from timing out, while the playlist is resolved
+            await interaction.response.defer()
+
+            snapshot_check = await self.playlist_snapshots.refresh_snapshot(interaction.guild.id, name, url)
+            if snapshot_check:
+                # Replace the public "thinking" response, so that the error is ephemeral
+                await interaction.delete_original_response()
+                await interaction.followup.send(embed=error_embed(snapshot_check), ephemeral=True)
+                return
+
         # Add playlist to guild music data
         self.add_music_data(
             guild_id=interaction.guild.id,
@@ -1639,10 +3066,14 @@ class MusicCog(commands.Cog):
         )
 
         # Update MusicPLayerView
-        await self.update_musicplayerview(interaction.guild.id)
+        await self.update_musicplayerview(interaction.guild.id, playlists_changed=True)
 
         # Send success message
-        await interaction.response.send_message(embed=success_embed(f'Playlist **[{name}]({url})** added.'))
+        if not has_nodes:
+            await interaction.response.send_message(embed=success_embed(f'Playlist **[{name}]({url})** added. Its tracks will be loaded once the music server is available.'))
+            return
+        track_count = len(self.playlist_snapshots.get_snapshot(interaction.guild.id, name)['tracks'])
+        await interaction.followup.send(embed=success_embed(f'Playlist **[{name}]({url})** added with `{track_count}` tracks.'))
     
     @pl.command(name='list', description='List all saved playlists', extras={'Category': 'Music', 'Sub-Category': 'Playlist'})
     @app_commands.guild_only()
@@ -1684,19 +3115,28 @@ class MusicCog(commands.Cog):
             # Combine emoji and button label (ensure no extra spaces)
             button_display = f"{emoji} {button_label}".strip()
 
+            # Get snapshot track count and age
+            snapshot = self.playlist_snapshots.get_snapshot(interaction.guild.id, pl_name)
+            snapshot_display = (
+                f"`{len(snapshot.get('tracks', []))}` tracks, updated <t:{int(snapshot.get('updated_at', 0))}:R>"
+                if snapshot else
+                '`Pending`'
+            )
+
             # Format playlist details
             embed.add_field(
                 name='',
                 value=(
                     f"**[{i+1}]** - 🎶  **[{pl_name}]({playlist['url']})**  🎶\n"
                     f"*Button:* {button_display}\n"
-                    f"*Shuffle:* `{playlist.get('shuffle', False)}`"
+                    f"*Shuffle:* `{playlist.get('shuffle', False)}`\n"
+                    f"*Snapshot:* {snapshot_display}"
                 ),
                 inline=False
             )
 
         # Footer
-        embed.set_footer(text="➕ Use /pl add to add a playlist\n➖ Use /pl remove to a playlist")
+        embed.set_footer(text="➕ Use /pl add to add a playlist\n➖ Use /pl remove to a playlist\n⟳ Use /pl refresh to refresh a playlist")
 
         # Send embed
         await interaction.response.send_message(embed=embed)
@@ -1720,15 +3160,57 @@ class MusicCog(commands.Cog):
             # Save the updated music data
             self.save_music_data()
 
+            # Delete playlist snapshot
+            self.playlist_snapshots.remove_snapshot(interaction.guild.id, name)
+
             # Send success message embed
             await interaction.response.send_message(embed=success_embed(f'Playlist `{name}` deleted.'))
 
             # Update MusicPLayerView
-            await self.update_musicplayerview(interaction.guild.id)
+            await self.update_musicplayerview(interaction.guild.id, playlists_changed=True)
             return
         await interaction.response.send_message(embed=warning_embed(f'Playlist named `{name}` not found.\nUse `/pl list` to see list of existing playlists.'),
                                                 ephemeral=True)
 
+    @pl.command(name='refresh', description='Refresh saved playlists tracks', extras={'Category': 'Music', 'Sub-Category': 'Playlist'})
+    @app_commands.guild_only()
+    @app_commands.checks.cooldown(1, 30.0)
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.checks.bot_has_permissions(embed_links=True)
+    @app_commands.autocomplete(name=playlist_autocomplete)
+    @app_commands.describe(
+        name="Name of playlist you wish to refresh. Default: all playlists",
+    )
+    async def refresh_playlists(self, interaction: discord.Interaction, name: Optional[str] = None):
+        """Refresh saved playlists tracks. Resolves the playlists again and updates their snapshots."""
+        # Get playlists dictionary
+        playlists = self.get_guild_music_data(interaction.guild.id).get('playlists', {})
+
+        # Check if playlist exists
+        if name and name not in playlists:
+            await interaction.response.send_message(embed=warning_embed(f'Playlist named `{name}` not found.\nUse `/pl list` to see list of existing playlists.'),
+                                                    ephemeral=True)
+            return
+        if not playlists:
+            await interaction.response.send_message(embed=info_embed('🎵 No playlists have been added yet.\nUse `/pl add` to add a playlist.'), ephemeral=True)
+            return
+
+        # Prevents the interaction from timing out, while the playlists are resolved
+        await interaction.response.defer()
+
+        # Refresh playlists snapshots
+        failed = []
+        for pl_name in ([name] if name else playlists):
+            snapshot_check = await self.playlist_snapshots.refresh_snapshot(interaction.guild.id, pl_name, playlists[pl_name].get('url'))
+            if snapshot_check:
+                failed.append(f'`{pl_name}`: {snapshot_check}')
+
+        # Send result message
+        if failed:
+            await interaction.followup.send(embed=warning_embed('Failed to refresh:\n' + '\n'.join(failed)))
+            return
+        await interaction.followup.send(embed=success_embed(f'Playlist `{name}` refreshed.' if name else 'All playlists refreshed.'))
+
 async def setup(bot):
     # Add MusicCog to bot instance
     await bot.add_cog(MusicCog(bot))
\ No newline at end of file
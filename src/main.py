@@ -1,4 +1,6 @@
 import os
+import asyncio
+import signal
 import discord
 from discord import ActivityType, app_commands
 from discord.ext import commands
@@ -6,6 +8,9 @@ from dotenv import load_dotenv
 import time
 from assets.logger.logger import main_logger as logger, debug_logger
 from assets.utils.reply_embed import error_embed, success_embed, warning_embed, info_embed
+from assets.utils.timerwheel import TimerWheel
+from assets.utils.taskregistry import TaskRegistry
+from assets.utils.phasetimer import PhaseTimer
 
 # Indentify each bot start in log
 logger.info(f'STARTING BOT----------------')
@@ -19,9 +24,18 @@ intents = discord.Intents().all()
 # Create bot instance
 bot = commands.Bot(command_prefix='$', intents=intents, help_command=None)
 
+# Shared registry of background tasks (by owner and category)
+bot.task_registry = TaskRegistry()
+
+# Shared timer wheel, for idle disconnects and message expiries
+bot.timers = TimerWheel(bot.task_registry)
+
 # Define cogs to load
 cogs = ['dataloader', 'bot', 'moderation', 'music']
 
+# Time (s) the graceful shutdown may take before the bot is closed anyway (`docker stop` kills it after 10s by default)
+SHUTDOWN_DEADLINE = 8
+
 ############################################################################################################
 ################################################# EVENTS ###################################################
 ############################################################################################################
@@ -140,9 +154,91 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
     else:
         await interaction.response.send_message(embed=error_embed(f'An unexpected error has occured: {error}'), ephemeral=True)
 
+############################################################################################################
+################################################# SHUTDOWN #################################################
+############################################################################################################
+
+async def drain(timer: PhaseTimer):
+    """Phases of the graceful shutdown (see `shutdown()`), each timed in `timer`."""
+    music = bot.get_cog('MusicCog')
+
+    # Stop accepting new music work (commands, buttons and messages), and stop background loops
+    with timer.phase('stop_accepting'):
+        if music:
+            music.stop_accepting_work()
+
+    # Wait for in-flight player mutations and event handlers of guild mailboxes
+    with timer.phase('drain_mailboxes'):
+        if music:
+            busy = await music.drain_mailboxes()
+            if busy:
+                logger.warning(f'{busy} guild mailboxes still busy on shutdown.')
+
+    # Flush durable player snapshots and music data
+    with timer.phase('flush'):
+        if music:
+            music.flush_player_snapshots()
+        if getattr(bot, 'data_manager', None):
+            bot.data_manager.flush_music_data()
+
+    # Disconnect from voice channels
+    with timer.phase('disconnect_voice'):
+        if music:
+            logger.info(f'Disconnected from {await music.disconnect_voice()} voice channels.')
+
+    # Reset music messages to default, in rate-limited bulk
+    with timer.phase('reset_messages'):
+        if music:
+            logger.info(f'Reset {await music.reset_music_messages()} music messages to default.')
+
+async def shutdown(reason: str):
+    """
+    Graceful drain-and-shutdown sequence, run once when the bot is asked to stop (eg. SIGTERM from `docker stop`):
+    stop accepting new work, flush pending persistence (music data and player snapshots), disconnect from voice channels,
+    reset music messages to default, and close the bot. A report with per-phase timings is logged.
+
+    NOTE: If the phases take longer than `SHUTDOWN_DEADLINE` seconds, the remaining ones are skipped and the bot is closed.
+    """
+    logger.info(f'Shutdown requested ({reason}), draining...')
+
+    # Drain, within deadline
+    timer = PhaseTimer()
+    try:
+        await asyncio.wait_for(drain(timer), timeout=SHUTDOWN_DEADLINE)
+    except asyncio.TimeoutError:
+        logger.warning(f'Shutdown deadline of {SHUTDOWN_DEADLINE}s reached, closing bot.')
+    except Exception as e:
+        logger.error(f'Failed to drain bot on shutdown: {e}')
+
+    # Close bot (unloads cogs and closes Discord connection)
+    with timer.phase('close'):
+        await bot.close()
+    logger.info(f'Shutdown complete | {timer.report()}')
+
+def request_shutdown(sig: signal.Signals):
+    """Signal handler: starts the graceful shutdown, only once (eg. SIGTERM followed by SIGINT)."""
+    if bot.shutdown_task is None:
+        bot.shutdown_task = bot.task_registry.spawn(shutdown(sig.name), owner='bot', category='shutdown')
+
+async def main():
+    """Run bot instance, with the graceful shutdown on SIGTERM and SIGINT."""
+    bot.shutdown_task = None
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, request_shutdown, sig)
+        except NotImplementedError:
+            pass # Signal handlers are not supported on Windows
+
+    async with bot:
+        await bot.start(os.getenv('TOKEN'))
+
+        # Wait for the graceful shutdown to finish (it closed the bot)
+        if bot.shutdown_task:
+            await bot.shutdown_task
+
 if __name__ == '__main__':
-    """Run bot instance"""
     try:
-        bot.run(os.getenv('TOKEN'), log_handler=None)
+        asyncio.run(main())
     finally:
         logger.info(f'BOT SHUTDOWN----------------')
\ No newline at end of file